@@ -36,6 +36,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_extensions',
 
     # Third-party
@@ -170,9 +171,12 @@ else:
 # ================================
 # FILE UPLOAD LIMITS
 # ================================
+# Non-file request body held in memory (form fields / JSON)
 DATA_UPLOAD_MAX_MEMORY_SIZE = 20 * 1024 * 1024
 
-FILE_UPLOAD_MAX_MEMORY_SIZE = 20 * 1024 * 1024
+# Uploads above this spool to a temp file instead of RAM; FileSystemStorage
+# then moves the temp file into MEDIA_ROOT rather than copying it.
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", 2621440))  # 2.5 MB
 
 # ================================
 # DEFAULT PK FIELD
@@ -195,6 +199,12 @@ JWT_ACCESS_TOKEN_LIFETIME_MINUTES = int(
 JWT_REFRESH_TOKEN_LIFETIME_DAYS = int(
     os.getenv("JWT_REFRESH_TOKEN_LIFETIME_DAYS", "30")
 )
+# Per-process cache of authenticated users (restapi.utils.jwt_authentication)
+JWT_USER_CACHE_TTL_SECONDS = int(os.getenv("JWT_USER_CACHE_TTL_SECONDS", "30"))
+JWT_USER_CACHE_SIZE = int(os.getenv("JWT_USER_CACHE_SIZE", "1024"))
+# Optional: embed role / clinic / permission bitmap claims in access
+# tokens (costs one version lookup per request, see restapi.utils.permissions)
+JWT_PERMISSION_CLAIMS = os.getenv("JWT_PERMISSION_CLAIMS", "False").lower() in ("true", "1", "yes")
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from restapi.models import Lead
+from restapi.services.lead_service import recompute_lead_last_interaction
+
+
+class Command(BaseCommand):
+    help = "Backfill Lead.last_interaction_at from calls, SMS and sent emails (never moves it backwards)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clinic-id", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="Only fill leads where last_interaction_at is NULL",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+
+        queryset = Lead.objects.order_by("id")
+
+        if options["clinic_id"]:
+            queryset = queryset.filter(clinic_id=options["clinic_id"])
+
+        if options["only_missing"]:
+            queryset = queryset.filter(last_interaction_at__isnull=True)
+
+        lead_ids = queryset.values_list("id", flat=True).iterator(chunk_size=batch_size)
+
+        updated = 0
+        batch = []
+
+        for lead_id in lead_ids:
+            batch.append(lead_id)
+
+            if len(batch) >= batch_size:
+                updated += recompute_lead_last_interaction(batch)
+                batch = []
+
+        if batch:
+            updated += recompute_lead_last_interaction(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. Updated last_interaction_at on {updated} lead(s).")
+        )
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+
+from restapi.models import Lead
+from restapi.utils.phone import to_e164
+
+
+class Command(BaseCommand):
+    help = "Backfill Lead.contact_no_e164 / contact_phone_e164 from the raw phone columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clinic-id", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+
+        queryset = Lead.objects.order_by("id").only(
+            "id", "contact_no", "contact_phone", "contact_no_e164", "contact_phone_e164"
+        )
+
+        if options["clinic_id"]:
+            queryset = queryset.filter(clinic_id=options["clinic_id"])
+
+        updated = 0
+        batch = []
+
+        for lead in queryset.iterator(chunk_size=batch_size):
+            contact_no_e164 = to_e164(lead.contact_no)
+            contact_phone_e164 = to_e164(lead.contact_phone)
+
+            if (
+                lead.contact_no_e164 == contact_no_e164
+                and lead.contact_phone_e164 == contact_phone_e164
+            ):
+                continue
+
+            lead.contact_no_e164 = contact_no_e164
+            lead.contact_phone_e164 = contact_phone_e164
+            batch.append(lead)
+
+            if len(batch) >= batch_size:
+                Lead.objects.bulk_update(batch, ["contact_no_e164", "contact_phone_e164"])
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            Lead.objects.bulk_update(batch, ["contact_no_e164", "contact_phone_e164"])
+            updated += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. Normalized phone numbers on {updated} lead(s).")
+        )
@@ -0,0 +1,110 @@
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from restapi.models import RolePermission
+from restapi.utils.permissions import (
+    PERMISSION_ACTIONS,
+    _compile_permission_matrix,
+    normalize_role_name,
+)
+
+
+def _legacy_label_check(permissions, action, labels):
+    """
+    The per-call row walk has_action_permission_for_labels used before
+    the compiled label index, kept here as the benchmark baseline.
+    """
+    normalized_labels = set()
+
+    for label in labels or []:
+        normalized = normalize_role_name(label)
+        if not normalized or normalized == "_":
+            continue
+
+        normalized_labels.add(normalized)
+
+        if normalized.endswith("s"):
+            normalized_labels.add(normalized[:-1])
+        else:
+            normalized_labels.add(f"{normalized}s")
+
+    for perm in permissions:
+        if not getattr(perm, f"can_{action}", False):
+            continue
+
+        keys = {
+            normalize_role_name(perm.module_key),
+            normalize_role_name(perm.category_key),
+            normalize_role_name(perm.subcategory_key),
+        }
+        keys.discard("")
+        keys.discard("_")
+
+        if keys & normalized_labels:
+            return True
+
+    return False
+
+
+def _indexed_label_check(matrix, action, labels):
+    granted = matrix["labels"][action]
+    return any(normalize_role_name(label) in granted for label in labels or [])
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark label permission checks: row walk vs compiled label index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=250, help="Permission rows per role")
+        parser.add_argument("--number", type=int, default=2000, help="Checks per timing run")
+
+    def handle(self, *args, **options):
+        rows = max(1, options["rows"])
+        number = max(1, options["number"])
+
+        # Unsaved rows: this measures the check itself, not the database
+        permissions = [
+            RolePermission(
+                module_key=f"module_{index // 25}",
+                category_key=f"category-{index}",
+                subcategory_key=f"sub_{index}" if index % 3 else None,
+                can_view=True,
+                can_add=index % 2 == 0,
+            )
+            for index in range(rows)
+        ]
+        matrix = _compile_permission_matrix(permissions)
+
+        cases = (
+            ("hit (first row)", ["module 0"]),
+            ("hit (last row)", [f"category {rows - 1}"]),
+            ("miss (leads hub)", ["leads hub"]),
+        )
+
+        self.stdout.write(f"{rows} permission rows, {number} checks per case\n")
+
+        for label, labels in cases:
+            for action in PERMISSION_ACTIONS:
+                if _legacy_label_check(permissions, action, labels) != _indexed_label_check(
+                    matrix, action, labels
+                ):
+                    raise CommandError(f"Label index disagrees with row walk for {labels} / {action}")
+
+            legacy = timeit.timeit(
+                lambda: _legacy_label_check(permissions, "add", labels), number=number
+            )
+            indexed = timeit.timeit(
+                lambda: _indexed_label_check(matrix, "add", labels), number=number
+            )
+
+            self.stdout.write(
+                f"{label:<20} row walk {legacy / number * 1e6:9.2f} us   "
+                f"label index {indexed / number * 1e6:7.2f} us   "
+                f"x{legacy / indexed:,.0f}"
+            )
+
+        compile_time = timeit.timeit(lambda: _compile_permission_matrix(permissions), number=10)
+        self.stdout.write(
+            f"\nOne-off compile (cached per user/version): {compile_time / 10 * 1e3:.2f} ms"
+        )
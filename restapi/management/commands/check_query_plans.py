@@ -0,0 +1,170 @@
+import json
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+from restapi.models import Clinic, Department, Lead
+
+
+# =====================================================
+# CANONICAL QUERIES
+# Each builder gets (clinic, owner_id) and returns the
+# queryset the app actually runs on that hot path.
+# =====================================================
+def _lead_list(clinic, owner_id):
+    return Lead.objects.filter(clinic=clinic, is_deleted=False).order_by("-created_at")[:25]
+
+
+def _lead_visibility(clinic, owner_id):
+    return Lead.objects.filter(clinic=clinic, is_deleted=False).filter(
+        Q(created_by_id__in=[owner_id])
+        | Q(personal_id__in=[owner_id])
+        | Q(assigned_to_id__in=[owner_id])
+    ).order_by("-created_at")[:25]
+
+
+def _owner_sync(column):
+    # signals.py renames: UPDATE ... WHERE <owner> = %s
+    return lambda clinic, owner_id: Lead.objects.filter(**{column: owner_id})
+
+
+def _referral_report(clinic, owner_id):
+    return Lead.objects.filter(clinic=clinic, is_deleted=False).values(
+        "referral_department_id"
+    ).annotate(total=Count("referral_source_id", distinct=True))
+
+
+def _stage_report(clinic, owner_id):
+    return Lead.objects.filter(clinic=clinic, is_deleted=False).values(
+        "stage_id"
+    ).annotate(total=Count("id"))
+
+
+QUERY_PLAN_CHECKS = (
+    ("lead list", _lead_list),
+    ("lead visibility scope", _lead_visibility),
+    ("name sync: created_by_id", _owner_sync("created_by_id")),
+    ("name sync: personal_id", _owner_sync("personal_id")),
+    ("name sync: assigned_to_id", _owner_sync("assigned_to_id")),
+    ("name sync: updated_by_id", _owner_sync("updated_by_id")),
+    ("referral report", _referral_report),
+    ("stage report", _stage_report),
+)
+
+
+def _seq_scans(plan):
+    """Relations read by a Seq Scan anywhere in an EXPLAIN (FORMAT JSON) plan."""
+    found = []
+
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+
+    return found
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the lead hot-path queries and fail if any falls back to a seq scan"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clinic-id",
+            type=int,
+            default=None,
+            help="Clinic to plan against (default: a seeded throwaway clinic)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=5000,
+            help="Leads to seed (rolled back afterwards) when no --clinic-id is given",
+        )
+        parser.add_argument(
+            "--real-costs",
+            action="store_true",
+            help="Keep enable_seqscan on; small tables may then legitimately seq scan",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("check_query_plans needs PostgreSQL")
+
+        failures = []
+
+        # Seed rows, settings and all — nothing here outlives the command
+        try:
+            with transaction.atomic():
+                clinic, owner_id = self._prepare(options)
+
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE restapi_lead")
+
+                    if not options["real_costs"]:
+                        # Seq scans then only show where no index can serve
+                        cursor.execute("SET LOCAL enable_seqscan = off")
+
+                for label, build in QUERY_PLAN_CHECKS:
+                    plan = json.loads(build(clinic, owner_id).explain(format="json"))[0]["Plan"]
+                    scans = _seq_scans(plan)
+
+                    if scans:
+                        failures.append(label)
+                        self.stdout.write(self.style.ERROR(f"SEQ SCAN  {label}: {', '.join(scans)}"))
+                    else:
+                        self.stdout.write(f"ok        {label}")
+
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f"{len(failures)} query plan(s) fall back to a seq scan")
+
+        self.stdout.write(self.style.SUCCESS("Done. Every checked query uses an index."))
+
+    def _prepare(self, options):
+        if options["clinic_id"]:
+            clinic = Clinic.objects.filter(id=options["clinic_id"]).first()
+            if not clinic:
+                raise CommandError(f"Clinic {options['clinic_id']} not found")
+
+            owner_id = (
+                Lead.objects.filter(clinic=clinic)
+                .exclude(assigned_to_id__isnull=True)
+                .values_list("assigned_to_id", flat=True)
+                .first()
+            ) or 0
+
+            return clinic, owner_id
+
+        clinic = Clinic.objects.create(name=f"query-plan-check-{uuid.uuid4().hex[:8]}")
+        department = Department.objects.create(name="Query plan check", clinic=clinic)
+        seed = max(1, options["seed"])
+
+        Lead.objects.bulk_create(
+            [
+                Lead(
+                    clinic=clinic,
+                    department=department,
+                    full_name=f"Seed lead {index}",
+                    source="Direct",
+                    created_by_id=index % 50,
+                    personal_id=index % 50,
+                    assigned_to_id=index % 50,
+                    updated_by_id=index % 50,
+                    is_deleted=index % 20 == 0,
+                )
+                for index in range(seed)
+            ],
+            batch_size=1000,
+        )
+
+        return clinic, 1
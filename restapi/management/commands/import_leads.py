@@ -0,0 +1,65 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from restapi.models import Clinic
+from restapi.services.lead_import_service import (
+    LEAD_IMPORT_BATCH_SIZE,
+    import_leads,
+    iter_import_rows,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import leads for a clinic from a CSV or XLSX file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the .csv or .xlsx file")
+        parser.add_argument("--clinic-id", type=int, required=True)
+        parser.add_argument(
+            "--department-id",
+            type=int,
+            default=None,
+            help="Department for rows without a department column",
+        )
+        parser.add_argument("--batch-size", type=int, default=LEAD_IMPORT_BATCH_SIZE)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        clinic = Clinic.objects.filter(id=options["clinic_id"]).first()
+        if not clinic:
+            raise CommandError(f"Clinic {options['clinic_id']} not found")
+
+        path = options["path"]
+
+        try:
+            with open(path, "rb") as file_obj:
+                result = import_leads(
+                    iter_import_rows(file_obj, path),
+                    clinic,
+                    default_department_id=options["department_id"],
+                    batch_size=options["batch_size"],
+                    dry_run=options["dry_run"],
+                    source_name=path,
+                )
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except ValidationError as exc:
+            raise CommandError(json.dumps(exc.detail, default=str))
+
+        for error in result["errors"]:
+            self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'], default=str)}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done. {result['total']} row(s): {result['created']} created "
+                f"({result['attached']} attached to duplicates), {result['merged']} merged, "
+                f"{result['valid']} valid, {result['failed']} failed"
+                + (" (dry run)" if options["dry_run"] else "")
+            )
+        )
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from restapi.models import Lead
+from restapi.services.lead_merge_service import iter_duplicate_groups, merge_leads
+
+
+class Command(BaseCommand):
+    help = "Merge existing leads that share a normalized phone or email within a clinic"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clinic-id", type=int, default=None)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Duplicate groups merged per transaction",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the groups that would be merged",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        dry_run = options["dry_run"]
+
+        queryset = Lead.objects.all()
+
+        if options["clinic_id"]:
+            queryset = queryset.filter(clinic_id=options["clinic_id"])
+
+        groups = 0
+        merged = 0
+        batch = []
+
+        def flush(batch):
+            leads = Lead.objects.in_bulk([lead_id for ids in batch for lead_id in ids])
+
+            with transaction.atomic():
+                return sum(
+                    merge_leads(leads[ids[0]], [leads[lead_id] for lead_id in ids[1:]])
+                    for ids in batch
+                )
+
+        for ids in iter_duplicate_groups(queryset):
+            groups += 1
+
+            if dry_run:
+                merged += len(ids) - 1
+                self.stdout.write(f"{ids[0]} <- {', '.join(str(lead_id) for lead_id in ids[1:])}")
+                continue
+
+            batch.append(ids)
+
+            if len(batch) >= batch_size:
+                merged += flush(batch)
+                batch = []
+
+        if batch:
+            merged += flush(batch)
+
+        verb = "Would merge" if dry_run else "Merged"
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. {verb} {merged} duplicate lead(s) across {groups} group(s).")
+        )
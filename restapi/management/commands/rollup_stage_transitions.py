@@ -0,0 +1,36 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from restapi.services.stage_analytics_service import rollup_stage_transitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild daily lead stage transition rollups used by the stage "
+        "analytics endpoint. Defaults to yesterday and today; schedule it "
+        "at least daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", default=None, help="Last day to roll up (YYYY-MM-DD, default today)")
+        parser.add_argument("--days", type=int, default=2, help="Number of days ending at --date")
+        parser.add_argument("--pipeline-id", default=None)
+
+    def handle(self, *args, **options):
+        try:
+            last_day = date.fromisoformat(options["date"]) if options["date"] else timezone.localdate()
+        except ValueError:
+            raise CommandError("--date must be YYYY-MM-DD")
+
+        days = max(1, options["days"])
+        groups = 0
+
+        for offset in range(days - 1, -1, -1):
+            day = last_day - timedelta(days=offset)
+            groups += rollup_stage_transitions(day, pipeline_id=options["pipeline_id"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. Wrote {groups} rollup row(s) for {days} day(s).")
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0081_leadcustomfieldvalue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='last_interaction_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+from django.db.models import F
+
+
+def fill_last_interaction_at(apps, schema_editor):
+    # Cheap baseline so keyset ordering on the column never meets NULLs;
+    # `manage.py backfill_last_interaction` refines it from calls/SMS/emails.
+    Lead = apps.get_model("restapi", "Lead")
+    Lead.objects.filter(last_interaction_at__isnull=True).update(
+        last_interaction_at=F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restapi", "0082_lead_last_interaction_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_last_interaction_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:46
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def fill_custom_fields(apps, schema_editor):
+    Lead = apps.get_model("restapi", "Lead")
+    LeadCustomFieldValue = apps.get_model("restapi", "LeadCustomFieldValue")
+
+    rows = (
+        LeadCustomFieldValue.objects.exclude(value="")
+        .order_by("lead_id")
+        .values_list("lead_id", "field__field_key", "value")
+        .iterator(chunk_size=2000)
+    )
+
+    current_lead_id = None
+    custom_fields = {}
+
+    for lead_id, field_key, value in rows:
+        if lead_id != current_lead_id:
+            if current_lead_id is not None:
+                Lead.objects.filter(pk=current_lead_id).update(custom_fields=custom_fields)
+            current_lead_id = lead_id
+            custom_fields = {}
+
+        custom_fields[field_key] = value
+
+    if current_lead_id is not None:
+        Lead.objects.filter(pk=current_lead_id).update(custom_fields=custom_fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0083_fill_lead_last_interaction_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='custom_fields',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(fill_custom_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['custom_fields'], name='lead_custom_fields_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:48
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+LEAD_SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('simple', coalesce({row}.full_name, '') || ' ' || coalesce({row}.contact_full_name, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce({row}.email, '') || ' ' || coalesce({row}.contact_no, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce({row}.location, '')), 'C')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION restapi_lead_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {LEAD_SEARCH_VECTOR_SQL.format(row="NEW")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER restapi_lead_search_vector_update
+BEFORE INSERT OR UPDATE OF full_name, contact_full_name, email, contact_no, location, search_vector
+ON restapi_lead
+FOR EACH ROW EXECUTE FUNCTION restapi_lead_search_vector_update();
+
+UPDATE restapi_lead SET search_vector = {LEAD_SEARCH_VECTOR_SQL.format(row="restapi_lead")};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS restapi_lead_search_vector_update ON restapi_lead;
+DROP FUNCTION IF EXISTS restapi_lead_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0084_lead_custom_fields'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='lead',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='lead_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='lead_full_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['contact_no'], name='lead_contact_no_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['contact_phone'], name='lead_contact_phone_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0085_lead_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='contact_no_e164',
+            field=models.CharField(blank=True, editable=False, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='contact_phone_e164',
+            field=models.CharField(blank=True, editable=False, max_length=16, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['contact_no_e164', 'clinic'], name='lead_contact_no_e164_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['contact_phone_e164', 'clinic'], name='lead_contact_phone_e164_idx'),
+        ),
+    ]
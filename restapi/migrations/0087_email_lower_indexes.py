@@ -0,0 +1,24 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:51
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0086_lead_phone_e164'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(django.db.models.functions.text.Lower('email'), models.F('clinic'), name='lead_email_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='referralsource',
+            index=models.Index(django.db.models.functions.text.Lower('email'), models.F('clinic'), name='referral_src_email_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:04
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0087_email_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadStageDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('transitions', models.PositiveIntegerField(default=0)),
+                ('total_seconds', models.BigIntegerField(default=0)),
+                ('duration_histogram', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'restapi_lead_stage_daily_rollup',
+            },
+        ),
+        migrations.CreateModel(
+            name='LeadStageTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('actor_id', models.IntegerField(blank=True, null=True)),
+                ('actor_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'restapi_lead_stage_transition',
+                'ordering': ['at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='leadstagedailyrollup',
+            name='from_stage',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='restapi.pipelinestage'),
+        ),
+        migrations.AddField(
+            model_name='leadstagedailyrollup',
+            name='pipeline',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_daily_rollups', to='restapi.pipeline'),
+        ),
+        migrations.AddField(
+            model_name='leadstagedailyrollup',
+            name='to_stage',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='restapi.pipelinestage'),
+        ),
+        migrations.AddField(
+            model_name='leadstagetransition',
+            name='from_stage',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='restapi.pipelinestage'),
+        ),
+        migrations.AddField(
+            model_name='leadstagetransition',
+            name='lead',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_transitions', to='restapi.lead'),
+        ),
+        migrations.AddField(
+            model_name='leadstagetransition',
+            name='pipeline',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lead_stage_transitions', to='restapi.pipeline'),
+        ),
+        migrations.AddField(
+            model_name='leadstagetransition',
+            name='to_stage',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='restapi.pipelinestage'),
+        ),
+        migrations.AddIndex(
+            model_name='leadstagedailyrollup',
+            index=models.Index(fields=['pipeline', 'day'], name='lead_stage_rollup_day_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadstagetransition',
+            index=models.Index(fields=['lead', 'at'], name='lead_stage_tr_lead_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadstagetransition',
+            index=models.Index(fields=['pipeline', 'at'], name='lead_stage_tr_pipeline_at_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0088_lead_stage_transitions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['clinic', 'modified_at', 'id'], name='lead_clinic_modified_idx'),
+        ),
+    ]
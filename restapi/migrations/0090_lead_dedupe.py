@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0089_lead_clinic_modified_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clinic',
+            name='lead_dedupe_match_name',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='clinic',
+            name='lead_dedupe_policy',
+            field=models.CharField(choices=[('off', 'Off'), ('attach', 'Attach'), ('merge', 'Merge'), ('reject', 'Reject')], default='attach', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='restapi.lead'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0090_lead_dedupe'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['clinic', '-created_at'], name='lead_clinic_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['created_by_id', 'clinic'], name='lead_created_by_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['personal_id', 'clinic'], name='lead_personal_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['assigned_to_id', 'clinic'], name='lead_assigned_to_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['updated_by_id'], name='lead_updated_by_idx'),
+        ),
+    ]
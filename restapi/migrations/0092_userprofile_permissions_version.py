@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0091_lead_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='permissions_version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0092_userprofile_permissions_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Lower('email'), name='gin_trgm_ops'), name='lead_email_lower_trgm'),
+        ),
+    ]
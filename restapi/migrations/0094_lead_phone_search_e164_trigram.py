@@ -0,0 +1,30 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:43
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restapi', '0093_lead_email_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_contact_no_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_contact_phone_trgm',
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['contact_no_e164'], name='lead_contact_no_e164_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['contact_phone_e164'], name='lead_contact_phone_e164_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -66,3 +66,5 @@ from .interest import Interest
 from .whatsapp import WhatsAppMessage   # ✅ FIXED: removed deleted WhatsAppTemplate
 
 from .pipeline_stage_audit_log import PipelineStageAuditLog
+
+from .lead_stage_transition import LeadStageTransition, LeadStageDailyRollup
@@ -2,9 +2,24 @@ from django.db import models
 
 
 class Clinic(models.Model):
+
+    class LeadDedupePolicy(models.TextChoices):
+        OFF = "off", "Off"
+        ATTACH = "attach", "Attach"    # create, linked to the original lead
+        MERGE = "merge", "Merge"       # fill the original lead, create nothing
+        REJECT = "reject", "Reject"    # refuse the new lead
+
     name = models.CharField(max_length=200)
     email = models.EmailField(default="lmsivf@gmail.com")  # ✅ added
     is_active = models.BooleanField(default=True)  # ✅ new column
 
+    # Duplicate handling at lead ingest (phone / email, optionally name)
+    lead_dedupe_policy = models.CharField(
+        max_length=10,
+        choices=LeadDedupePolicy.choices,
+        default=LeadDedupePolicy.ATTACH,
+    )
+    lead_dedupe_match_name = models.BooleanField(default=False)
+
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
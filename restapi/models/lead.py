@@ -1,10 +1,16 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
+from restapi.utils.phone import to_e164
+
 from .clinic import Clinic
 from .department import Department
 from .campaign import Campaign
+from .lead_stage_transition import LeadStageTransition
 
 
 class LeadChoices:
@@ -241,6 +247,15 @@ class Lead(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    # Latest qualifying call / SMS / sent email (falls back to creation time).
+    # Maintained on write by restapi.signals; backfill with
+    # `manage.py backfill_last_interaction`.
+    last_interaction_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True
+    )
+
     # =============================
     # CONVERSION TIME
     # =============================
@@ -261,9 +276,105 @@ class Lead(models.Model):
         blank=True
     )
 
+    # =============================
+    # CUSTOM FIELDS (DENORMALIZED)
+    # =============================
+    # field_key -> value mirror of LeadCustomFieldValue, kept in sync by
+    # lead_service._save_custom_field_values so `cf.<key>=` filters are a
+    # single GIN-indexed containment lookup instead of a join per key.
+    custom_fields = models.JSONField(default=dict, blank=True)
+
+    # =============================
+    # NORMALIZED PHONES (E.164)
+    # =============================
+    # Derived from contact_no / contact_phone in save() so inbound
+    # calls and messages resolve the caller with an indexed exact
+    # match instead of an `endswith` scan over every lead.
+    contact_no_e164 = models.CharField(max_length=16, null=True, blank=True, editable=False)
+    contact_phone_e164 = models.CharField(max_length=16, null=True, blank=True, editable=False)
+
+    # =============================
+    # DUPLICATES
+    # =============================
+    # Set when a lead is ingested under the clinic's "attach" dedupe
+    # policy, or folded into another lead by merge_duplicate_leads.
+    duplicate_of = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="duplicates"
+    )
+
+    # =============================
+    # SEARCH
+    # =============================
+    # Weighted tsvector over full_name/contact_full_name (A),
+    # email/contact_no (B) and location (C). Maintained by the
+    # `restapi_lead_search_vector_update` trigger (migration 0085),
+    # so it stays correct for queryset.update() and bulk_create too.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         db_table = "restapi_lead"
         ordering = ["-created_at"]
+        indexes = [
+            GinIndex(
+                fields=["custom_fields"],
+                name="lead_custom_fields_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+            GinIndex(fields=["search_vector"], name="lead_search_vector_gin"),
+            GinIndex(
+                fields=["full_name"],
+                name="lead_full_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["contact_no_e164"],
+                name="lead_contact_no_e164_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["contact_phone_e164"],
+                name="lead_contact_phone_e164_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # Leading phone column serves both the global caller lookup
+            # and the clinic-scoped one.
+            models.Index(
+                fields=["contact_no_e164", "clinic"],
+                name="lead_contact_no_e164_idx",
+            ),
+            models.Index(
+                fields=["contact_phone_e164", "clinic"],
+                name="lead_contact_phone_e164_idx",
+            ),
+            # Case-insensitive email lookups (inbound mail, dedupe)
+            models.Index(Lower("email"), "clinic", name="lead_email_lower_idx"),
+            # Partial / domain email search (LIKE on lower(email))
+            GinIndex(
+                OpClass(Lower("email"), name="gin_trgm_ops"),
+                name="lead_email_lower_trgm",
+            ),
+            # Delta sync: keyset scan of one clinic's changes
+            models.Index(
+                fields=["clinic", "modified_at", "id"],
+                name="lead_clinic_modified_idx",
+            ),
+            # Every list / board / export: one clinic's live leads, newest first
+            models.Index(
+                fields=["clinic", "-created_at"],
+                name="lead_clinic_live_created_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+            # Visibility scope ORs these (BitmapOr); the name sync in
+            # signals.py updates by the owner column alone.
+            models.Index(fields=["created_by_id", "clinic"], name="lead_created_by_idx"),
+            models.Index(fields=["personal_id", "clinic"], name="lead_personal_idx"),
+            models.Index(fields=["assigned_to_id", "clinic"], name="lead_assigned_to_idx"),
+            models.Index(fields=["updated_by_id"], name="lead_updated_by_idx"),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.lead_status})"
@@ -283,6 +394,26 @@ class Lead(models.Model):
         if self.stage and not self.lead_status:
             self.lead_status = self.stage.stage_name
 
+        if is_create and not self.last_interaction_at:
+            self.last_interaction_at = timezone.now()
+
+        # =====================================================
+        # NORMALIZED PHONE LOOKUP COLUMNS
+        # =====================================================
+        self.contact_no_e164 = to_e164(self.contact_no)
+        self.contact_phone_e164 = to_e164(self.contact_phone)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if "contact_no" in update_fields:
+                update_fields.add("contact_no_e164")
+            if "contact_phone" in update_fields:
+                update_fields.add("contact_phone_e164")
+            # auto_now is only written when listed; delta sync relies on it
+            update_fields.add("modified_at")
+            kwargs["update_fields"] = update_fields
+
         # =====================================================
         # AUTO CONVERSION TRACKING
         # =====================================================
@@ -300,4 +431,20 @@ class Lead(models.Model):
                 if not self.converted_at_stage:
                     self.converted_at_stage = old_stage
 
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+
+        # =====================================================
+        # STAGE HISTORY (append-only)
+        # =====================================================
+        old_stage_id = old_stage.id if old_stage else None
+        stage_saved = update_fields is None or "stage" in update_fields
+
+        if stage_saved and self.stage_id and self.stage_id != old_stage_id:
+            LeadStageTransition.objects.create(
+                lead=self,
+                pipeline_id=self.stage.pipeline_id,
+                from_stage_id=old_stage_id,
+                to_stage_id=self.stage_id,
+                actor_id=self.created_by_id if is_create else self.updated_by_id,
+                actor_name=self.created_by_name if is_create else self.updated_by_name,
+            )
\ No newline at end of file
@@ -0,0 +1,110 @@
+from django.db import models
+from django.utils import timezone
+
+
+class LeadStageTransition(models.Model):
+    """
+    Append-only history of lead stage moves.
+
+    from_stage is NULL when a lead is created straight into a stage.
+    Rows are never updated; LeadStageDailyRollup aggregates them.
+    """
+
+    lead = models.ForeignKey(
+        "Lead",
+        on_delete=models.CASCADE,
+        related_name="stage_transitions"
+    )
+
+    # Denormalized from to_stage so analytics never join restapi_lead
+    pipeline = models.ForeignKey(
+        "Pipeline",
+        on_delete=models.CASCADE,
+        related_name="lead_stage_transitions"
+    )
+
+    from_stage = models.ForeignKey(
+        "PipelineStage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    to_stage = models.ForeignKey(
+        "PipelineStage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    # Same convention as Lead.updated_by_id / updated_by_name
+    actor_id = models.IntegerField(null=True, blank=True)
+    actor_name = models.CharField(max_length=255, null=True, blank=True)
+
+    at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "restapi_lead_stage_transition"
+        ordering = ["at"]
+        indexes = [
+            # Per-lead history and "previous move" lookups
+            models.Index(fields=["lead", "at"], name="lead_stage_tr_lead_at_idx"),
+            # Daily rollups scan one pipeline-day at a time
+            models.Index(fields=["pipeline", "at"], name="lead_stage_tr_pipeline_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.lead_id}: {self.from_stage_id} -> {self.to_stage_id}"
+
+
+class LeadStageDailyRollup(models.Model):
+    """
+    One row per (pipeline, day, from_stage, to_stage), rebuilt by the
+    rollup_stage_transitions command. The stage analytics endpoint
+    reads only this table, so it stays fast as history grows.
+    """
+
+    pipeline = models.ForeignKey(
+        "Pipeline",
+        on_delete=models.CASCADE,
+        related_name="stage_daily_rollups"
+    )
+
+    day = models.DateField()
+
+    from_stage = models.ForeignKey(
+        "PipelineStage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    to_stage = models.ForeignKey(
+        "PipelineStage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    transitions = models.PositiveIntegerField(default=0)
+
+    # Time spent in from_stage by the leads that left it that day;
+    # histogram counts follow STAGE_DURATION_BUCKETS in
+    # stage_analytics_service.
+    total_seconds = models.BigIntegerField(default=0)
+    duration_histogram = models.JSONField(default=list, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "restapi_lead_stage_daily_rollup"
+        indexes = [
+            models.Index(fields=["pipeline", "day"], name="lead_stage_rollup_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.pipeline_id} {self.day}: {self.from_stage_id} -> {self.to_stage_id}"
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import User
 from restapi.models.clinic import Clinic
 from restapi.models.external_clinic import ExternalClinic   
@@ -45,5 +46,10 @@ class ReferralSource(models.Model):
         db_table = "restapi_referral_source"
         ordering = ["name"]
 
+        # ✅ Case-insensitive email dedupe per clinic
+        indexes = [
+            models.Index(Lower("email"), "clinic", name="referral_src_email_lower_idx"),
+        ]
+
     def __str__(self):
         return self.name
\ No newline at end of file
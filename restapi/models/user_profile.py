@@ -60,6 +60,10 @@ class UserProfile(models.Model):
 
     is_active = models.BooleanField(default=True)
 
+    # Bumped on any role / permission change; keys the cached
+    # permission matrix (restapi.utils.permissions)
+    permissions_version = models.PositiveIntegerField(default=1)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1,6 +1,166 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
 
 class StandardResultsPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+
+
+# =====================================================
+# KEYSET (CURSOR) PAGINATION
+# =====================================================
+class KeysetCursorPagination:
+    """
+    Keyset pagination over a fixed, unique ordering
+    (default ``-created_at, -id``).
+
+    Unlike offset pagination, every page is a single indexed range
+    scan: page N costs the same as page 1. Cursors are opaque
+    base64 tokens carrying the boundary row's key and direction.
+    Ordering columns must be non-null.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 25
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+
+    def __init__(self, ordering=None, page_size=None):
+        if ordering:
+            self.ordering = tuple(ordering)
+        if page_size:
+            self.page_size = page_size
+
+        self.next_cursor = None
+        self.prev_cursor = None
+        self.current_page_size = self.page_size
+
+    @property
+    def ordering_fields(self):
+        return tuple(field.lstrip("-") for field in self.ordering)
+
+    # -------------------------------------------------
+    # CURSOR ENCODING
+    # -------------------------------------------------
+    def encode_cursor(self, obj, reverse=False):
+        values = []
+        for field in self.ordering_fields:
+            value = getattr(obj, field)
+            values.append(value.isoformat() if hasattr(value, "isoformat") else str(value))
+
+        payload = json.dumps({"k": values, "r": int(bool(reverse))}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, token, model):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            raw_values = payload["k"]
+            reverse = bool(payload.get("r"))
+
+            if len(raw_values) != len(self.ordering_fields):
+                raise ValueError("cursor length mismatch")
+
+            values = [
+                model._meta.get_field(field).to_python(raw)
+                for field, raw in zip(self.ordering_fields, raw_values)
+            ]
+        except Exception:
+            raise ValidationError({"cursor": "Invalid cursor"})
+
+        return values, reverse
+
+    # -------------------------------------------------
+    # HELPERS
+    # -------------------------------------------------
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+
+        if not raw:
+            return self.page_size
+
+        try:
+            size = int(raw)
+        except (TypeError, ValueError):
+            raise ValidationError({self.page_size_query_param: "Must be an integer"})
+
+        return max(1, min(size, self.max_page_size))
+
+    def _after(self, values, reverse):
+        """
+        Lexicographic row comparison expressed as OR-ed Q objects:
+        (a, b) > (x, y)  ==  a > x OR (a = x AND b > y)
+        with each column's direction taken from ``ordering``.
+        """
+        condition = Q()
+
+        for index, term in enumerate(self.ordering):
+            descending = term.startswith("-")
+            lookup = "lt" if descending != reverse else "gt"
+            field = self.ordering_fields[index]
+
+            branch = Q(**{f"{field}__{lookup}": values[index]})
+            for prev_field, prev_value in zip(self.ordering_fields[:index], values[:index]):
+                branch &= Q(**{prev_field: prev_value})
+            condition |= branch
+
+        return condition
+
+    def _reversed_ordering(self):
+        return [
+            term[1:] if term.startswith("-") else f"-{term}"
+            for term in self.ordering
+        ]
+
+    # -------------------------------------------------
+    # PUBLIC API (mirrors DRF BasePagination)
+    # -------------------------------------------------
+    def paginate_queryset(self, queryset, request, view=None):
+        self.current_page_size = self.get_page_size(request)
+        token = request.query_params.get(self.cursor_query_param)
+
+        reverse = False
+        values = None
+
+        if token:
+            values, reverse = self.decode_cursor(token, queryset.model)
+            queryset = queryset.filter(self._after(values, reverse))
+
+        ordering = self._reversed_ordering() if reverse else list(self.ordering)
+
+        rows = list(queryset.order_by(*ordering)[: self.current_page_size + 1])
+        has_more = len(rows) > self.current_page_size
+        rows = rows[: self.current_page_size]
+
+        if reverse:
+            rows.reverse()
+
+        self.next_cursor = None
+        self.prev_cursor = None
+
+        if rows:
+            # Moving forward: more rows exist past the end if we over-fetched,
+            # or if we came here by paging backwards.
+            if (not reverse and has_more) or reverse:
+                self.next_cursor = self.encode_cursor(rows[-1])
+
+            # Moving backward: only possible once we have left the first page.
+            if (reverse and has_more) or (not reverse and values is not None):
+                self.prev_cursor = self.encode_cursor(rows[0], reverse=True)
+
+        return rows
+
+    def get_paginated_response(self, data, **extra):
+        return Response({
+            "next": self.next_cursor,
+            "prev": self.prev_cursor,
+            "page_size": self.current_page_size,
+            **extra,
+            "results": data,
+        })
@@ -1,12 +1,14 @@
 from restapi.utils.permissions import get_user_permissions, has_permission
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from django.db.models import Prefetch
 
 from restapi.models import (
     Campaign,
     CampaignSocialMediaConfig,
     CampaignEmailConfig,
 )
+from restapi.serializers.sparse_fieldsets import SparseFieldsetMixin
 
 from restapi.services.campaign_service import (
     create_campaign,
@@ -96,10 +98,27 @@ class CampaignEmailSerializer(serializers.ModelSerializer):
 #         return {k: v for k, v in data.items() if k in allowed_fields}
 
 
+def active_email_configs_prefetch():
+    return Prefetch(
+        "email_configs",
+        CampaignEmailConfig.objects.filter(is_active=True)
+    )
+
+
 # =====================================================
 # Campaign READ Serializer
 # =====================================================
-class CampaignReadSerializer(serializers.ModelSerializer):
+class CampaignReadSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+
+    # =====================================================
+    # ✅ OPTIMIZATION: ?fields= only loads the relations
+    #    the requested fields render
+    # =====================================================
+    sparse_prefetch_related = {
+        "social_media": ("social_configs",),
+        "email": (active_email_configs_prefetch,),
+        "social_posts": ("social_posts",),
+    }
 
     social_media = CampaignSocialMediaSerializer(
         source="social_configs",
@@ -124,9 +143,15 @@ class CampaignReadSerializer(serializers.ModelSerializer):
         # =====================================================
         # ✅ OPTIMIZATION: social_posts should already be
         #    prefetched from the view, so this accesses
-        #    in-memory data without additional DB queries
+        #    in-memory data without additional DB queries.
+        #    Sorted in Python: .order_by() would bypass the
+        #    prefetch cache and query once per campaign.
         # =====================================================
-        posts = obj.social_posts.all().order_by("-created_at")
+        posts = sorted(
+            obj.social_posts.all(),
+            key=lambda post: post.created_at,
+            reverse=True
+        )
 
         return CampaignSocialPostReadSerializer(
             posts,
@@ -19,7 +19,14 @@ from restapi.models import (
     LeadCustomFieldValue,
 )
 
-from restapi.services.lead_service import create_lead, update_lead
+from restapi.services.lead_service import (
+    create_lead,
+    update_lead,
+    lead_quality_for,
+    active_custom_field_values_prefetch,
+    get_active_custom_field_values,
+)
+from restapi.serializers.sparse_fieldsets import SparseFieldsetMixin
 from django.utils import timezone
 
 
@@ -77,15 +84,16 @@ class MultiFileField(serializers.ListField):
 # =====================================================
 # READ SERIALIZER
 # =====================================================
-class LeadReadSerializer(serializers.ModelSerializer):
+class LeadReadSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
 
-    clinic_id = serializers.IntegerField(source="clinic.id", read_only=True)
+    # *_id fields read the FK column itself, so they never need a join
+    clinic_id = serializers.IntegerField(read_only=True)
     clinic_name = serializers.CharField(source="clinic.name", read_only=True)
 
-    department_id = serializers.IntegerField(source="department.id", read_only=True)
+    department_id = serializers.IntegerField(read_only=True)
     department_name = serializers.CharField(source="department.name", read_only=True)
 
-    campaign_id = serializers.UUIDField(source="campaign.id", read_only=True)
+    campaign_id = serializers.UUIDField(read_only=True)
     campaign_name = serializers.CharField(source="campaign.campaign_name", read_only=True)
 
     updated_by_id = serializers.IntegerField(read_only=True)
@@ -103,21 +111,21 @@ class LeadReadSerializer(serializers.ModelSerializer):
     created_by_name = serializers.CharField(read_only=True)
 
     # REFERRAL
-    referral_department_id = serializers.IntegerField(source="referral_department.id", read_only=True)
+    referral_department_id = serializers.IntegerField(read_only=True)
     referral_department_name = serializers.CharField(source="referral_department.name", read_only=True)
 
-    referral_source_id = serializers.IntegerField(source="referral_source.id", read_only=True)
+    referral_source_id = serializers.IntegerField(read_only=True)
     referral_source_name = serializers.CharField(source="referral_source.name", read_only=True)
 
     referral_source_email = serializers.CharField(source="referral_source.email", read_only=True)
     referral_source_phone = serializers.CharField(source="referral_source.phone", read_only=True)
 
     # 🔥 CONVERSION TRACKING
-    converted_at_stage_id = serializers.UUIDField(source="converted_at_stage.id", read_only=True)
+    converted_at_stage_id = serializers.UUIDField(read_only=True)
     converted_at_stage_name = serializers.CharField(source="converted_at_stage.stage_name", read_only=True)
 
     # STAGE
-    stage_id = serializers.UUIDField(source="stage.id", read_only=True)
+    stage_id = serializers.UUIDField(read_only=True)
     stage_name = serializers.CharField(source="stage.stage_name", read_only=True)
     treatment_interest = serializers.SerializerMethodField()
 
@@ -128,7 +136,28 @@ class LeadReadSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Lead
-        fields = "__all__"
+        # custom_fields mirrors custom_field_values and search_vector is an
+        # index column; both exist for filtering only
+        exclude = ("custom_fields", "search_vector", "contact_no_e164", "contact_phone_e164")
+
+    # Relations each field reads; see SparseFieldsetMixin.prepare_queryset
+    sparse_select_related = {
+        "clinic_name": ("clinic",),
+        "department_name": ("department",),
+        "campaign_name": ("campaign",),
+        "campaign_duration": ("campaign",),
+        "referral_department_name": ("referral_department",),
+        "referral_source_name": ("referral_source",),
+        "referral_source_email": ("referral_source",),
+        "referral_source_phone": ("referral_source",),
+        "converted_at_stage_name": ("converted_at_stage",),
+        "stage_name": ("stage",),
+    }
+    sparse_prefetch_related = {
+        "documents": ("documents",),
+        "treatment_interest": ("treatment_interest",),
+        "custom_field_values": (active_custom_field_values_prefetch,),
+    }
 
     def get_campaign_duration(self, obj):
         campaign = obj.campaign
@@ -164,10 +193,10 @@ class LeadReadSerializer(serializers.ModelSerializer):
         ]
 
     def get_custom_field_values(self, obj):
-        values = getattr(obj, "custom_field_values", None)
-        if values is None:
-            return []
-
+        # =====================================================
+        # ✅ OPTIMIZATION: views prefetch active values in display order
+        #    (active_custom_field_values_prefetch); falls back to one query
+        # =====================================================
         return [
             {
                 "field_key": item.field.field_key,
@@ -175,7 +204,7 @@ class LeadReadSerializer(serializers.ModelSerializer):
                 "field_type": item.field.field_type,
                 "value": item.value,
             }
-            for item in values.select_related("field").filter(field__is_active=True).order_by("field__sort_order", "field__field_label")
+            for item in get_active_custom_field_values(obj)
         ]
 
     # def get_last_interaction_at(self, obj):
@@ -228,30 +257,45 @@ class LeadReadSerializer(serializers.ModelSerializer):
 
     #     return max(valid_dates)
     def get_last_interaction_at(self, obj):
-        return getattr(
-            obj,
-            "last_interaction_at_db",
-            obj.created_at
-        )
+        # Denormalized column maintained on write (see restapi.signals)
+        return obj.last_interaction_at or obj.created_at
 
     def get_quality(self, obj):
+        # Annotated by LeadListAPIView when filtering/sorting by quality
+        quality = getattr(obj, "quality_db", None)
+        if quality:
+            return quality
 
-        last_interaction = self.get_last_interaction_at(obj)
-
-        if not last_interaction:
-            return "Cold"
+        return lead_quality_for(self.get_last_interaction_at(obj))
 
-        diff_days = (
-            timezone.now() - last_interaction
-        ).days
 
-        if diff_days <= 7:
-            return "Hot"
+# =====================================================
+# SEARCH RESULT SERIALIZER (compact, no prefetches)
+# =====================================================
+class LeadSearchResultSerializer(serializers.ModelSerializer):
 
-        if diff_days <= 30:
-            return "Warm"
+    stage_id = serializers.UUIDField(read_only=True)
+    stage_name = serializers.CharField(source="stage.stage_name", read_only=True, default=None)
+    rank = serializers.FloatField(read_only=True)
 
-        return "Cold"
+    class Meta:
+        model = Lead
+        fields = [
+            "id",
+            "full_name",
+            "email",
+            "contact_no",
+            "contact_full_name",
+            "contact_phone",
+            "location",
+            "lead_status",
+            "stage_id",
+            "stage_name",
+            "assigned_to_id",
+            "assigned_to_name",
+            "created_at",
+            "rank",
+        ]
 
 
 # =====================================================
@@ -69,6 +69,68 @@ class StageFieldSerializer(serializers.ModelSerializer):
 # =====================================================
 # Pipeline Stage READ
 # =====================================================
+# Always rendered, whatever the caller may see
+PIPELINE_STAGE_BASE_FIELDS = (
+    "id",
+    "stage_name",
+    "stage_type",
+    "stage_status",
+    "stage_order",
+    "color_code",
+    "entry_rule",
+
+    # ✅ REQUIRED FOR LEAD CONVERSION
+    "is_conversion_stage",
+    "is_default_stage",
+)
+
+PIPELINE_STAGE_FULL_ACCESS_ROLES = {"super admin", "superadmin", "admin", "clinic admin"}
+
+# Stage visibility levels (see pipeline_stage_access)
+STAGE_ACCESS_FULL = "full"        # base fields + rules + fields
+STAGE_ACCESS_BASIC = "basic"      # base fields only
+STAGE_ACCESS_MINIMAL = "minimal"  # base fields + empty rules / fields
+
+_STAGE_ACCESS_CONTEXT_KEY = "_pipeline_stage_access"
+
+
+def pipeline_stage_access(context):
+    """
+    RBAC decision for rendering stages, made once per serializer context
+    (a pipeline list and all its nested stages share one context dict).
+    """
+    if _STAGE_ACCESS_CONTEXT_KEY in context:
+        return context[_STAGE_ACCESS_CONTEXT_KEY]
+
+    request = context.get("request")
+
+    if not request:
+        access = STAGE_ACCESS_FULL
+
+    else:
+        user = request.user
+
+        # ✅ Admin-like roles → full stage access
+        role_name = (
+            getattr(getattr(getattr(user, "profile", None), "role", None), "name", "")
+            .strip()
+            .lower()
+            .replace("-", " ")
+            .replace("_", " ")
+        )
+
+        if role_name in PIPELINE_STAGE_FULL_ACCESS_ROLES:
+            access = STAGE_ACCESS_FULL
+        elif has_permission(user, "pipeline", "stages", "view"):
+            access = STAGE_ACCESS_BASIC
+        else:
+            # ❌ NO PERMISSION → minimal but stable structure
+            access = STAGE_ACCESS_MINIMAL
+
+    context[_STAGE_ACCESS_CONTEXT_KEY] = access
+    return access
+
+
 class PipelineStageReadSerializer(serializers.ModelSerializer):
     rules = StageRuleSerializer(many=True, read_only=True)
     fields = StageFieldSerializer(many=True, read_only=True)
@@ -76,80 +138,33 @@ class PipelineStageReadSerializer(serializers.ModelSerializer):
     class Meta:
         model = PipelineStage
         fields = [
-            "id",
-            "stage_name",
-            "stage_type",
-            "stage_status",
-            "stage_order",
-            "color_code",
-            "entry_rule",
-
-            # ✅ REQUIRED FOR LEAD CONVERSION
-            "is_conversion_stage",
-            "is_default_stage",
-
+            *PIPELINE_STAGE_BASE_FIELDS,
             "rules",
             "fields",
         ]
 
     # =====================================================
     # RBAC FILTERING
+    # ✅ OPTIMIZATION: access is decided once per context, and
+    #    rules / fields are only serialized when they are shown
     # =====================================================
     def to_representation(self, instance):
-        data = super().to_representation(instance)
+        access = pipeline_stage_access(self.context)
 
-        request = self.context.get("request")
-        if not request:
-            return data
+        if access == STAGE_ACCESS_FULL:
+            return super().to_representation(instance)
 
-        user = request.user
+        data = {}
+        for name in PIPELINE_STAGE_BASE_FIELDS:
+            field = self.fields[name]
+            attribute = field.get_attribute(instance)
+            data[name] = None if attribute is None else field.to_representation(attribute)
 
-        # ✅ Admin-like roles → full stage access
-        role_name = (
-            getattr(getattr(getattr(user, "profile", None), "role", None), "name", "")
-            .strip()
-            .lower()
-            .replace("-", " ")
-            .replace("_", " ")
-        )
-        if role_name in {"super admin", "superadmin", "admin", "clinic admin"}:
-            return data
-
-        # ❌ NO PERMISSION → return minimal but stable structure
-        if not has_permission(user, "pipeline", "stages", "view"):
-            return {
-                "id": data.get("id"),
-                "stage_name": data.get("stage_name"),
-                "stage_type": data.get("stage_type"),
-                "stage_status": data.get("stage_status"),
-                "stage_order": data.get("stage_order"),
-                "color_code": data.get("color_code"),
-                "entry_rule": data.get("entry_rule"),
-
-                # ✅ IMPORTANT: keep these visible
-                "is_conversion_stage": data.get("is_conversion_stage"),
-                "is_default_stage": data.get("is_default_stage"),
-
-                "rules": [],
-                "fields": [],
-            }
-
-        # 🔥 FIELD FILTERING
-        allowed_fields = [
-            "id",
-            "stage_name",
-            "stage_type",
-            "stage_status",
-            "stage_order",
-            "color_code",
-            "entry_rule",
-
-            # ✅ REQUIRED
-            "is_conversion_stage",
-            "is_default_stage",
-        ]
+        if access == STAGE_ACCESS_MINIMAL:
+            data["rules"] = []
+            data["fields"] = []
 
-        return {k: v for k, v in data.items() if k in allowed_fields}
+        return data
 
 
 # =====================================================
@@ -171,6 +186,11 @@ class PipelineReadSerializer(serializers.ModelSerializer):
 
     def get_stages(self, obj):
         stages = obj.stages.filter(is_deleted=False, is_active=True).order_by("stage_order")
+
+        # Rules / fields are only rendered with full access
+        if pipeline_stage_access(self.context) == STAGE_ACCESS_FULL:
+            stages = stages.prefetch_related("rules", "fields")
+
         return PipelineStageReadSerializer(stages, many=True, context=self.context).data
 
 
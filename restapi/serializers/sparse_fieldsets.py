@@ -0,0 +1,99 @@
+from rest_framework.exceptions import ValidationError
+
+
+# =====================================================
+# SPARSE FIELDSETS (?fields= / ?expand=)
+# =====================================================
+def _split_param(value):
+    return [part.strip() for part in str(value or "").split(",") if part.strip()]
+
+
+class SparseFieldsetMixin:
+    """
+    Lets a read serializer render only the fields a caller asked for,
+    and lets the view load only the relations those fields need.
+
+      ?fields=id,full_name,stage_name   -> only these fields
+      ?expand=documents                 -> added on top of ?fields=
+
+    Without ?fields= every field is rendered, as before; ?expand= alone
+    is additive and never trims the default representation.
+
+    Subclasses declare which queryset work each field needs:
+      sparse_select_related   = {"stage_name": ("stage",)}
+      sparse_prefetch_related = {"documents": ("documents",)}
+    Prefetch entries may be callables returning a Prefetch object.
+    """
+
+    sparse_select_related = {}
+    sparse_prefetch_related = {}
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in list(self.fields):
+                if name not in fields:
+                    self.fields.pop(name)
+
+    @classmethod
+    def sparse_fields_from_request(cls, request, extra_fields=()):
+        """
+        Parse ?fields= / ?expand= into the set of requested names, or
+        None when the caller wants everything (no ?fields=; expansions
+        only add to the default representation). `extra_fields` are
+        keys a view adds to the serializer output itself.
+        """
+        params = request.query_params
+        fields = _split_param(params.get("fields"))
+        expand = _split_param(params.get("expand"))
+
+        if not fields and not expand:
+            return None
+
+        known = set(cls().fields) | set(extra_fields)
+        unknown = [name for name in fields + expand if name not in known]
+
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(unknown)}"})
+
+        if not fields:
+            return None
+
+        return set(fields) | set(expand)
+
+    @classmethod
+    def prepare_queryset(cls, queryset, fields=None):
+        """
+        Apply select_related / prefetch_related for `fields` only
+        (every declared relation when fields is None).
+        """
+        def wanted(name):
+            return fields is None or name in fields
+
+        select_related = []
+        for name, paths in cls.sparse_select_related.items():
+            if wanted(name):
+                select_related.extend(path for path in paths if path not in select_related)
+
+        prefetch_related = []
+        seen = set()
+        for name, lookups in cls.sparse_prefetch_related.items():
+            if not wanted(name):
+                continue
+
+            for lookup in lookups:
+                key = lookup if isinstance(lookup, str) else lookup.__name__
+                if key in seen:
+                    continue
+
+                seen.add(key)
+                prefetch_related.append(lookup if isinstance(lookup, str) else lookup())
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        return queryset
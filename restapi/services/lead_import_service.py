@@ -0,0 +1,670 @@
+"""
+restapi/services/lead_import_service.py
+
+Bulk lead import from CSV / XLSX.
+
+Rows are streamed from the file and processed in batches: every
+reference (department, stage, campaign, interests, assignee) used by a
+batch is resolved with one query per type into an in-memory map, valid
+rows are inserted with bulk_create, and a single aggregated Zapier event
+is sent for the whole import instead of one per lead.
+
+The clinic's lead_dedupe_policy applies to every row: duplicates are
+looked up with one query per batch (rows earlier in the same file count
+as existing leads), then attached, merged into the original or rejected
+exactly like single lead creation.
+
+Columns (header row, case-insensitive):
+  full_name*, email, contact_no (or phone), age, gender, marital_status,
+  location, address, language_preference, source, sub_source,
+  lead_status, remark, contact_full_name, contact_phone, contact_email,
+  assigned_to_id, department, stage, campaign (id or name),
+  treatment_interest (comma-separated ids or names),
+  cf.<field_key> for custom form fields.
+"""
+
+import csv
+import io
+import logging
+import uuid
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from restapi.models import (
+    Campaign,
+    Clinic,
+    Department,
+    Employee,
+    Interest,
+    Lead,
+    LeadCustomFieldValue,
+    LeadFormField,
+    PipelineStage,
+)
+from restapi.services.lead_service import (
+    LEAD_MERGE_FILL_FIELDS,
+    _get_user_info,
+    _normalize_action_status,
+    _sync_custom_fields_column,
+    _validate_phone,
+    fill_blank_lead_fields,
+    find_duplicate_lead,
+    merge_into_lead,
+    normalize_email,
+)
+from restapi.services.stage_analytics_service import record_stage_transitions
+from restapi.services.zapier_service import send_to_zapier
+from restapi.utils.phone import to_e164
+
+logger = logging.getLogger(__name__)
+
+LEAD_IMPORT_BATCH_SIZE = 500
+LEAD_IMPORT_MAX_REPORTED_ERRORS = 1000
+LEAD_IMPORT_DEFAULT_SOURCE = "Import"
+
+# Plain Lead columns copied from the file as-is (after strip)
+LEAD_IMPORT_FIELDS = (
+    "full_name",
+    "email",
+    "contact_no",
+    "age",
+    "gender",
+    "marital_status",
+    "location",
+    "address",
+    "language_preference",
+    "source",
+    "sub_source",
+    "lead_status",
+    "action_status",
+    "remark",
+    "contact_full_name",
+    "contact_phone",
+    "contact_email",
+    "assigned_to_id",
+)
+
+LEAD_IMPORT_HEADER_ALIASES = {
+    "name": "full_name",
+    "phone": "contact_no",
+    "mobile": "contact_no",
+    "interests": "treatment_interest",
+    "department_id": "department",
+    "stage_id": "stage",
+    "campaign_id": "campaign",
+}
+
+# FK fields are resolved from the batch maps (never validated per row);
+# derived columns are filled after validation
+_FULL_CLEAN_EXCLUDE = [
+    "search_vector",
+    "custom_fields",
+    "last_interaction_at",
+    "contact_no_e164",
+    "contact_phone_e164",
+    "clinic",
+    "department",
+    "campaign",
+    "stage",
+    "converted_at_stage",
+    "referral_department",
+    "referral_source",
+]
+
+
+# =====================================================
+# FILE READERS (streaming)
+# =====================================================
+def _normalize_header(value):
+    header = str(value or "").strip()
+
+    # Custom field keys keep their case: cf.<field_key>
+    if header[:3].lower() == "cf.":
+        return f"cf.{header[3:].strip()}"
+
+    header = header.lower().replace(" ", "_")
+    return LEAD_IMPORT_HEADER_ALIASES.get(header, header)
+
+
+def _cell(value):
+    if value is None:
+        return ""
+
+    # XLSX stores phone numbers / ids as floats
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+
+    return str(value).strip()
+
+
+def _iter_csv_rows(file_obj):
+    stream = io.TextIOWrapper(getattr(file_obj, "file", file_obj), encoding="utf-8-sig", newline="")
+    reader = csv.reader(stream)
+
+    headers = [_normalize_header(h) for h in next(reader, [])]
+
+    for values in reader:
+        yield {header: _cell(value) for header, value in zip(headers, values)}
+
+
+def _iter_xlsx_rows(file_obj):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError({"file": "XLSX import requires the openpyxl package"})
+
+    workbook = load_workbook(file_obj, read_only=True, data_only=True)
+
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [_normalize_header(h) for h in next(rows, ())]
+
+        for values in rows:
+            yield {header: _cell(value) for header, value in zip(headers, values)}
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(file_obj, filename):
+    """Yield one dict per data row, keyed by normalized header."""
+    name = str(filename or "").lower()
+
+    if name.endswith(".csv"):
+        return _iter_csv_rows(file_obj)
+
+    if name.endswith(".xlsx"):
+        return _iter_xlsx_rows(file_obj)
+
+    raise ValidationError({"file": "Only .csv and .xlsx files are supported"})
+
+
+# =====================================================
+# BATCH REFERENCE MAPS
+# =====================================================
+def _split_tokens(value):
+    return [part.strip() for part in str(value or "").split(",") if part.strip()]
+
+
+def _parse_id(token, id_type):
+    try:
+        return str(id_type(token))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _reference_map(queryset, name_field, tokens, id_type):
+    """
+    One query for every id or name referenced by the batch.
+    Returns {str(pk) | lower(name): obj}.
+    """
+    if not tokens:
+        return {}
+
+    ids = {parsed for parsed in (_parse_id(t, id_type) for t in tokens) if parsed}
+    names = {t.lower() for t in tokens}
+
+    objects = queryset.alias(name_lower=Lower(name_field)).filter(
+        Q(pk__in=ids) | Q(name_lower__in=names)
+    )
+
+    mapping = {}
+    for obj in objects:
+        mapping[str(obj.pk)] = obj
+        mapping.setdefault(getattr(obj, name_field).lower(), obj)
+
+    return mapping
+
+
+def _lookup(mapping, token, id_type):
+    parsed = _parse_id(token, id_type)
+    return (parsed and mapping.get(parsed)) or mapping.get(token.lower())
+
+
+def _load_batch_refs(clinic, rows):
+    tokens = {"department": set(), "stage": set(), "campaign": set(), "interest": set()}
+    assignee_ids = set()
+
+    for _, row in rows:
+        for key in ("department", "stage", "campaign"):
+            if row.get(key):
+                tokens[key].add(row[key])
+
+        tokens["interest"].update(_split_tokens(row.get("treatment_interest")))
+
+        assignee = _parse_id(row.get("assigned_to_id"), int)
+        if assignee:
+            assignee_ids.add(int(assignee))
+
+    return {
+        "department": _reference_map(
+            Department.objects.filter(clinic=clinic, is_active=True),
+            "name", tokens["department"], int,
+        ),
+        "stage": _reference_map(
+            PipelineStage.objects.filter(
+                pipeline__clinic=clinic, is_active=True, is_deleted=False
+            ),
+            "stage_name", tokens["stage"], uuid.UUID,
+        ),
+        "campaign": _reference_map(
+            Campaign.objects.filter(clinic=clinic),
+            "campaign_name", tokens["campaign"], uuid.UUID,
+        ),
+        "interest": _reference_map(
+            Interest.objects.filter(clinic=clinic, is_active=True),
+            "name", tokens["interest"], uuid.UUID,
+        ),
+        "assignee": dict(
+            Employee.objects.filter(id__in=assignee_ids).values_list("id", "emp_name")
+        ) if assignee_ids else {},
+    }
+
+
+# =====================================================
+# ROW → LEAD
+# =====================================================
+def _build_lead(row, refs, context):
+    errors = {}
+
+    values = {
+        field: row[field]
+        for field in LEAD_IMPORT_FIELDS
+        if row.get(field, "") != ""
+    }
+
+    try:
+        values["contact_no"] = _validate_phone(values.get("contact_no"))
+    except ValidationError as exc:
+        errors.update(exc.detail)
+
+    if "action_status" in values:
+        try:
+            values["action_status"] = _normalize_action_status(values["action_status"])
+        except ValidationError as exc:
+            errors.update(exc.detail)
+
+    # ── References ────────────────────────────────────────────
+    department = context["default_department"]
+    if row.get("department"):
+        department = _lookup(refs["department"], row["department"], int)
+        if not department:
+            errors["department"] = f"Unknown department '{row['department']}'"
+    elif not department:
+        errors["department"] = "Department is required"
+
+    stage = None
+    if row.get("stage"):
+        stage = _lookup(refs["stage"], row["stage"], uuid.UUID)
+        if not stage:
+            errors["stage"] = f"Unknown stage '{row['stage']}'"
+
+    campaign = None
+    if row.get("campaign"):
+        campaign = _lookup(refs["campaign"], row["campaign"], uuid.UUID)
+        if not campaign:
+            errors["campaign"] = f"Unknown campaign '{row['campaign']}'"
+
+    interests = []
+    for token in _split_tokens(row.get("treatment_interest")):
+        interest = _lookup(refs["interest"], token, uuid.UUID)
+        if not interest:
+            errors["treatment_interest"] = f"Unknown interest '{token}'"
+            break
+        interests.append(interest)
+
+    # ── Custom fields ─────────────────────────────────────────
+    custom_fields = {}
+    for column, value in row.items():
+        if column.startswith("cf.") and value:
+            key = column[3:]
+            if key in context["custom_fields_by_key"]:
+                custom_fields[key] = value
+
+    if errors:
+        return None, [], errors
+
+    assigned_to_id = values.pop("assigned_to_id", None)
+
+    lead = Lead(
+        clinic=context["clinic"],
+        department=department,
+        stage=stage,
+        campaign=campaign,
+        source=values.pop("source", LEAD_IMPORT_DEFAULT_SOURCE),
+        assigned_to_id=assigned_to_id,
+        created_by_id=context["created_by_id"],
+        created_by_name=context["created_by_name"],
+        custom_fields=custom_fields,
+        **values,
+    )
+
+    try:
+        lead.full_clean(
+            exclude=_FULL_CLEAN_EXCLUDE,
+            validate_unique=False,
+            validate_constraints=False,
+        )
+    except DjangoValidationError as exc:
+        return None, [], exc.message_dict
+
+    # bulk_create skips Lead.save(): apply its derived fields here
+    if lead.assigned_to_id:
+        lead.assigned_to_name = refs["assignee"].get(lead.assigned_to_id)
+    if stage and not lead.lead_status:
+        lead.lead_status = stage.stage_name
+    lead.last_interaction_at = context["now"]
+    lead.contact_no_e164 = to_e164(lead.contact_no)
+    lead.contact_phone_e164 = to_e164(lead.contact_phone)
+
+    return lead, interests, None
+
+
+def _report_error(result, row_number, errors):
+    result["failed"] += 1
+    if len(result["errors"]) < LEAD_IMPORT_MAX_REPORTED_ERRORS:
+        result["errors"].append({"row": row_number, "errors": errors})
+
+
+# =====================================================
+# DUPLICATES (per-clinic lead_dedupe_policy)
+# Same matching order as find_duplicate_lead (phone, then email,
+# oldest live lead first) with one candidate query per batch.
+# Name matching, when the clinic enables it, still probes the
+# trigram index per unmatched row and only against saved leads.
+# =====================================================
+def _existing_duplicate_maps(clinic, leads):
+    phones = {lead.contact_no_e164 for lead in leads} - {None, ""}
+    emails = {normalize_email(lead.email) for lead in leads} - {None}
+
+    maps = {"no": {}, "phone": {}, "email": {}}
+    if not phones and not emails:
+        return maps
+
+    candidates = (
+        Lead.objects.filter(clinic=clinic, is_deleted=False, duplicate_of__isnull=True)
+        .alias(email_lower=Lower("email"))
+        .filter(
+            Q(contact_no_e164__in=phones)
+            | Q(contact_phone_e164__in=phones)
+            | Q(email_lower__in=emails)
+        )
+        .order_by("created_at")
+    )
+
+    for lead in candidates:
+        maps["no"].setdefault(lead.contact_no_e164, lead)
+        maps["phone"].setdefault(lead.contact_phone_e164, lead)
+        maps["email"].setdefault(normalize_email(lead.email), lead)
+
+    return maps
+
+
+def _find_batch_duplicate(lead, existing, seen, clinic):
+    phone = lead.contact_no_e164
+    email = normalize_email(lead.email)
+
+    if phone:
+        for maps in (existing, seen):
+            match = maps["no"].get(phone) or maps["phone"].get(phone)
+            if match:
+                return match, "phone"
+
+    if email:
+        for maps in (existing, seen):
+            match = maps["email"].get(email)
+            if match:
+                return match, "email"
+
+    if clinic.lead_dedupe_match_name and lead.full_name:
+        return find_duplicate_lead(clinic, full_name=lead.full_name)
+
+    return None, None
+
+
+def _remember_lead(seen, lead):
+    if lead.contact_no_e164:
+        seen["no"].setdefault(lead.contact_no_e164, lead)
+    if lead.contact_phone_e164:
+        seen["phone"].setdefault(lead.contact_phone_e164, lead)
+
+    email = normalize_email(lead.email)
+    if email:
+        seen["email"].setdefault(email, lead)
+
+
+def _merge_unsaved(target, lead):
+    # Both rows come from this batch: fold in memory before the insert
+    fill_blank_lead_fields(target, {name: getattr(lead, name) for name in LEAD_MERGE_FILL_FIELDS})
+    target.contact_no_e164 = to_e164(target.contact_no)
+    target.contact_phone_e164 = to_e164(target.contact_phone)
+    target.custom_fields = {**lead.custom_fields, **target.custom_fields}
+
+
+def _merge_saved(target, lead, context):
+    merge_into_lead(
+        target,
+        {name: getattr(lead, name) for name in LEAD_MERGE_FILL_FIELDS},
+        context["created_by_id"],
+        context["created_by_name"],
+    )
+
+    # Never overwrite answers the original lead already has
+    answered = target.custom_fields or {}
+    fields_by_key = context["custom_fields_by_key"]
+    incoming = {
+        key: value for key, value in lead.custom_fields.items() if key not in answered
+    }
+
+    if incoming:
+        LeadCustomFieldValue.objects.bulk_create([
+            LeadCustomFieldValue(lead=target, field=fields_by_key[key], value=value)
+            for key, value in incoming.items()
+        ])
+        _sync_custom_fields_column(target, {**answered, **incoming})
+
+
+def _apply_dedupe_policy(built, context, result):
+    """
+    Split a batch of (row_number, lead, interests) into leads to insert,
+    interest links and (original, duplicate) merges.
+    """
+    clinic = context["clinic"]
+    policy = clinic.lead_dedupe_policy
+    seen = context["dedupe_seen"]
+
+    leads, interest_links, merges = [], [], []
+
+    existing = (
+        _existing_duplicate_maps(clinic, [lead for _, lead, _ in built])
+        if policy != Clinic.LeadDedupePolicy.OFF else None
+    )
+
+    for row_number, lead, interests in built:
+        original, matched_on = (
+            _find_batch_duplicate(lead, existing, seen, clinic)
+            if existing is not None else (None, None)
+        )
+
+        if original is None:
+            leads.append(lead)
+            interest_links.extend((lead, interest) for interest in interests)
+            _remember_lead(seen, lead)
+            continue
+
+        if policy == Clinic.LeadDedupePolicy.REJECT:
+            _report_error(result, row_number, {
+                "duplicate": {"lead_id": str(original.id), "matched_on": matched_on}
+            })
+            continue
+
+        interest_links.extend((original, interest) for interest in interests)
+
+        if policy == Clinic.LeadDedupePolicy.MERGE:
+            merges.append((original, lead))
+            result["merged"] += 1
+            continue
+
+        lead.duplicate_of_id = original.id
+        leads.append(lead)
+        result["attached"] += 1
+
+    return leads, interest_links, merges
+
+
+def _import_batch(rows, context, result, dry_run):
+    refs = _load_batch_refs(context["clinic"], rows)
+
+    built = []
+
+    for row_number, row in rows:
+        lead, interests, errors = _build_lead(row, refs, context)
+
+        if errors:
+            _report_error(result, row_number, errors)
+            continue
+
+        built.append((row_number, lead, interests))
+
+    leads, interest_links, merges = _apply_dedupe_policy(built, context, result)
+
+    result["valid"] += len(leads) + len(merges)
+
+    if dry_run or not (leads or merges):
+        return
+
+    # Originals from this same batch are not inserted yet: fold those
+    # in memory, merge the rest into the saved rows
+    saved_merges = []
+    for original, lead in merges:
+        if original._state.adding:
+            _merge_unsaved(original, lead)
+        else:
+            saved_merges.append((original, lead))
+
+    Through = Lead.treatment_interest.through
+    fields_by_key = context["custom_fields_by_key"]
+
+    with transaction.atomic():
+        if leads:
+            Lead.objects.bulk_create(leads, batch_size=len(leads))
+
+        for original, lead in saved_merges:
+            _merge_saved(original, lead, context)
+
+        if interest_links:
+            Through.objects.bulk_create(
+                [Through(lead_id=lead.id, interest_id=interest.id) for lead, interest in interest_links],
+                ignore_conflicts=True,
+            )
+
+        custom_values = [
+            LeadCustomFieldValue(lead=lead, field=fields_by_key[key], value=value)
+            for lead in leads
+            for key, value in lead.custom_fields.items()
+        ]
+        if custom_values:
+            LeadCustomFieldValue.objects.bulk_create(custom_values)
+
+        record_stage_transitions(
+            ((lead.id, None, lead.stage_id) for lead in leads),
+            context["created_by_id"], context["created_by_name"], at=context["now"],
+        )
+
+    result["created"] += len(leads)
+
+
+# =====================================================
+# IMPORT
+# =====================================================
+def import_leads(
+    rows,
+    clinic,
+    request=None,
+    default_department_id=None,
+    batch_size=LEAD_IMPORT_BATCH_SIZE,
+    dry_run=False,
+    source_name=None,
+):
+    """
+    Import an iterable of row dicts (see iter_import_rows) into `clinic`.
+
+    Each batch is committed independently; invalid rows are reported
+    with their file row number (header is row 1) and never block the
+    rest of the import.
+    """
+    default_department = None
+    if default_department_id:
+        default_department = Department.objects.filter(
+            id=default_department_id,
+            clinic=clinic,
+            is_active=True,
+        ).first()
+
+        if not default_department:
+            raise ValidationError({"department_id": "Invalid department for this clinic"})
+
+    created_by_id, created_by_name = _get_user_info(request)
+
+    context = {
+        "clinic": clinic,
+        "default_department": default_department,
+        "created_by_id": created_by_id,
+        "created_by_name": created_by_name,
+        "now": timezone.now(),
+        "custom_fields_by_key": {
+            field.field_key: field
+            for field in LeadFormField.objects.filter(is_active=True, model_field="")
+        },
+        # Leads created earlier in this file, by dedupe key
+        "dedupe_seen": {"no": {}, "phone": {}, "email": {}},
+    }
+
+    result = {
+        "total": 0, "valid": 0, "created": 0, "attached": 0, "merged": 0,
+        "failed": 0, "errors": [],
+    }
+    batch_size = max(1, int(batch_size or LEAD_IMPORT_BATCH_SIZE))
+    batch = []
+
+    for row_number, row in enumerate(rows, start=2):
+        # Skip fully empty lines (common at the end of spreadsheets)
+        if not any(row.values()):
+            continue
+
+        result["total"] += 1
+        batch.append((row_number, row))
+
+        if len(batch) >= batch_size:
+            _import_batch(batch, context, result, dry_run)
+            batch = []
+
+    if batch:
+        _import_batch(batch, context, result, dry_run)
+
+    logger.info(
+        "LeadImport: clinic=%s source=%s total=%d created=%d merged=%d failed=%d dry_run=%s",
+        clinic.id, source_name, result["total"], result["created"], result["merged"],
+        result["failed"], dry_run,
+    )
+
+    if not dry_run and (result["created"] or result["merged"]):
+        send_to_zapier({
+            "event": "leads_imported",
+            "clinic_id": clinic.id,
+            "source": source_name,
+            "total": result["total"],
+            "created": result["created"],
+            "merged": result["merged"],
+            "failed": result["failed"],
+            "created_by_id": created_by_id,
+        })
+
+    return result
@@ -0,0 +1,165 @@
+"""
+restapi/services/lead_merge_service.py
+
+Folds duplicate leads into the oldest lead of their group: blanks and
+custom answers are filled in, every related row (notes, calls,
+messages, emails, documents, ...) except stage transitions is re-pointed
+at the survivor, and the duplicates are soft-deleted with `duplicate_of`
+set.
+"""
+
+from django.db import transaction
+from django.db.models import Count, Min
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from restapi.models import Lead, LeadCustomFieldValue, LeadStageTransition
+from restapi.services.lead_service import (
+    LEAD_MERGE_FILL_FIELDS,
+    _sync_custom_fields_column,
+    merge_into_lead,
+    recompute_lead_last_interaction,
+)
+
+
+def _lead_child_relations():
+    """
+    One-to-many relations pointing at Lead. Custom values are moved
+    separately (unique per lead + field) and the self FK is handled
+    by the merge itself. Stage transitions stay on the duplicate: mixed
+    into the survivor's history they would corrupt the per-stage
+    durations rolled up by stage analytics.
+    """
+    return [
+        relation
+        for relation in Lead._meta.related_objects
+        if relation.one_to_many
+        and relation.related_model is not Lead
+        and relation.related_model is not LeadCustomFieldValue
+        and relation.related_model is not LeadStageTransition
+    ]
+
+
+def _merge_custom_field_values(primary, duplicate_ids):
+    """Newest answer wins for fields the primary has not answered."""
+    answered = set(
+        LeadCustomFieldValue.objects.filter(lead=primary).values_list("field_id", flat=True)
+    )
+
+    incoming = {}
+    for value in (
+        LeadCustomFieldValue.objects.filter(lead_id__in=duplicate_ids)
+        .exclude(field_id__in=answered)
+        .exclude(value="")
+        .select_related("field")
+        .order_by("modified_at")
+    ):
+        incoming[value.field_id] = value
+
+    if not incoming:
+        return
+
+    LeadCustomFieldValue.objects.bulk_create([
+        LeadCustomFieldValue(lead=primary, field_id=field_id, value=value.value)
+        for field_id, value in incoming.items()
+    ])
+
+    _sync_custom_fields_column(primary, {
+        **(primary.custom_fields or {}),
+        **{value.field.field_key: value.value for value in incoming.values()},
+    })
+
+
+@transaction.atomic
+def merge_leads(primary, duplicates):
+    """
+    Merge `duplicates` into `primary`. Returns the number of leads merged.
+    """
+    duplicates = [lead for lead in duplicates if lead.pk != primary.pk]
+    if not duplicates:
+        return 0
+
+    duplicate_ids = [lead.id for lead in duplicates]
+
+    # Oldest duplicate that has a value fills each blank
+    values = {}
+    for duplicate in duplicates:
+        for name in LEAD_MERGE_FILL_FIELDS:
+            if values.get(name) in (None, ""):
+                values[name] = getattr(duplicate, name)
+
+    # A cleanup is not an interaction and not an edit by anyone
+    merge_into_lead(primary, values, record_interaction=False)
+
+    _merge_custom_field_values(primary, duplicate_ids)
+
+    primary.treatment_interest.add(
+        *Lead.treatment_interest.through.objects.filter(
+            lead_id__in=duplicate_ids
+        ).values_list("interest_id", flat=True).distinct()
+    )
+
+    for relation in _lead_child_relations():
+        relation.related_model._base_manager.filter(
+            **{f"{relation.field.name}__in": duplicate_ids}
+        ).update(**{relation.field.name: primary})
+
+    # Queryset updates fire no signals: pick up the inherited calls,
+    # messages and emails from the interaction tables
+    recompute_lead_last_interaction([primary.id])
+
+    now = timezone.now()
+
+    Lead.objects.filter(duplicate_of_id__in=duplicate_ids).update(
+        duplicate_of=primary,
+        modified_at=now,
+    )
+    Lead.objects.filter(id__in=duplicate_ids).update(
+        duplicate_of=primary,
+        is_deleted=True,
+        is_active=False,
+        modified_at=now,
+    )
+
+    return len(duplicate_ids)
+
+
+# =====================================================
+# BATCH: EXISTING DUPLICATES
+# Both groupings run on indexed columns and return only
+# the matching keys, never whole lead rows.
+# =====================================================
+def iter_duplicate_groups(queryset):
+    """
+    Yield lists of lead ids (oldest first) that share a clinic and a
+    normalized phone or email.
+    """
+    live = queryset.filter(is_deleted=False, duplicate_of__isnull=True)
+
+    groupings = (
+        ("contact_no_e164", live.exclude(contact_no_e164__isnull=True).exclude(contact_no_e164="")),
+        ("email_key", live.exclude(email__isnull=True).exclude(email="").annotate(email_key=Lower("email"))),
+    )
+
+    seen = set()
+
+    for key, scoped in groupings:
+        groups = (
+            scoped.values("clinic_id", key)
+            .annotate(total=Count("id"), first_created=Min("created_at"))
+            .filter(total__gt=1)
+            .order_by("first_created")
+        )
+
+        for group in groups.iterator():
+            ids = [
+                lead_id
+                for lead_id in scoped.filter(clinic_id=group["clinic_id"], **{key: group[key]})
+                .order_by("created_at", "id")
+                .values_list("id", flat=True)
+                if lead_id not in seen
+            ]
+
+            if len(ids) > 1:
+                seen.update(ids)
+                yield ids
@@ -2,12 +2,40 @@
 # Imports
 # =====================================================
 import logging
+import re
+from email.utils import getaddresses, parseaddr
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+    TrigramWordSimilarity,
+)
 from django.core.mail import send_mail
 from django.utils import timezone
 from django.utils.html import strip_tags
 from django.db import transaction
+from datetime import timedelta
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    DateTimeField,
+    F,
+    FloatField,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Coalesce, Greatest, Lower, RowNumber
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import ValidationError
+from restapi.utils.phone import to_e164, validate_phone
+from restapi.services.zapier_service import send_to_zapier
+from restapi.services.stage_analytics_service import record_stage_transitions
 from restapi.models import Interest
 from restapi.models import (
     Lead,
@@ -22,6 +50,8 @@ from restapi.models import (
     ReferralDepartment,
     ReferralSource,
     PipelineStage,
+    TwilioCall,
+    TwilioMessage,
 )
 
 logger = logging.getLogger(__name__)
@@ -90,88 +120,689 @@ def _resolve_assignee_name(assigned_to_id, assigned_to_name):
     return None
 
 
+# =====================================================
+# LAST INTERACTION TRACKING
+# =====================================================
+INTERACTION_CALL_STATUSES = ("completed", "answered", "in-progress")
+
+INTERACTION_SMS_STATUSES = ("queued", "queued_via_zapier", "sent", "delivered")
+
+
+def touch_lead_last_interaction(lead_id, occurred_at):
+    """
+    Move Lead.last_interaction_at forward to ``occurred_at``.
+    Never moves it backwards, so out-of-order callbacks are harmless.
+    """
+    if not lead_id or not occurred_at:
+        return 0
+
+    return Lead.objects.filter(pk=lead_id).filter(
+        Q(last_interaction_at__isnull=True)
+        | Q(last_interaction_at__lt=occurred_at)
+    ).update(last_interaction_at=occurred_at, modified_at=timezone.now())
+
+
+def last_interaction_expression():
+    """
+    SQL expression computing a lead's last interaction from the
+    interaction tables. Used to backfill/recompute the stored column.
+    """
+    latest_call = (
+        TwilioCall.objects.filter(
+            lead=OuterRef("pk"),
+            status__in=INTERACTION_CALL_STATUSES,
+        )
+        .order_by("-created_at")
+        .values("created_at")[:1]
+    )
+
+    latest_sms = (
+        TwilioMessage.objects.filter(
+            lead=OuterRef("pk"),
+            status__in=INTERACTION_SMS_STATUSES,
+        )
+        .order_by("-created_at")
+        .values("created_at")[:1]
+    )
+
+    latest_email = (
+        LeadEmail.objects.filter(
+            lead=OuterRef("pk"),
+            status="SENT",
+            sent_at__isnull=False,
+        )
+        .order_by("-sent_at")
+        .values("sent_at")[:1]
+    )
+
+    return Greatest(
+        Coalesce(Subquery(latest_call, output_field=DateTimeField()), "created_at"),
+        Coalesce(Subquery(latest_sms, output_field=DateTimeField()), "created_at"),
+        Coalesce(Subquery(latest_email, output_field=DateTimeField()), "created_at"),
+    )
+
+
+def recompute_lead_last_interaction(lead_ids):
+    """
+    Move last_interaction_at forward to the latest interaction on record.
+    Never moves it backwards: the stored value may reflect interactions
+    the tables do not hold (e.g. a re-inquiry merged into the lead).
+    """
+    return Lead.objects.filter(pk__in=list(lead_ids)).update(
+        last_interaction_at=Greatest(
+            last_interaction_expression(),
+            Coalesce("last_interaction_at", "created_at"),
+        ),
+        modified_at=timezone.now(),
+    )
+
+
+# =====================================================
+# LEAD QUALITY (Hot / Warm / Cold)
+# Hot  : last interaction within 7 days
+# Warm : within 30 days
+# Cold : anything older
+# =====================================================
+LEAD_QUALITY_HOT_DAYS = 7
+LEAD_QUALITY_WARM_DAYS = 30
+
+LEAD_QUALITIES = ("Hot", "Warm", "Cold")
+
+
+def lead_quality_for(last_interaction, now=None):
+    if not last_interaction:
+        return "Cold"
+
+    diff_days = ((now or timezone.now()) - last_interaction).days
+
+    if diff_days <= LEAD_QUALITY_HOT_DAYS:
+        return "Hot"
+
+    if diff_days <= LEAD_QUALITY_WARM_DAYS:
+        return "Warm"
+
+    return "Cold"
+
+
+def _lead_quality_cutoffs(now=None):
+    # `diff.days <= N` holds exactly while the timestamp is newer than N + 1 days ago
+    now = now or timezone.now()
+    return (
+        now - timedelta(days=LEAD_QUALITY_HOT_DAYS + 1),
+        now - timedelta(days=LEAD_QUALITY_WARM_DAYS + 1),
+    )
+
+
+def _interaction_after(cutoff):
+    # Range predicates on the indexed column; rows not yet backfilled
+    # fall back to created_at, matching LeadReadSerializer.
+    return Q(last_interaction_at__gt=cutoff) | Q(
+        last_interaction_at__isnull=True,
+        created_at__gt=cutoff,
+    )
+
+
+def lead_quality_q(quality, now=None):
+    """
+    Q object selecting leads in one quality bucket, or None if the
+    bucket name is unknown.
+    """
+    hot_cutoff, warm_cutoff = _lead_quality_cutoffs(now)
+    quality = str(quality or "").strip().lower()
+
+    if quality == "hot":
+        return _interaction_after(hot_cutoff)
+
+    if quality == "warm":
+        return _interaction_after(warm_cutoff) & ~_interaction_after(hot_cutoff)
+
+    if quality == "cold":
+        return ~_interaction_after(warm_cutoff)
+
+    return None
+
+
+def lead_quality_case(now=None):
+    hot_cutoff, warm_cutoff = _lead_quality_cutoffs(now)
+
+    return Case(
+        When(_interaction_after(hot_cutoff), then=Value("Hot")),
+        When(_interaction_after(warm_cutoff), then=Value("Warm")),
+        default=Value("Cold"),
+        output_field=CharField(),
+    )
+
+
+def count_leads_by_quality(queryset, now=None):
+    """
+    Per-bucket counts in a single aggregate query.
+    """
+    now = now or timezone.now()
+
+    counts = queryset.order_by().aggregate(**{
+        quality.lower(): Count("id", filter=lead_quality_q(quality, now))
+        for quality in LEAD_QUALITIES
+    })
+
+    return {quality: counts[quality.lower()] for quality in LEAD_QUALITIES}
+
+
+# =====================================================
+# LEAD SEARCH
+# Full-text over Lead.search_vector (trigger-maintained) plus
+# trigram word similarity on full_name; digit-only queries are
+# treated as partial phone numbers and queries containing "@" as
+# (partial) email addresses, both trigram-indexed LIKE.
+# =====================================================
+LEAD_SEARCH_MIN_LENGTH = 2
+LEAD_SEARCH_MIN_PHONE_DIGITS = 3
+
+
+def _tsquery_literal(token):
+    # tsquery quoting: embedded quotes and backslashes are doubled
+    return "'" + token.replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def _prefix_search_query(text):
+    tokens = text.split()
+    if not tokens:
+        return None
+
+    # Postgres' own parser splits each quoted token exactly like the
+    # indexed tsvector (e.g. "john.doe" stays one lexeme); every token
+    # is prefix matched so results update while the user is typing
+    return SearchQuery(
+        " & ".join(f"{_tsquery_literal(token)}:*" for token in tokens),
+        search_type="raw",
+        config="simple",
+    )
+
+
+def _search_leads_by_email(queryset, q):
+    # The simple parser keeps an address as one lexeme, so neither a
+    # full address nor "@domain" can be matched through search_vector
+    needle = q.lower()
+
+    return queryset.annotate(
+        email_lower=Lower("email")
+    ).filter(
+        email_lower__contains=needle
+    ).annotate(
+        rank=Case(
+            When(email_lower=needle, then=Value(2.0)),
+            When(email_lower__startswith=needle, then=Value(1.0)),
+            default=Value(0.5),
+            output_field=FloatField(),
+        )
+    ).order_by("-rank", "-created_at", "-id")
+
+
+def search_leads(queryset, q):
+    """
+    Filter and rank ``queryset`` for the search text ``q``.
+    Returns the queryset annotated with ``rank`` and ordered best-first.
+    """
+    q = str(q or "").strip()
+
+    digits = re.sub(r"\D", "", q)
+    if len(digits) >= LEAD_SEARCH_MIN_PHONE_DIGITS and not re.search(r"[^\d\s()+\-.]", q):
+        # Match the normalized columns: stored numbers keep whatever
+        # spacing / dashes they were entered with, contact_*_e164 do not
+        e164 = to_e164(q)
+        if e164:
+            digits = e164.lstrip("+")
+
+        return queryset.filter(
+            Q(contact_no_e164__contains=digits) | Q(contact_phone_e164__contains=digits)
+        ).annotate(
+            rank=Value(1.0, output_field=FloatField())
+        ).order_by("-created_at", "-id")
+
+    if "@" in q:
+        return _search_leads_by_email(queryset, q)
+
+    search_query = _prefix_search_query(q)
+    name_match = Q(full_name__trigram_word_similar=q)
+
+    if search_query is None:
+        return queryset.filter(name_match).annotate(
+            rank=TrigramWordSimilarity(q, "full_name")
+        ).order_by("-rank", "-created_at")
+
+    return queryset.filter(
+        Q(search_vector=search_query) | name_match
+    ).annotate(
+        rank=SearchRank(F("search_vector"), search_query)
+        + TrigramWordSimilarity(q, "full_name")
+    ).order_by("-rank", "-created_at")
+
+
+# =====================================================
+# LEAD EXPORT
+# Flat values() projection streamed through a server-side
+# cursor; no model instances or serializers per row.
+# =====================================================
+LEAD_EXPORT_CHUNK_SIZE = 2000
+
+# Output columns, in order. Lead fields are read as-is; the rest are
+# joined / computed columns declared in LEAD_EXPORT_EXPRESSIONS.
+LEAD_EXPORT_COLUMNS = (
+    "id",
+    "full_name",
+    "email",
+    "contact_no",
+    "gender",
+    "age",
+    "location",
+    "source",
+    "sub_source",
+    "lead_status",
+    "stage_name",
+    "department_name",
+    "campaign_name",
+    "assigned_to_name",
+    "action_status",
+    "appointment_date",
+    "quality",
+    "created_at",
+    "last_interaction_at",
+    "converted_at",
+    "custom_fields",
+)
+
+LEAD_EXPORT_EXPRESSIONS = {
+    "stage_name": F("stage__stage_name"),
+    "department_name": F("department__name"),
+    "campaign_name": F("campaign__campaign_name"),
+}
+
+
+def iter_lead_export_rows(queryset, now=None, chunk_size=LEAD_EXPORT_CHUNK_SIZE):
+    """Yield one plain dict per lead (newest first), keyed by LEAD_EXPORT_COLUMNS."""
+    expressions = {**LEAD_EXPORT_EXPRESSIONS, "quality": lead_quality_case(now)}
+    fields = [column for column in LEAD_EXPORT_COLUMNS if column not in expressions]
+
+    return (
+        queryset.order_by("-created_at", "-id")
+        .values(*fields, **expressions)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+# =====================================================
+# PIPELINE BOARD (KANBAN)
+# Top-N cards of every stage plus each stage's total in a
+# single ROW_NUMBER() / COUNT() OVER (PARTITION BY stage_id)
+# query, instead of loading every lead and grouping client-side.
+# =====================================================
+LEAD_BOARD_ORDERING = ("-created_at", "-id")
+LEAD_BOARD_DEFAULT_PER_STAGE = 25
+LEAD_BOARD_MAX_PER_STAGE = 100
+
+
+def lead_board_columns(queryset, stage_ids, per_stage=LEAD_BOARD_DEFAULT_PER_STAGE):
+    """
+    Returns {stage_id: {"total", "leads", "has_more"}} for every id in
+    `stage_ids` (empty stages included). One extra row is read per
+    stage so callers know whether to hand out a "load more" cursor.
+    """
+    partition = [F("stage_id")]
+
+    rows = (
+        queryset.filter(stage_id__in=stage_ids)
+        .annotate(
+            board_rank=Window(
+                RowNumber(),
+                partition_by=partition,
+                order_by=[F("created_at").desc(), F("id").desc()],
+            ),
+            board_total=Window(Count("id"), partition_by=partition),
+        )
+        .filter(board_rank__lte=per_stage + 1)
+        .order_by("stage_id", "board_rank")
+    )
+
+    columns = {
+        stage_id: {"total": 0, "leads": [], "has_more": False}
+        for stage_id in stage_ids
+    }
+
+    for lead in rows:
+        column = columns[lead.stage_id]
+        column["total"] = lead.board_total
+
+        if lead.board_rank > per_stage:
+            column["has_more"] = True
+        else:
+            column["leads"].append(lead)
+
+    return columns
+
+
+# =====================================================
+# CUSTOM FIELD VALUES (READ)
+# =====================================================
+ACTIVE_CUSTOM_FIELD_VALUES_ATTR = "active_custom_field_values"
+
+
+def active_custom_field_values_prefetch():
+    """
+    Prefetch of a lead's values for active form fields, already in
+    display order, so LeadReadSerializer never re-queries per lead.
+    """
+    return Prefetch(
+        "custom_field_values",
+        queryset=LeadCustomFieldValue.objects.select_related("field")
+        .filter(field__is_active=True)
+        .order_by("field__sort_order", "field__field_label"),
+        to_attr=ACTIVE_CUSTOM_FIELD_VALUES_ATTR,
+    )
+
+
+def get_active_custom_field_values(lead):
+    values = getattr(lead, ACTIVE_CUSTOM_FIELD_VALUES_ATTR, None)
+    if values is not None:
+        return values
+
+    return list(
+        lead.custom_field_values.select_related("field")
+        .filter(field__is_active=True)
+        .order_by("field__sort_order", "field__field_label")
+    )
+
+
 def _save_custom_field_values(lead, values):
     if values in (None, "", "null"):
         return
+
     if not isinstance(values, dict):
         raise ValidationError({"custom_field_values": "Expected an object of field_key/value pairs"})
 
+    # Any prefetched copy is stale once we write
+    lead.__dict__.pop(ACTIVE_CUSTOM_FIELD_VALUES_ATTR, None)
+
+    # Normalize keys/values; if two keys collide after strip the last one wins
+    submitted = {}
     for field_key, raw_value in values.items():
         key = str(field_key or "").strip()
         if not key:
             continue
 
-        field = LeadFormField.objects.filter(
-            field_key=key,
+        submitted[key] = "" if raw_value is None else str(raw_value).strip()
+
+    if not submitted:
+        return
+
+    # =====================================================
+    # ✅ OPTIMIZATION: one lookup for every submitted key, one upsert,
+    #    one delete — query count no longer grows with form size
+    # =====================================================
+    fields_by_key = {
+        field.field_key: field
+        for field in LeadFormField.objects.filter(
+            field_key__in=list(submitted),
             is_active=True,
             model_field="",
-        ).first()
+        )
+    }
+
+    custom_fields = dict(lead.custom_fields or {})
+    to_upsert = []
+    cleared_field_ids = []
+
+    for key, value in submitted.items():
+        field = fields_by_key.get(key)
         if not field:
             continue
 
-        value = "" if raw_value is None else str(raw_value).strip()
         if value:
-            LeadCustomFieldValue.objects.update_or_create(
-                lead=lead,
-                field=field,
-                defaults={"value": value},
-            )
+            to_upsert.append(LeadCustomFieldValue(lead=lead, field=field, value=value))
+            custom_fields[key] = value
         else:
-            LeadCustomFieldValue.objects.filter(lead=lead, field=field).delete()
+            cleared_field_ids.append(field.id)
+            custom_fields.pop(key, None)
+
+    if to_upsert:
+        LeadCustomFieldValue.objects.bulk_create(
+            to_upsert,
+            update_conflicts=True,
+            unique_fields=["lead", "field"],
+            update_fields=["value", "modified_at"],
+        )
+
+    if cleared_field_ids:
+        LeadCustomFieldValue.objects.filter(
+            lead=lead,
+            field_id__in=cleared_field_ids,
+        ).delete()
+
+    _sync_custom_fields_column(lead, custom_fields)
+
+
+def _sync_custom_fields_column(lead, custom_fields):
+    if custom_fields == (lead.custom_fields or {}):
+        return
+
+    Lead.objects.filter(pk=lead.pk).update(
+        custom_fields=custom_fields,
+        modified_at=timezone.now(),
+    )
+    lead.custom_fields = custom_fields
+
+
+def custom_field_filters_from_params(query_params):
+    """
+    Collect `cf.<field_key>=value` query params into a dict usable as
+    `custom_fields__contains`.
+    """
+    filters = {}
+
+    for param, value in query_params.items():
+        if not param.startswith("cf."):
+            continue
+
+        key = param[3:].strip()
+        if not key:
+            raise ValidationError({param: "Custom field key is required"})
+
+        filters[key] = str(value).strip()
+
+    return filters
 
 
 # =====================================================
 # PHONE VALIDATION
 # =====================================================
 def _validate_phone(value):
+    # Same rules as the normalized contact_no_e164 column
+    return validate_phone(value)
 
-    if value is None:
+
+# =====================================================
+# CALLER LOOKUP (E.164)
+# =====================================================
+def find_lead_by_phone(number, clinic_id=None):
+    """
+    Resolve the lead behind an inbound call / message.
+
+    Matches the normalized contact_no first, then contact_phone;
+    both are exact hits on the (phone_e164, clinic) indexes.
+    Most recently created lead wins when a number is shared.
+    """
+    e164 = to_e164(number)
+    if not e164:
         return None
 
-    value = str(value).strip()
+    queryset = Lead.objects.all()
+    if clinic_id:
+        queryset = queryset.filter(clinic_id=clinic_id)
+
+    return (
+        queryset.filter(contact_no_e164=e164).order_by("-created_at").first()
+        or queryset.filter(contact_phone_e164=e164).order_by("-created_at").first()
+    )
 
-    if value == "" or value.lower() in ["null", "none"]:
-        return None
 
-    if value in ["0", "00", "000", "0000000000"]:
+# =====================================================
+# EMAIL LOOKUP (CASE-INSENSITIVE)
+# Compares Lower("email") so lookups hit the functional
+# (lower(email), clinic) indexes; `email__iexact` compiles to
+# UPPER(...) and cannot use them.
+# =====================================================
+def normalize_email(value):
+    """'Jane <Jane@Example.com> ' -> 'jane@example.com' (None if not an address)."""
+    _, address = parseaddr(str(value or ""))
+    address = address.strip().lower()
+    return address if "@" in address else None
+
+
+def filter_by_email(queryset, email):
+    return queryset.alias(email_lower=Lower("email")).filter(
+        email_lower=normalize_email(email)
+    )
+
+
+def clinic_ids_for_inbound_address(to_email):
+    """Clinics whose mailbox appears in an inbound message's To header."""
+    addresses = {
+        normalize_email(address)
+        for _, address in getaddresses([str(to_email or "")])
+    } - {None}
+
+    if not addresses:
+        return []
+
+    return list(
+        Clinic.objects.alias(email_lower=Lower("email"))
+        .filter(email_lower__in=addresses)
+        .values_list("id", flat=True)
+    )
+
+
+def find_lead_by_email(email, clinic_ids=None):
+    if not normalize_email(email):
         return None
 
-    value = value.replace(" ", "")
+    queryset = Lead.objects.all()
+    if clinic_ids:
+        queryset = queryset.filter(clinic_id__in=clinic_ids)
+
+    return filter_by_email(queryset, email).order_by("-created_at").first()
+
 
-    # INTERNATIONAL
-    if value.startswith("+"):
-        digits = value[1:]
+# =====================================================
+# DUPLICATE DETECTION
+# Every probe is an exact hit on an indexed column:
+# (contact_*_e164, clinic), (lower(email), clinic) and,
+# optionally, the full_name trigram GIN index.
+# =====================================================
+LEAD_DEDUPE_NAME_SIMILARITY = 0.8
+
+# Blank fields on the surviving lead that a duplicate may fill in
+LEAD_MERGE_FILL_FIELDS = (
+    "email",
+    "contact_no",
+    "contact_phone",
+    "age",
+    "gender",
+    "marital_status",
+    "language_preference",
+    "location",
+    "address",
+    "contact_full_name",
+    "contact_designation",
+    "contact_email",
+    "sub_source",
+    "campaign",
+    "referral_department",
+    "referral_source",
+)
 
-        if not digits.isdigit():
-            raise ValidationError({"contact_no": "Invalid international phone number"})
 
-        if len(digits) < 7 or len(digits) > 15:
-            raise ValidationError({"contact_no": "Invalid international phone number"})
+def find_duplicate_lead(clinic, contact_no=None, email=None, full_name=None, exclude_ids=()):
+    """
+    Oldest live lead of `clinic` sharing a normalized phone or email,
+    or (when the clinic enables it) a near-identical name.
+    Returns (lead, matched_on) or (None, None).
+    """
+    candidates = Lead.objects.filter(
+        clinic=clinic,
+        is_deleted=False,
+        duplicate_of__isnull=True,
+    ).exclude(id__in=list(exclude_ids)).order_by("created_at")
+
+    e164 = to_e164(contact_no)
+    if e164:
+        lead = (
+            candidates.filter(contact_no_e164=e164).first()
+            or candidates.filter(contact_phone_e164=e164).first()
+        )
+        if lead:
+            return lead, "phone"
+
+    if normalize_email(email):
+        lead = filter_by_email(candidates, email).first()
+        if lead:
+            return lead, "email"
+
+    name = str(full_name or "").strip()
+    if name and clinic.lead_dedupe_match_name:
+        # `%` prefilter uses the trigram index; the threshold is stricter
+        lead = (
+            candidates.filter(full_name__trigram_similar=name)
+            .annotate(name_similarity=TrigramSimilarity("full_name", name))
+            .filter(name_similarity__gte=LEAD_DEDUPE_NAME_SIMILARITY)
+            .order_by("-name_similarity", "created_at")
+            .first()
+        )
+        if lead:
+            return lead, "name"
 
-        return value
+    return None, None
 
-    # INDIA
-    if value.startswith("+91"):
-        value = value[3:]
-    elif value.startswith("91") and len(value) == 12:
-        value = value[2:]
 
-    if not value.isdigit():
-        raise ValidationError({"contact_no": "Phone must contain digits only"})
+def fill_blank_lead_fields(lead, values):
+    """
+    Copy LEAD_MERGE_FILL_FIELDS from `values` onto `lead` where the lead
+    has no value yet (in memory only). Returns the changed field names.
+    """
+    changed = []
 
-    if not (7 <= len(value) <= 15):
-        raise ValidationError({"contact_no": "Phone number must be between 7 and 15 digits"})
+    for name in LEAD_MERGE_FILL_FIELDS:
+        incoming = values.get(name)
+        attname = Lead._meta.get_field(name).attname
 
-    invalid_numbers = {
-        "1111111111","2222222222","3333333333","4444444444",
-        "5555555555","6666666666","7777777777","8888888888",
-        "9999999999","1234567890","0123456789"
-    }
+        if incoming in (None, "") or getattr(lead, attname) not in (None, ""):
+            continue
 
-    if value in invalid_numbers:
-        raise ValidationError({"contact_no": "Invalid phone number"})
+        setattr(lead, name, incoming)
+        changed.append(name)
 
-    return value
+    return changed
+
+
+def merge_into_lead(lead, values, updated_by_id=None, updated_by_name=None, record_interaction=True):
+    """
+    Fill blank LEAD_MERGE_FILL_FIELDS on `lead` from `values` (never
+    overwrites) and count the re-inquiry as an interaction.
+    With record_interaction=False (batch cleanup) only the blanks are
+    filled: last_interaction_at and updated_by_* are left alone.
+    Returns the names of the fields that changed.
+    """
+    changed = fill_blank_lead_fields(lead, values)
+
+    if not record_interaction:
+        if changed:
+            lead.save(update_fields=changed)
+        return changed
+
+    lead.last_interaction_at = timezone.now()
+    lead.updated_by_id = updated_by_id
+    lead.updated_by_name = updated_by_name
+
+    lead.save(update_fields=[*changed, "last_interaction_at", "updated_by_id", "updated_by_name"])
+
+    return changed
 
 
 # =====================================================
@@ -337,10 +968,14 @@ def create_lead(validated_data, request=None):
                 is_active=True
             ).first()
 
-        referral_source = ReferralSource.objects.filter(
-            email=email,
-            clinic=clinic
-        ).first()
+        referral_source = (
+            filter_by_email(
+                ReferralSource.objects.filter(clinic=clinic),
+                email
+            ).first()
+            if normalize_email(email)
+            else None
+        )
 
         if not referral_source:
 
@@ -385,21 +1020,73 @@ def create_lead(validated_data, request=None):
     validated_data.pop("referral_department_id", None)
     validated_data.pop("referral_source_id", None)
 
+    # =====================================================
+    # DUPLICATE DETECTION (per-clinic policy)
+    # =====================================================
+    policy = clinic.lead_dedupe_policy
+    existing, matched_on = None, None
+
+    if policy != Clinic.LeadDedupePolicy.OFF:
+        existing, matched_on = find_duplicate_lead(
+            clinic,
+            contact_no=validated_data.get("contact_no"),
+            email=validated_data.get("email"),
+            full_name=validated_data.get("full_name"),
+        )
+
+    if existing and policy == Clinic.LeadDedupePolicy.REJECT:
+        raise ValidationError({
+            "duplicate": {"lead_id": str(existing.id), "matched_on": matched_on}
+        })
+
+    merged = existing is not None and policy == Clinic.LeadDedupePolicy.MERGE
+
+    if merged:
+        lead = existing
+
+        merge_into_lead(
+            lead,
+            {
+                **validated_data,
+                "campaign": campaign,
+                "referral_department": referral_department,
+                "referral_source": referral_source,
+            },
+            created_by_id,
+            created_by_name,
+        )
+
+        # Never overwrite answers the original lead already has
+        if isinstance(custom_field_values, dict):
+            custom_field_values = {
+                key: value
+                for key, value in custom_field_values.items()
+                if key not in (lead.custom_fields or {})
+            }
+
     # =====================================================
     # CREATE LEAD
     # =====================================================
-    lead = Lead.objects.create(
-        clinic=clinic,
-        department=department,
-        campaign=campaign,
-        stage=stage,
-        assigned_to_id=assigned_to_id,
-        assigned_to_name=assigned_to_name,
-        created_by_id=created_by_id,
-        created_by_name=created_by_name,
-        referral_department=referral_department,
-        referral_source=referral_source,
-        **validated_data
+    else:
+        lead = Lead.objects.create(
+            clinic=clinic,
+            department=department,
+            campaign=campaign,
+            stage=stage,
+            assigned_to_id=assigned_to_id,
+            assigned_to_name=assigned_to_name,
+            created_by_id=created_by_id,
+            created_by_name=created_by_name,
+            referral_department=referral_department,
+            referral_source=referral_source,
+            duplicate_of=existing,
+            **validated_data
+        )
+
+    # Lets callers tell a merge / attach apart from a fresh lead
+    lead.dedupe_match = (
+        {"policy": policy, "matched_on": matched_on, "lead_id": str(existing.id)}
+        if existing else None
     )
 
     # =====================================================
@@ -424,7 +1111,10 @@ def create_lead(validated_data, request=None):
             missing = [x for x in flat_ids if x not in found_ids]
             logger.warning(f"[CREATE] Some interest IDs not found: {missing}")
 
-        lead.treatment_interest.set(interests)
+        if merged:
+            lead.treatment_interest.add(*interests)
+        else:
+            lead.treatment_interest.set(interests)
 
     # =====================================================
     # SAVE DOCUMENTS
@@ -717,6 +1407,224 @@ def update_lead(instance, validated_data, request=None):
     return instance
 
 
+# =====================================================
+# BULK ACTIONS
+# One SELECT for the target ids, then set-based UPDATEs.
+# queryset.update() bypasses Lead.save(), so modified_at,
+# the stage -> lead_status default and conversion tracking
+# are applied in SQL here.
+# =====================================================
+LEAD_BULK_ACTIONS = ("assign", "move_stage", "change_status", "soft_delete")
+LEAD_BULK_MAX_LEADS = 5000
+
+# Keys a bulk `filter` object may use, besides cf.<field_key>
+LEAD_BULK_FILTER_KEYS = ("lead_status", "assigned_to", "quality")
+
+
+def validate_lead_bulk_filter(filters):
+    """
+    Reject unknown or empty filter keys: the list filters ignore both,
+    so a typo would otherwise target every visible lead.
+    """
+    if not isinstance(filters, dict):
+        raise ValidationError({"filter": "Expected an object"})
+
+    unknown = sorted(
+        key for key in filters
+        if key not in LEAD_BULK_FILTER_KEYS and not str(key).startswith("cf.")
+    )
+    if unknown:
+        raise ValidationError({
+            "filter": f"Unsupported key(s): {', '.join(unknown)}. "
+            f"Allowed: {', '.join(LEAD_BULK_FILTER_KEYS)}, cf.<field_key>"
+        })
+
+    empty = sorted(
+        key for key, value in filters.items()
+        if value is None or str(value).strip() == ""
+    )
+    if empty:
+        raise ValidationError({"filter": f"Empty value for: {', '.join(empty)}"})
+
+
+def bulk_update_leads(queryset, clinic, action, payload, request=None):
+    """
+    Apply a bulk action to every lead in `queryset`, which the caller
+    has already scoped to the clinic and the user's visibility.
+
+    Returns (summary, converted_lead_ids); the latter lists leads that
+    changed_status moved into "converted" so the caller can run the
+    external patient sync for them.
+    """
+    if action not in LEAD_BULK_ACTIONS:
+        raise ValidationError({"action": f"Must be one of: {', '.join(LEAD_BULK_ACTIONS)}"})
+
+    lead_ids = list(queryset.values_list("id", flat=True)[:LEAD_BULK_MAX_LEADS + 1])
+
+    if len(lead_ids) > LEAD_BULK_MAX_LEADS:
+        raise ValidationError({
+            "lead_ids": f"At most {LEAD_BULK_MAX_LEADS} leads per request, narrow the selection"
+        })
+
+    now = timezone.now()
+    updated_by_id, updated_by_name = _get_user_info(request)
+
+    common = {
+        "modified_at": now,
+        "updated_by_id": updated_by_id,
+        "updated_by_name": updated_by_name,
+    }
+
+    targets = Lead.objects.filter(id__in=lead_ids)
+    converted_ids = []
+    notification = {}
+
+    with transaction.atomic():
+
+        # =====================================================
+        # ASSIGN
+        # =====================================================
+        if action == "assign":
+            employee = Employee.objects.filter(
+                id=payload.get("assigned_to_id") or None,
+                clinic=clinic,
+            ).only("id", "emp_name").first()
+
+            if not employee:
+                raise ValidationError({"assigned_to_id": "Invalid employee for this clinic"})
+
+            updated = targets.exclude(assigned_to_id=employee.id).update(
+                assigned_to_id=employee.id,
+                assigned_to_name=employee.emp_name,
+                **common
+            )
+            notification["assigned_to_id"] = employee.id
+
+        # =====================================================
+        # MOVE STAGE (same conversion rule as Lead.save())
+        # =====================================================
+        elif action == "move_stage":
+            stage = PipelineStage.objects.filter(
+                id=payload.get("stage_id") or None,
+                is_active=True,
+                is_deleted=False,
+                pipeline__clinic=clinic,
+            ).first()
+
+            if not stage:
+                raise ValidationError({"stage_id": "Invalid stage"})
+
+            changes = {
+                "stage": stage,
+                "lead_status": Case(
+                    When(
+                        Q(lead_status__isnull=True) | Q(lead_status=""),
+                        then=Value(stage.stage_name),
+                    ),
+                    default=F("lead_status"),
+                ),
+            }
+
+            # First move into a conversion stage from another stage records
+            # when and from where. SET expressions read the pre-update row,
+            # so F("stage") is the old stage.
+            if stage.is_conversion_stage:
+                had_stage = Q(stage__isnull=False)
+
+                changes["converted_at"] = Case(
+                    When(had_stage, then=Coalesce("converted_at", Value(now, output_field=DateTimeField()))),
+                    default=F("converted_at"),
+                )
+                changes["converted_at_stage_id"] = Case(
+                    When(had_stage, then=Coalesce("converted_at_stage_id", "stage_id")),
+                    default=F("converted_at_stage_id"),
+                )
+
+            moved = list(targets.exclude(stage=stage).values_list("id", "stage_id"))
+
+            updated = Lead.objects.filter(
+                id__in=[lead_id for lead_id, _ in moved]
+            ).update(**changes, **common)
+
+            record_stage_transitions(
+                ((lead_id, from_stage_id, stage.id) for lead_id, from_stage_id in moved),
+                updated_by_id, updated_by_name, at=now,
+            )
+            notification["stage_id"] = str(stage.id)
+
+        # =====================================================
+        # CHANGE STATUS (same conversion rule as update_lead)
+        # =====================================================
+        elif action == "change_status":
+            new_status = str(payload.get("lead_status") or "").strip().lower()
+
+            if not new_status:
+                raise ValidationError({"lead_status": "This field is required"})
+
+            if new_status == "converted":
+                to_convert = targets.exclude(lead_status__iexact="converted")
+                stage_before = dict(to_convert.values_list("id", "stage_id"))
+                converted_ids = list(stage_before)
+
+                conversion_stage = PipelineStage.objects.filter(
+                    pipeline__stages=OuterRef("stage_id"),
+                    is_conversion_stage=True,
+                    is_active=True,
+                    is_deleted=False,
+                ).order_by("stage_order").values("id")[:1]
+
+                updated = Lead.objects.filter(id__in=converted_ids).update(
+                    converted_at_stage_id=F("stage_id"),
+                    converted_at_status=F("lead_status"),
+                    converted_at=now,
+                    stage_id=Coalesce(Subquery(conversion_stage), F("stage_id")),
+                    lead_status=new_status,
+                    **common
+                )
+
+                record_stage_transitions(
+                    (
+                        (lead_id, stage_before[lead_id], stage_id)
+                        for lead_id, stage_id in Lead.objects.filter(
+                            id__in=converted_ids
+                        ).values_list("id", "stage_id")
+                    ),
+                    updated_by_id, updated_by_name, at=now,
+                )
+            else:
+                updated = targets.exclude(lead_status=new_status).update(
+                    lead_status=new_status,
+                    **common
+                )
+
+            notification["lead_status"] = new_status
+
+        # =====================================================
+        # SOFT DELETE
+        # =====================================================
+        else:
+            updated = targets.update(is_deleted=True, is_active=False, **common)
+
+        summary = {
+            "action": action,
+            "matched": len(lead_ids),
+            "updated": updated,
+        }
+
+        # One downstream event per bulk request, sent once the rows are committed
+        event = {
+            "event": "leads_bulk_updated",
+            "clinic_id": clinic.id,
+            "lead_ids": [str(lead_id) for lead_id in lead_ids],
+            **summary,
+            **notification,
+        }
+        if updated:
+            transaction.on_commit(lambda: send_to_zapier(event))
+
+    return summary, converted_ids
+
+
 # =====================================================
 # EMAIL HELPERS
 # =====================================================
@@ -0,0 +1,186 @@
+"""
+restapi/services/lead_timeline_service.py
+
+One lead's activity (calls, SMS, WhatsApp, emails, notes and stage
+moves) as a single UNION ALL over narrow projections, newest first,
+keyset-paginated on (occurred_at, kind, id).
+
+Every branch projects the same columns (TIMELINE_COLUMNS) and applies
+the cursor itself, so the database only reads the rows it returns.
+"""
+
+import base64
+import json
+
+from django.db import connection
+from django.db.models import CharField, DateTimeField, F, Q, Value
+from django.db.models.functions import Cast, Coalesce, Substr
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from restapi.models import (
+    LeadEmail,
+    LeadNote,
+    LeadStageTransition,
+    TwilioCall,
+    TwilioMessage,
+    WhatsAppMessage,
+)
+
+TIMELINE_DEFAULT_PAGE_SIZE = 25
+TIMELINE_MAX_PAGE_SIZE = 100
+TIMELINE_PREVIEW_LENGTH = 280
+
+TIMELINE_COLUMNS = ("kind", "item_id", "occurred_at", "item_status", "summary", "detail")
+TIMELINE_ORDERING = ("-occurred_at", "-kind", "-item_id")
+
+
+def _text(value):
+    return Value(value, output_field=CharField())
+
+
+def _preview(field):
+    return Substr(field, 1, TIMELINE_PREVIEW_LENGTH)
+
+
+# kind -> (queryset for one lead, projection of TIMELINE_COLUMNS)
+def _timeline_branches(lead):
+    return {
+        "call": (
+            TwilioCall.objects.filter(lead=lead),
+            {
+                "occurred_at": F("created_at"),
+                "item_status": F("status"),
+                "summary": F("from_number"),
+                "detail": Cast("call_duration", CharField()),
+            },
+        ),
+        "sms": (
+            TwilioMessage.objects.filter(lead=lead),
+            {
+                "occurred_at": F("created_at"),
+                "item_status": F("status"),
+                "summary": _preview("body"),
+                "detail": F("direction"),
+            },
+        ),
+        "whatsapp": (
+            WhatsAppMessage.objects.filter(lead=lead),
+            {
+                "occurred_at": F("created_at"),
+                "item_status": F("status"),
+                "summary": F("template_name"),
+                "detail": F("to_number"),
+            },
+        ),
+        "email": (
+            LeadEmail.objects.filter(lead=lead, is_active=True),
+            {
+                "occurred_at": Coalesce("sent_at", "created_at", output_field=DateTimeField()),
+                "item_status": F("status"),
+                "summary": F("subject"),
+                "detail": F("sender_email"),
+            },
+        ),
+        "note": (
+            LeadNote.objects.filter(lead=lead, is_deleted=False),
+            {
+                "occurred_at": F("created_at"),
+                "item_status": _text(None),
+                "summary": F("title"),
+                "detail": _preview("note"),
+            },
+        ),
+        "stage": (
+            LeadStageTransition.objects.filter(lead=lead),
+            {
+                "occurred_at": F("at"),
+                "item_status": F("actor_name"),
+                "summary": F("to_stage__stage_name"),
+                "detail": F("from_stage__stage_name"),
+            },
+        ),
+    }
+
+
+# =====================================================
+# CURSOR
+# =====================================================
+def encode_timeline_cursor(row):
+    payload = json.dumps(
+        [row["occurred_at"].isoformat(), row["kind"], row["item_id"]],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_timeline_cursor(token):
+    try:
+        occurred_at, kind, item_id = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+        occurred_at = parse_datetime(occurred_at)
+
+        if occurred_at is None:
+            raise ValueError("bad timestamp")
+    except Exception:
+        raise ValidationError({"cursor": "Invalid cursor"})
+
+    return occurred_at, str(kind), str(item_id)
+
+
+def _older_than(kind, cursor):
+    """
+    (occurred_at, kind, id) < cursor for one branch. kind is constant
+    within a branch, so its comparison is settled here in Python.
+    """
+    occurred_at, cursor_kind, cursor_id = cursor
+
+    if kind < cursor_kind:
+        return Q(occurred_at__lte=occurred_at)
+
+    if kind > cursor_kind:
+        return Q(occurred_at__lt=occurred_at)
+
+    return Q(occurred_at__lt=occurred_at) | Q(occurred_at=occurred_at, item_id__lt=cursor_id)
+
+
+# =====================================================
+# PAGE
+# =====================================================
+def get_lead_timeline(lead, cursor=None, page_size=TIMELINE_DEFAULT_PAGE_SIZE):
+    """
+    Returns (rows, next_cursor). Rows are dicts keyed by
+    TIMELINE_COLUMNS, newest first.
+    """
+    decoded = decode_timeline_cursor(cursor) if cursor else None
+    limit = page_size + 1
+
+    # Postgres can LIMIT each branch, so no branch reads more than a page
+    limit_branches = connection.features.supports_slicing_ordering_in_compound
+
+    branches = []
+    for kind, (queryset, projection) in _timeline_branches(lead).items():
+        branch = queryset.annotate(
+            kind=_text(kind),
+            item_id=Cast("id", CharField()),
+            **projection,
+        )
+
+        if decoded:
+            branch = branch.filter(_older_than(kind, decoded))
+
+        branch = branch.order_by().values(*TIMELINE_COLUMNS)
+
+        if limit_branches:
+            branch = branch.order_by(*TIMELINE_ORDERING)[:limit]
+
+        branches.append(branch)
+
+    first, *rest = branches
+    rows = list(first.union(*rest, all=True).order_by(*TIMELINE_ORDERING)[:limit])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_timeline_cursor(rows[-1])
+
+    return rows, next_cursor
@@ -0,0 +1,274 @@
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Max, OuterRef, Subquery
+from django.utils import timezone
+
+from restapi.models import (
+    LeadStageDailyRollup,
+    LeadStageTransition,
+    PipelineStage,
+)
+
+
+# =====================================================
+# TIME-IN-STAGE HISTOGRAM
+# Upper bounds (seconds) of each bucket; None = open-ended.
+# Rollups store counts per bucket so median / p90 can be
+# estimated over any date range without reading raw rows.
+# =====================================================
+HOUR = 3600
+DAY = 24 * HOUR
+
+STAGE_DURATION_BUCKETS = (
+    HOUR,
+    4 * HOUR,
+    12 * HOUR,
+    DAY,
+    2 * DAY,
+    3 * DAY,
+    5 * DAY,
+    7 * DAY,
+    14 * DAY,
+    30 * DAY,
+    60 * DAY,
+    90 * DAY,
+    None,
+)
+
+
+def _bucket_index(seconds):
+    for index, upper in enumerate(STAGE_DURATION_BUCKETS):
+        if upper is None or seconds < upper:
+            return index
+
+
+def histogram_percentile(histogram, fraction):
+    """
+    Estimate a percentile (0-1) from bucket counts, interpolating
+    linearly inside the bucket that holds it. None when empty.
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+
+    target = fraction * total
+    cumulative = 0
+    lower = 0
+
+    for count, upper in zip(histogram, STAGE_DURATION_BUCKETS):
+        if count and cumulative + count >= target:
+            if upper is None:
+                return lower
+            return round(lower + (upper - lower) * (target - cumulative) / count)
+
+        cumulative += count
+        if upper is not None:
+            lower = upper
+
+    return lower
+
+
+# =====================================================
+# WRITE: BULK PATHS
+# Lead.save() records its own transition; set-based
+# updates call this with the moves they made.
+# =====================================================
+def record_stage_transitions(moves, actor_id=None, actor_name=None, at=None):
+    """
+    `moves` is an iterable of (lead_id, from_stage_id, to_stage_id).
+    Unchanged or stage-less moves are skipped.
+    """
+    moves = [
+        (lead_id, from_stage_id, to_stage_id)
+        for lead_id, from_stage_id, to_stage_id in moves
+        if to_stage_id and to_stage_id != from_stage_id
+    ]
+
+    if not moves:
+        return []
+
+    at = at or timezone.now()
+
+    pipeline_ids = dict(
+        PipelineStage.objects.filter(
+            id__in={to_stage_id for _, _, to_stage_id in moves}
+        ).values_list("id", "pipeline_id")
+    )
+
+    return LeadStageTransition.objects.bulk_create([
+        LeadStageTransition(
+            lead_id=lead_id,
+            pipeline_id=pipeline_ids[to_stage_id],
+            from_stage_id=from_stage_id,
+            to_stage_id=to_stage_id,
+            actor_id=actor_id,
+            actor_name=actor_name,
+            at=at,
+        )
+        for lead_id, from_stage_id, to_stage_id in moves
+    ], batch_size=1000)
+
+
+# =====================================================
+# DAILY ROLLUP
+# =====================================================
+def rollup_stage_transitions(day, pipeline_id=None):
+    """
+    Rebuild LeadStageDailyRollup rows for one day (UTC). Idempotent:
+    the day's rows are replaced, so it is safe to re-run for today.
+
+    Time in stage is the gap to the lead's previous transition,
+    found through the (lead, at) index.
+    """
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    end = start + timedelta(days=1)
+
+    transitions = LeadStageTransition.objects.filter(at__gte=start, at__lt=end)
+    rollups = LeadStageDailyRollup.objects.filter(day=day)
+
+    if pipeline_id:
+        transitions = transitions.filter(pipeline_id=pipeline_id)
+        rollups = rollups.filter(pipeline_id=pipeline_id)
+
+    previous_at = LeadStageTransition.objects.filter(
+        lead_id=OuterRef("lead_id"),
+        at__lt=OuterRef("at"),
+    ).order_by("-at").values("at")[:1]
+
+    rows = transitions.annotate(previous_at=Subquery(previous_at)).values_list(
+        "pipeline_id", "from_stage_id", "to_stage_id", "at", "previous_at"
+    )
+
+    groups = {}
+
+    for row_pipeline_id, from_stage_id, to_stage_id, at, prev_at in rows.iterator(chunk_size=2000):
+        group = groups.setdefault(
+            (row_pipeline_id, from_stage_id, to_stage_id),
+            {
+                "transitions": 0,
+                "total_seconds": 0,
+                "duration_histogram": [0] * len(STAGE_DURATION_BUCKETS),
+            },
+        )
+        group["transitions"] += 1
+
+        # Creations and moves predating the history have no duration
+        if from_stage_id and prev_at:
+            seconds = max(0, int((at - prev_at).total_seconds()))
+            group["total_seconds"] += seconds
+            group["duration_histogram"][_bucket_index(seconds)] += 1
+
+    with transaction.atomic():
+        rollups.delete()
+
+        LeadStageDailyRollup.objects.bulk_create([
+            LeadStageDailyRollup(
+                pipeline_id=row_pipeline_id,
+                day=day,
+                from_stage_id=from_stage_id,
+                to_stage_id=to_stage_id,
+                **values,
+            )
+            for (row_pipeline_id, from_stage_id, to_stage_id), values in groups.items()
+        ])
+
+    return len(groups)
+
+
+# =====================================================
+# READ: STAGE ANALYTICS
+# =====================================================
+def _rate(part, whole):
+    return round((part / whole) * 100, 2) if whole else 0
+
+
+def get_stage_analytics(pipeline, from_date, to_date):
+    """
+    Time-in-stage (avg / median / p90 seconds) and stage-to-stage
+    conversion for one pipeline, computed from daily rollups only.
+
+    conversion_rate is the share of leads entering a stage that later
+    moved to a stage further down the pipeline within the range.
+    """
+    stages = list(
+        PipelineStage.objects.filter(pipeline=pipeline, is_deleted=False)
+        .order_by("stage_order")
+    )
+    stage_order = {stage.id: stage.stage_order for stage in stages}
+
+    rollups = LeadStageDailyRollup.objects.filter(
+        pipeline=pipeline,
+        day__range=(from_date, to_date),
+    )
+
+    metrics = {
+        stage.id: {
+            "entered": 0,
+            "exited": 0,
+            "advanced": 0,
+            "total_seconds": 0,
+            "histogram": [0] * len(STAGE_DURATION_BUCKETS),
+        }
+        for stage in stages
+    }
+    flows = {}
+
+    for from_stage_id, to_stage_id, count, total_seconds, histogram in rollups.values_list(
+        "from_stage_id", "to_stage_id", "transitions", "total_seconds", "duration_histogram"
+    ):
+        if to_stage_id in metrics:
+            metrics[to_stage_id]["entered"] += count
+
+        if from_stage_id in metrics:
+            stage_metrics = metrics[from_stage_id]
+            stage_metrics["exited"] += count
+            stage_metrics["total_seconds"] += total_seconds
+
+            for index, bucket_count in enumerate(histogram[: len(STAGE_DURATION_BUCKETS)]):
+                stage_metrics["histogram"][index] += bucket_count
+
+            if stage_order.get(to_stage_id, -1) > stage_order[from_stage_id]:
+                stage_metrics["advanced"] += count
+
+            flow_key = (from_stage_id, to_stage_id)
+            flows[flow_key] = flows.get(flow_key, 0) + count
+
+    data = []
+    for stage in stages:
+        stage_metrics = metrics[stage.id]
+        timed = sum(stage_metrics["histogram"])
+
+        data.append({
+            "stage_id": stage.id,
+            "stage_name": stage.stage_name,
+            "stage_order": stage.stage_order,
+            "entered": stage_metrics["entered"],
+            "exited": stage_metrics["exited"],
+            "advanced": stage_metrics["advanced"],
+            "conversion_rate": _rate(stage_metrics["advanced"], stage_metrics["entered"]),
+            "avg_seconds": round(stage_metrics["total_seconds"] / timed) if timed else None,
+            "median_seconds": histogram_percentile(stage_metrics["histogram"], 0.5),
+            "p90_seconds": histogram_percentile(stage_metrics["histogram"], 0.9),
+        })
+
+    last_rollup_day = LeadStageDailyRollup.objects.filter(
+        pipeline=pipeline
+    ).aggregate(day=Max("day"))["day"]
+
+    return {
+        "pipeline_id": pipeline.id,
+        "from_date": from_date,
+        "to_date": to_date,
+        "last_rollup_day": last_rollup_day,
+        "stages": data,
+        "flows": [
+            {
+                "from_stage_id": from_stage_id,
+                "to_stage_id": to_stage_id,
+                "count": count,
+                "rate": _rate(count, metrics[from_stage_id]["exited"]),
+            }
+            for (from_stage_id, to_stage_id), count in flows.items()
+        ],
+    }
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 from restapi.models import (
     UserProfile,
     Role,
@@ -8,7 +9,22 @@ from restapi.models import (
     Lead,
     Ticket,
     TicketTimeline,
+    TwilioCall,
+    TwilioMessage,
+    LeadEmail,
+    RolePermission,
+    UserPermission,
 )
+from restapi.services.lead_service import (
+    INTERACTION_CALL_STATUSES,
+    INTERACTION_SMS_STATUSES,
+    touch_lead_last_interaction,
+)
+from restapi.utils.jwt_authentication import (
+    clear_authenticated_users,
+    evict_authenticated_user,
+)
+from restapi.utils.permissions import bump_permissions_version
 
 
 def _build_display_name(instance: User) -> str:
@@ -40,18 +56,33 @@ def sync_user_display_names(sender, instance, created, **kwargs):
             )
 
         employee_id = employee.id
+        now = timezone.now()
 
-        Lead.objects.filter(assigned_to_id=employee_id).update(
+        # .update() skips auto_now: bump modified_at so delta sync
+        # clients pick up the renamed leads. Unchanged rows are skipped.
+        Lead.objects.filter(assigned_to_id=employee_id).exclude(
             assigned_to_name=display_name,
+        ).update(
+            assigned_to_name=display_name,
+            modified_at=now,
         )
-        Lead.objects.filter(personal_id=employee_id).update(
+        Lead.objects.filter(personal_id=employee_id).exclude(
+            personal_name=display_name,
+        ).update(
             personal_name=display_name,
+            modified_at=now,
         )
-        Lead.objects.filter(created_by_id=employee_id).update(
+        Lead.objects.filter(created_by_id=employee_id).exclude(
             created_by_name=display_name,
+        ).update(
+            created_by_name=display_name,
+            modified_at=now,
         )
-        Lead.objects.filter(updated_by_id=employee_id).update(
+        Lead.objects.filter(updated_by_id=employee_id).exclude(
+            updated_by_name=display_name,
+        ).update(
             updated_by_name=display_name,
+            modified_at=now,
         )
 
         Ticket.objects.filter(assigned_to_id=employee_id).update(
@@ -63,6 +94,73 @@ def sync_user_display_names(sender, instance, created, **kwargs):
         )
 
 
+# =====================================================
+# PERMISSION MATRIX INVALIDATION
+# Cached matrices are keyed by UserProfile.permissions_version;
+# bumping it makes every worker recompile on the next check.
+# =====================================================
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def invalidate_role_permission_matrix(sender, instance, **kwargs):
+    bump_permissions_version(role_id=instance.role_id)
+
+
+@receiver(post_save, sender=UserPermission)
+@receiver(post_delete, sender=UserPermission)
+def invalidate_user_permission_matrix(sender, instance, **kwargs):
+    bump_permissions_version(user_id=instance.user_id)
+
+
+@receiver(pre_save, sender=UserProfile)
+def track_profile_role_change(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+
+    if instance._state.adding or (update_fields is not None and "role" not in update_fields):
+        instance._role_changed = False
+        return
+
+    previous_role_id = (
+        UserProfile.objects.filter(pk=instance.pk).values_list("role_id", flat=True).first()
+    )
+    instance._role_changed = previous_role_id != instance.role_id
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_profile_role_matrix(sender, instance, created, **kwargs):
+    if getattr(instance, "_role_changed", False):
+        bump_permissions_version(pk=instance.pk)
+        instance.refresh_from_db(fields=["permissions_version"])
+        instance._role_changed = False
+
+
+# =====================================================
+# AUTHENTICATED USER CACHE INVALIDATION
+# Evicts this process's cached copy; other workers
+# refresh within JWT_USER_CACHE_TTL_SECONDS.
+# =====================================================
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def evict_cached_user(sender, instance, **kwargs):
+    evict_authenticated_user(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def evict_cached_user_relation(sender, instance, **kwargs):
+    evict_authenticated_user(instance.user_id)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender="restapi.Clinic")
+@receiver(post_delete, sender="restapi.Clinic")
+def clear_cached_users(sender, **kwargs):
+    # Shared by many users; rare enough to drop everything
+    clear_authenticated_users()
+
+
 DEFAULT_REFERRAL_DEPARTMENTS = [
     "Doctors",
     "Corporate HR",
@@ -83,4 +181,27 @@ def seed_referral_departments_for_new_clinic(sender, instance, created, **kwargs
             clinic=instance,
             name=name,
             defaults={"is_active": True},
-        )
\ No newline at end of file
+        )
+
+
+# =====================================================
+# LEAD LAST INTERACTION
+# Status callbacks re-save the same row, so these fire on
+# every transition and pick up the first qualifying one.
+# =====================================================
+@receiver(post_save, sender=TwilioCall)
+def track_call_interaction(sender, instance, **kwargs):
+    if instance.lead_id and instance.status in INTERACTION_CALL_STATUSES:
+        touch_lead_last_interaction(instance.lead_id, instance.created_at)
+
+
+@receiver(post_save, sender=TwilioMessage)
+def track_sms_interaction(sender, instance, **kwargs):
+    if instance.lead_id and instance.status in INTERACTION_SMS_STATUSES:
+        touch_lead_last_interaction(instance.lead_id, instance.created_at)
+
+
+@receiver(post_save, sender=LeadEmail)
+def track_email_interaction(sender, instance, **kwargs):
+    if instance.lead_id and instance.status == "SENT" and instance.sent_at:
+        touch_lead_last_interaction(instance.lead_id, instance.sent_at)
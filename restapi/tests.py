@@ -1,2 +1,25 @@
 from restapi.tests.test_reputation_public_link import *  # noqa: F401,F403
 from restapi.tests.test_lead_visibility import *  # noqa: F401,F403
+from restapi.tests.test_lead_cursor_pagination import *  # noqa: F401,F403
+from restapi.tests.test_lead_quality import *  # noqa: F401,F403
+from restapi.tests.test_lead_list_queries import *  # noqa: F401,F403
+from restapi.tests.test_lead_custom_fields import *  # noqa: F401,F403
+from restapi.tests.test_lead_phone_e164 import *  # noqa: F401,F403
+from restapi.tests.test_lead_email_inbound import *  # noqa: F401,F403
+from restapi.tests.test_lead_import import *  # noqa: F401,F403
+from restapi.tests.test_lead_bulk_actions import *  # noqa: F401,F403
+from restapi.tests.test_lead_export import *  # noqa: F401,F403
+from restapi.tests.test_sparse_fieldsets import *  # noqa: F401,F403
+from restapi.tests.test_pipeline_board import *  # noqa: F401,F403
+from restapi.tests.test_stage_analytics import *  # noqa: F401,F403
+from restapi.tests.test_lead_timeline import *  # noqa: F401,F403
+from restapi.tests.test_lead_changes import *  # noqa: F401,F403
+from restapi.tests.test_lead_dedupe import *  # noqa: F401,F403
+from restapi.tests.test_query_plans import *  # noqa: F401,F403
+from restapi.tests.test_lead_write_payload import *  # noqa: F401,F403
+from restapi.tests.test_permission_matrix import *  # noqa: F401,F403
+from restapi.tests.test_pipeline_stage_rbac import *  # noqa: F401,F403
+from restapi.tests.test_jwt_user_cache import *  # noqa: F401,F403
+from restapi.tests.test_jwt_permission_claims import *  # noqa: F401,F403
+from restapi.tests.test_lead_search import *  # noqa: F401,F403
+from restapi.tests.test_lead_last_interaction import *  # noqa: F401,F403
@@ -0,0 +1,137 @@
+"""
+JWT Permission Claims Tests: trusted while the version matches, DB otherwise
+"""
+
+import shutil
+import tempfile
+
+import jwt
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from restapi.models import Clinic, Role, RolePermission, UserProfile
+from restapi.utils.jwt_authentication import JWTAuthentication, clear_authenticated_users
+from restapi.utils.permissions import (
+    current_permissions_version,
+    has_action_permission_for_labels,
+    has_permission,
+)
+from restapi.views.auth_view import LoginAPIView
+
+
+@override_settings(JWT_PERMISSION_CLAIMS=True)
+class JWTPermissionClaimsTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        clear_authenticated_users()
+
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.role = Role.objects.create(name="Counsellor")
+        self.lead_perm = RolePermission.objects.create(
+            role=self.role, module_key="leads hub", category_key="leads", can_view=True,
+        )
+        RolePermission.objects.create(
+            role=self.role, module_key="pipeline", category_key="stages", can_edit=True,
+        )
+
+        self.user = User.objects.create_user(username="counsellor", password="pass123")
+        UserProfile.objects.filter(user=self.user).update(role=self.role, clinic=self.clinic)
+
+        token, _ = LoginAPIView()._build_access_token(self.user)
+        self.payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        self.request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def _authenticate(self):
+        user, _ = JWTAuthentication().authenticate(self.request)
+        cache.clear()  # only the token may answer without queries
+        return user
+
+    def test_token_carries_claims(self):
+        self.assertEqual(self.payload["rid"], self.role.id)
+        self.assertEqual(self.payload["cid"], self.clinic.id)
+        self.assertEqual(self.payload["pv"], UserProfile.objects.get(user=self.user).permissions_version)
+
+    def test_claims_answer_without_queries(self):
+        user = self._authenticate()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(has_action_permission_for_labels(user, "view", ["leads hub"]))
+            self.assertFalse(has_action_permission_for_labels(user, "edit", ["leads hub"]))
+            self.assertTrue(has_permission(user, "pipeline", "stages", "edit"))
+            self.assertFalse(has_permission(user, "pipeline", "stages", "delete"))
+
+    def test_version_mismatch_falls_back_to_database(self):
+        self.lead_perm.can_edit = True
+        self.lead_perm.save()
+
+        user = self._authenticate()
+        self.assertIsNone(user._permission_claims)
+        self.assertTrue(has_action_permission_for_labels(user, "edit", ["leads hub"]))
+
+    def test_old_token_served_newer_cached_user(self):
+        self.lead_perm.can_edit = True
+        self.lead_perm.save()
+
+        # A fresh login caches the user at the new version
+        token, _ = LoginAPIView()._build_access_token(self.user)
+        JWTAuthentication().authenticate(
+            APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        )
+
+        # The old token costs only the version lookup: no reload, no trust
+        with self.assertNumQueries(1):
+            user, _ = JWTAuthentication().authenticate(self.request)
+
+        self.assertGreater(user.profile.permissions_version, self.payload["pv"])
+        self.assertIsNone(user._permission_claims)
+        self.assertTrue(has_action_permission_for_labels(user, "edit", ["leads hub"]))
+
+    def test_bump_by_another_worker_revokes_claims(self):
+        self.assertIsNotNone(self._authenticate()._permission_claims)
+
+        # Another process bumped the version: no signal reached this
+        # worker's user cache
+        UserProfile.objects.filter(user=self.user).update(
+            permissions_version=F("permissions_version") + 1
+        )
+
+        user = self._authenticate()
+        self.assertIsNone(user._permission_claims)
+        self.assertEqual(user.profile.permissions_version, self.payload["pv"] + 1)
+
+    @override_settings(JWT_PERMISSION_CLAIMS=False)
+    def test_disabled_by_setting(self):
+        token, _ = LoginAPIView()._build_access_token(self.user)
+        self.assertNotIn("pbm", jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"]))
+
+        self.assertIsNone(getattr(self._authenticate(), "_permission_claims", None))
+
+    def test_shared_cache_publishes_bumped_version(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+
+        # Any non-LocMem backend is shared between workers
+        shared = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            }
+        }
+
+        with override_settings(CACHES=shared):
+            version = current_permissions_version(self.user.id)
+
+            with self.assertNumQueries(0):
+                self.assertEqual(current_permissions_version(self.user.id), version)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.lead_perm.can_edit = True
+                self.lead_perm.save()
+
+            with self.assertNumQueries(0):
+                self.assertEqual(current_permissions_version(self.user.id), version + 1)
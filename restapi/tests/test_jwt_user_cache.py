@@ -0,0 +1,58 @@
+"""
+JWT User Cache Tests: one preloaded query, then served from the LRU
+"""
+
+import jwt
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+
+from restapi.models import Clinic, Department, Employee, Role, UserProfile
+from restapi.utils.jwt_authentication import JWTAuthentication, clear_authenticated_users
+
+
+class JWTUserCacheTestCase(TestCase):
+
+    def setUp(self):
+        clear_authenticated_users()
+
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+        role = Role.objects.create(name="Counsellor")
+
+        self.user = User.objects.create_user(username="counsellor", password="pass123")
+        UserProfile.objects.filter(user=self.user).update(role=role, clinic=self.clinic)
+        Employee.objects.create(
+            user=self.user, dep=department, clinic=self.clinic,
+            emp_type="Counsellor", emp_name="counsellor",
+        )
+
+        token = jwt.encode({"sub": str(self.user.id)}, settings.SECRET_KEY, algorithm="HS256")
+        self.request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def _authenticate(self):
+        user, _ = JWTAuthentication().authenticate(self.request)
+        return user, user.profile.role.name, user.profile.clinic.name, user.employee.emp_name
+
+    def test_relations_preloaded_and_cached(self):
+        with self.assertNumQueries(1):
+            first = self._authenticate()
+
+        with self.assertNumQueries(0):
+            second = self._authenticate()
+
+        self.assertEqual(first[1:], ("Counsellor", "Clinic Alpha", "counsellor"))
+        self.assertEqual(second[1:], first[1:])
+
+        # Every request gets its own object
+        self.assertIsNot(first[0], second[0])
+
+    def test_profile_save_evicts(self):
+        self._authenticate()
+
+        profile = UserProfile.objects.get(user=self.user)
+        profile.role = Role.objects.create(name="Viewer")
+        profile.save()
+
+        self.assertEqual(self._authenticate()[1], "Viewer")
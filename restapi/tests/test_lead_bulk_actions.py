@@ -0,0 +1,148 @@
+"""
+Lead Bulk Action Tests: set-based updates keep conversion tracking and scope
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Employee,
+    Lead,
+    Pipeline,
+    PipelineStage,
+    Role,
+    UserProfile,
+)
+
+
+@mock.patch("restapi.services.lead_service.send_to_zapier")
+class LeadBulkActionTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+
+        pipeline = Pipeline.objects.create(
+            clinic=self.clinic, pipeline_name="IVF", industry_type="ivf"
+        )
+        self.new_stage = self._stage(pipeline, "New", 1)
+        self.won_stage = self._stage(pipeline, "Won", 2, is_conversion_stage=True)
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.employee = Employee.objects.create(
+            user=user, dep=self.department, clinic=self.clinic,
+            emp_type="Counsellor", emp_name="Priya",
+        )
+
+        self.leads = [
+            Lead.objects.create(
+                clinic=self.clinic,
+                department=self.department,
+                stage=self.new_stage,
+                lead_status="new",
+                full_name=f"Lead {index}",
+                source="Direct",
+            )
+            for index in range(3)
+        ]
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _stage(self, pipeline, name, order, **extra):
+        return PipelineStage.objects.create(
+            pipeline=pipeline, stage_name=name, stage_type="lead",
+            entry_rule="manual", stage_order=order, **extra
+        )
+
+    def _post(self, body):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"/api/leads/bulk/?clinic_id={self.clinic.id}", body, format="json"
+            )
+        return response
+
+    def _ids(self, leads):
+        return [str(lead.id) for lead in leads]
+
+    def test_assign_by_ids_sends_one_notification(self, zapier):
+        response = self._post({
+            "action": "assign",
+            "lead_ids": self._ids(self.leads[:2]),
+            "assigned_to_id": self.employee.id,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"action": "assign", "matched": 2, "updated": 2})
+        self.assertEqual(
+            Lead.objects.filter(assigned_to_id=self.employee.id, assigned_to_name="Priya").count(), 2
+        )
+        zapier.assert_called_once()
+
+    def test_move_to_conversion_stage_records_conversion(self, zapier):
+        response = self._post({
+            "action": "move_stage",
+            "filter": {"lead_status": "new"},
+            "stage_id": str(self.won_stage.id),
+        })
+
+        self.assertEqual(response.json()["updated"], 3)
+
+        lead = Lead.objects.get(id=self.leads[0].id)
+        self.assertEqual(lead.stage_id, self.won_stage.id)
+        self.assertEqual(lead.converted_at_stage_id, self.new_stage.id)
+        self.assertIsNotNone(lead.converted_at)
+        self.assertGreater(lead.modified_at, self.leads[0].modified_at)
+
+    @mock.patch("restapi.views.lead_views.sync_patient_to_external_system")
+    def test_change_status_to_converted(self, sync, zapier):
+        response = self._post({
+            "action": "change_status",
+            "lead_ids": self._ids(self.leads),
+            "lead_status": "Converted",
+        })
+
+        self.assertEqual(response.json()["updated"], 3)
+        self.assertEqual(sync.call_count, 3)
+
+        lead = Lead.objects.get(id=self.leads[1].id)
+        self.assertEqual(lead.lead_status, "converted")
+        self.assertEqual(lead.converted_at_status, "new")
+        self.assertEqual(lead.converted_at_stage_id, self.new_stage.id)
+        self.assertEqual(lead.stage_id, self.won_stage.id)
+
+    def test_soft_delete_and_validation(self, zapier):
+        response = self._post({"action": "soft_delete", "lead_ids": self._ids(self.leads[:1])})
+        self.assertEqual(response.json()["updated"], 1)
+        self.assertTrue(Lead.objects.get(id=self.leads[0].id).is_deleted)
+
+        # Already deleted leads are out of scope
+        response = self._post({"action": "soft_delete", "lead_ids": self._ids(self.leads[:1])})
+        self.assertEqual(response.json()["matched"], 0)
+
+        response = self._post({"action": "explode", "lead_ids": self._ids(self.leads)})
+        self.assertEqual(response.status_code, 400)
+
+        response = self._post({"action": "soft_delete", "filter": {}})
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_filter_key_is_rejected(self, zapier):
+        # "status" is a typo for "lead_status": must not hit every lead
+        response = self._post({"action": "soft_delete", "filter": {"status": "new"}})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("status", str(response.json()["error"]["filter"]))
+        self.assertFalse(Lead.objects.filter(is_deleted=True).exists())
+
+        response = self._post({"action": "soft_delete", "filter": {"lead_status": ""}})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,79 @@
+"""
+Lead Changes Tests: delta sync tokens, tombstones and modified_at bumps
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from restapi.models import Clinic, Department, Employee, Lead, Role, UserProfile
+
+
+@mock.patch("restapi.views.lead_views.LEAD_CHANGES_SETTLE_SECONDS", 0)
+class LeadChangesTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        self.leads = [
+            Lead.objects.create(
+                clinic=self.clinic,
+                department=self.department,
+                full_name=f"Lead {index}",
+                source="Direct",
+            )
+            for index in range(3)
+        ]
+
+        role = Role.objects.create(name="super_admin")
+        self.user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=self.user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=self.user.id))
+
+    def _changes(self, since=None):
+        params = {"clinic_id": self.clinic.id, "fields": "id,full_name"}
+        if since:
+            params["since"] = since
+
+        response = self.client.get("/api/leads/changes/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_only_changes_after_token(self):
+        initial = self._changes()
+        self.assertEqual(len(initial["leads"]), 3)
+        self.assertFalse(initial["has_more"])
+
+        quiet = self._changes(initial["next_token"])
+        self.assertEqual(quiet["leads"], [])
+        self.assertEqual(quiet["next_token"], initial["next_token"])
+
+        edited, deleted, _ = self.leads
+        edited.full_name = "Renamed"
+        edited.save(update_fields=["full_name"])
+        deleted.is_deleted = True
+        deleted.save(update_fields=["is_deleted"])
+
+        delta = self._changes(initial["next_token"])
+        self.assertEqual([lead["full_name"] for lead in delta["leads"]], ["Renamed"])
+        self.assertEqual([item["id"] for item in delta["deleted"]], [deleted.id])
+
+    def test_signal_rename_bumps_modified_at(self):
+        employee = Employee.objects.create(
+            user=self.user, dep=self.department, clinic=self.clinic,
+            emp_type="Counsellor", emp_name="sa",
+        )
+        Lead.objects.filter(id=self.leads[0].id).update(assigned_to_id=employee.id)
+
+        token = self._changes()["next_token"]
+
+        self.user.first_name = "Priya"
+        self.user.save()
+
+        delta = self._changes(token)
+        self.assertEqual([lead["id"] for lead in delta["leads"]], [str(self.leads[0].id)])
@@ -0,0 +1,84 @@
+"""
+Lead Cursor Pagination Tests: keyset pages over (created_at, id)
+
+- Walking forward visits every lead exactly once, newest first
+- Walking backward from a later page returns the previous page
+- Tampered cursors are rejected
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from restapi.models import Clinic, Department, Lead
+from restapi.pagination import KeysetCursorPagination
+
+
+class LeadCursorPaginationTestCase(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+
+        base = timezone.now()
+        for index in range(7):
+            lead = Lead.objects.create(
+                clinic=self.clinic,
+                department=self.department,
+                full_name=f"Lead {index}",
+                source="Direct",
+            )
+            # Two leads share a timestamp so the id tiebreaker is exercised.
+            Lead.objects.filter(id=lead.id).update(
+                created_at=base - timedelta(minutes=min(index, 5))
+            )
+
+        self.queryset = Lead.objects.filter(clinic=self.clinic)
+
+    def _page(self, **params):
+        request = Request(self.factory.get("/api/leads/list/", params))
+        paginator = KeysetCursorPagination()
+        rows = paginator.paginate_queryset(self.queryset, request)
+        return paginator, rows
+
+    def test_forward_walk_visits_every_lead_once(self):
+        seen = []
+        paginator, rows = self._page(page_size=3)
+        seen.extend(rows)
+
+        while paginator.next_cursor:
+            paginator, rows = self._page(page_size=3, cursor=paginator.next_cursor)
+            seen.extend(rows)
+
+        expected = list(self.queryset.order_by("-created_at", "-id"))
+        self.assertEqual([lead.id for lead in seen], [lead.id for lead in expected])
+
+    def test_first_page_has_no_prev_cursor(self):
+        paginator, _ = self._page(page_size=3)
+        self.assertIsNone(paginator.prev_cursor)
+        self.assertIsNotNone(paginator.next_cursor)
+
+    def test_prev_cursor_returns_previous_page(self):
+        first, first_rows = self._page(page_size=3)
+        second, _ = self._page(page_size=3, cursor=first.next_cursor)
+        _, back_rows = self._page(page_size=3, cursor=second.prev_cursor)
+
+        self.assertEqual(
+            [lead.id for lead in back_rows],
+            [lead.id for lead in first_rows],
+        )
+
+    def test_page_size_is_bounded(self):
+        paginator, _ = self._page(page_size=10_000)
+        self.assertEqual(paginator.current_page_size, KeysetCursorPagination.max_page_size)
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self._page(cursor="not-a-cursor")
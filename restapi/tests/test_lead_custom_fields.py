@@ -0,0 +1,74 @@
+"""
+Lead Custom Field Tests: bulk save and the denormalized custom_fields map
+
+- Saving values costs a fixed number of queries regardless of form size
+- Cleared values are deleted and removed from Lead.custom_fields
+- Unknown, inactive and model-backed keys are ignored
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from restapi.models import Clinic, Department, Lead, LeadCustomFieldValue, LeadFormField
+from restapi.services.lead_service import _save_custom_field_values
+
+
+class LeadCustomFieldSaveTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+        self.lead = Lead.objects.create(
+            clinic=self.clinic,
+            department=self.department,
+            full_name="Lead 1",
+            source="Direct",
+        )
+
+        for index in range(30):
+            LeadFormField.objects.create(field_key=f"q{index}", field_label=f"Q{index}")
+
+        LeadFormField.objects.create(field_key="retired", field_label="Retired", is_active=False)
+        LeadFormField.objects.create(field_key="email_alt", field_label="Email", model_field="email")
+
+    def _save(self, values):
+        with CaptureQueriesContext(connection) as queries:
+            _save_custom_field_values(self.lead, values)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_form_size(self):
+        small = self._save({"q0": "a", "q1": "b"})
+
+        self.lead.refresh_from_db()
+        large = self._save({f"q{index}": "c" for index in range(30)})
+
+        self.assertEqual(small, large)
+        self.assertEqual(LeadCustomFieldValue.objects.filter(lead=self.lead).count(), 30)
+
+    def test_upsert_updates_existing_values(self):
+        self._save({"q0": "first"})
+        self._save({"q0": " second "})
+
+        value = LeadCustomFieldValue.objects.get(lead=self.lead, field__field_key="q0")
+        self.assertEqual(value.value, "second")
+
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.custom_fields, {"q0": "second"})
+
+    def test_cleared_values_are_deleted(self):
+        self._save({"q0": "a", "q1": "b"})
+        self._save({"q0": "", "q1": None})
+
+        self.assertFalse(LeadCustomFieldValue.objects.filter(lead=self.lead).exists())
+
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.custom_fields, {})
+
+    def test_unknown_inactive_and_model_fields_are_ignored(self):
+        self._save({"nope": "x", "retired": "x", "email_alt": "x", "q2": "kept"})
+
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.custom_fields, {"q2": "kept"})
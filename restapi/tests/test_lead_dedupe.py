@@ -0,0 +1,132 @@
+"""
+Lead Dedupe Tests: ingest-time attach / merge / reject and batch merging
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Lead,
+    LeadNote,
+    LeadStageTransition,
+    Pipeline,
+    Role,
+    TwilioCall,
+    UserProfile,
+)
+
+
+@mock.patch("restapi.views.lead_views.send_to_zapier", mock.Mock())
+class LeadDedupeTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        self.original = Lead.objects.create(
+            clinic=self.clinic,
+            department=self.department,
+            full_name="Asha Rao",
+            contact_no="+919876543210",
+            source="Direct",
+        )
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _create(self, policy):
+        Clinic.objects.filter(id=self.clinic.id).update(lead_dedupe_policy=policy)
+
+        return self.client.post(
+            f"/api/leads/?clinic_id={self.clinic.id}",
+            {
+                "department_id": self.department.id,
+                "full_name": "Asha R",
+                "contact_no": "+91 98765 43210",
+                "email": "asha@example.com",
+                "source": "Direct",
+            },
+            format="json",
+        )
+
+    def test_attach_links_new_lead(self):
+        response = self._create(Clinic.LeadDedupePolicy.ATTACH)
+
+        self.assertEqual(response.status_code, 201)
+        lead = Lead.objects.get(id=response.data["id"])
+        self.assertEqual(lead.duplicate_of_id, self.original.id)
+
+    def test_reject(self):
+        response = self._create(Clinic.LeadDedupePolicy.REJECT)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Lead.objects.count(), 1)
+
+    def test_merge_fills_blanks_only(self):
+        response = self._create(Clinic.LeadDedupePolicy.MERGE)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["duplicate"]["matched_on"], "phone")
+        self.assertEqual(Lead.objects.count(), 1)
+
+        self.original.refresh_from_db()
+        self.assertEqual(self.original.full_name, "Asha Rao")
+        self.assertEqual(self.original.email, "asha@example.com")
+
+    def test_batch_merge_moves_related_rows(self):
+        duplicate = Lead.objects.create(
+            clinic=self.clinic,
+            department=self.department,
+            full_name="Asha",
+            contact_no="+919876543210",
+            email="asha@example.com",
+            source="Direct",
+        )
+        LeadNote.objects.create(lead=duplicate, title="Called", note="Interested")
+        transition = LeadStageTransition.objects.create(
+            lead=duplicate,
+            pipeline=Pipeline.objects.create(
+                clinic=self.clinic, pipeline_name="IVF", industry_type="ivf"
+            ),
+        )
+
+        # The survivor is Cold; the duplicate carries a 10-day-old call
+        long_ago = timezone.now() - timedelta(days=60)
+        called_at = timezone.now() - timedelta(days=10)
+        Lead.objects.filter(id=self.original.id).update(
+            created_at=long_ago, last_interaction_at=long_ago, updated_by_name="Priya",
+        )
+        call = TwilioCall.objects.create(
+            lead=duplicate, sid="CA1", from_number="1", to_number="2", status="completed",
+        )
+        TwilioCall.objects.filter(id=call.id).update(created_at=called_at)
+
+        call_command("merge_duplicate_leads", stdout=mock.Mock())
+
+        duplicate.refresh_from_db()
+        self.original.refresh_from_db()
+        self.assertTrue(duplicate.is_deleted)
+        self.assertFalse(duplicate.is_active)
+        self.assertEqual(duplicate.duplicate_of_id, self.original.id)
+        self.assertEqual(self.original.email, "asha@example.com")
+        self.assertEqual(LeadNote.objects.get().lead_id, self.original.id)
+
+        # Stage history stays with the lead it happened to
+        transition.refresh_from_db()
+        self.assertEqual(transition.lead_id, duplicate.id)
+
+        # Inherited interactions count; the cleanup itself does not
+        self.assertEqual(self.original.last_interaction_at, called_at)
+        self.assertEqual(self.original.updated_by_name, "Priya")
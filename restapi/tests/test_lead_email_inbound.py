@@ -0,0 +1,50 @@
+"""
+Lead Email Inbound Tests: replies resolve to the recipient clinic's lead
+"""
+
+from rest_framework.test import APIClient
+from django.test import TestCase
+
+from restapi.models import Clinic, Department, Lead, LeadEmail
+
+
+class LeadEmailInboundTestCase(TestCase):
+
+    def setUp(self):
+        self.alpha = Clinic.objects.create(name="Clinic Alpha", email="desk@alpha.test")
+        self.beta = Clinic.objects.create(name="Clinic Beta", email="desk@beta.test")
+
+        self.alpha_lead = self._lead(self.alpha)
+        self.beta_lead = self._lead(self.beta)
+
+        self.client = APIClient()
+
+    def _lead(self, clinic):
+        department = Department.objects.create(name="IVF", clinic=clinic, is_active=True)
+        return Lead.objects.create(
+            clinic=clinic,
+            department=department,
+            full_name="Jane",
+            email="Jane@Example.com",
+            source="Direct",
+        )
+
+    def _post(self, to_email):
+        return self.client.post(
+            "/api/lead-email/inbound/",
+            {
+                "from_email": "Jane <JANE@example.com>",
+                "to_email": to_email,
+                "subject": "Re: follow up",
+                "body": "Thanks",
+            },
+            format="json",
+        )
+
+    def test_reply_is_saved_on_recipient_clinic_lead(self):
+        for clinic, lead in ((self.alpha, self.alpha_lead), (self.beta, self.beta_lead)):
+            response = self._post(f"Front Desk <{clinic.email.upper()}>")
+
+            self.assertEqual(response.status_code, 200)
+            reply = LeadEmail.objects.filter(status="RECEIVED").latest("id")
+            self.assertEqual(reply.lead_id, lead.id)
@@ -0,0 +1,68 @@
+"""
+Lead Export Tests: streamed CSV / NDJSON honoring the list filters
+"""
+
+import csv
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from restapi.models import Clinic, Department, Lead, Role, UserProfile
+from restapi.services.lead_service import LEAD_EXPORT_COLUMNS
+
+
+class LeadExportTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        for index, status in enumerate(("new", "new", "lost")):
+            Lead.objects.create(
+                clinic=self.clinic,
+                department=department,
+                full_name=f"Lead {index}",
+                lead_status=status,
+                source="Direct",
+            )
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _export(self, **params):
+        response = self.client.get(
+            "/api/leads/export/", {"clinic_id": self.clinic.id, "lead_status": "new", **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_csv_export(self):
+        response, body = self._export()
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(body)))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(list(rows[0]), list(LEAD_EXPORT_COLUMNS))
+        self.assertEqual(rows[0]["department_name"], "IVF")
+        self.assertEqual(rows[0]["quality"], "Hot")
+
+    def test_ndjson_export(self):
+        _, body = self._export(format="ndjson")
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(sorted(row["full_name"] for row in rows), ["Lead 0", "Lead 1"])
+
+    def test_unknown_format(self):
+        response = self.client.get(
+            "/api/leads/export/", {"clinic_id": self.clinic.id, "format": "xml"}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,189 @@
+"""
+Lead Import Tests: batched CSV import through the service and the API
+"""
+
+import io
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from openpyxl import Workbook
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Interest,
+    Lead,
+    LeadCustomFieldValue,
+    LeadFormField,
+    Role,
+    UserProfile,
+)
+from restapi.services.lead_import_service import import_leads, iter_import_rows
+
+CSV = (
+    "Full Name,Phone,Email,Department,Interests,cf.preferred_doctor\n"
+    "Asha,9876543210,asha@example.com,IVF,\"IVF, IUI\",Dr. Rao\n"
+    ",9876543211,,IVF,,\n"
+    "Meera,12,,IVF,,\n"
+    "Kiran,+14155550100,,Unknown,,\n"
+    "Ravi,8765432109,,,IUI,\n"
+)
+
+# Row 2 repeats the existing lead's phone, row 4 repeats row 3's email
+DUPLICATES_CSV = (
+    "Full Name,Phone,Email\n"
+    "Asha Again,9876543210,asha.new@example.com\n"
+    "Ravi,8765432109,ravi@example.com\n"
+    "Ravi K,,RAVI@example.com\n"
+)
+
+
+class LeadImportTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+        Interest.objects.create(clinic=self.clinic, name="IVF")
+        Interest.objects.create(clinic=self.clinic, name="IUI")
+        LeadFormField.objects.create(field_key="preferred_doctor", field_label="Preferred Doctor")
+
+    def _rows(self, text=CSV):
+        return iter_import_rows(io.BytesIO(text.encode()), "leads.csv")
+
+    @mock.patch("restapi.services.lead_import_service.send_to_zapier")
+    def test_valid_rows_are_created_and_invalid_rows_reported(self, zapier):
+        result = import_leads(
+            self._rows(), self.clinic, default_department_id=self.department.id, batch_size=2
+        )
+
+        self.assertEqual((result["total"], result["created"], result["failed"]), (5, 2, 3))
+        self.assertEqual([error["row"] for error in result["errors"]], [3, 4, 5])
+        self.assertIn("full_name", result["errors"][0]["errors"])
+        self.assertIn("contact_no", result["errors"][1]["errors"])
+        self.assertIn("department", result["errors"][2]["errors"])
+
+        asha = Lead.objects.get(full_name="Asha")
+        self.assertEqual(asha.contact_no_e164, "+919876543210")
+        self.assertIsNotNone(asha.last_interaction_at)
+        self.assertEqual(asha.source, "Import")
+        self.assertEqual(asha.custom_fields, {"preferred_doctor": "Dr. Rao"})
+        self.assertEqual(
+            sorted(asha.treatment_interest.values_list("name", flat=True)), ["IUI", "IVF"]
+        )
+        self.assertEqual(LeadCustomFieldValue.objects.filter(lead=asha).count(), 1)
+
+        zapier.assert_called_once()
+        self.assertEqual(zapier.call_args.args[0]["created"], 2)
+
+    @mock.patch("restapi.services.lead_import_service.send_to_zapier", mock.Mock())
+    def test_xlsx_rows(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Full Name", "Phone", "Email"])
+        sheet.append(["Asha", 9876543210, "asha@example.com"])
+        sheet.append([None, None, None])
+
+        data = io.BytesIO()
+        workbook.save(data)
+        data.seek(0)
+
+        result = import_leads(
+            iter_import_rows(data, "leads.XLSX"), self.clinic,
+            default_department_id=self.department.id,
+        )
+
+        self.assertEqual((result["total"], result["created"]), (1, 1))
+        self.assertEqual(Lead.objects.get().contact_no_e164, "+919876543210")
+
+    @mock.patch("restapi.services.lead_import_service.send_to_zapier", mock.Mock())
+    def test_invalid_action_status_is_a_row_error(self):
+        csv_text = "Full Name,Phone,Action Status\nAsha,9876543210,bogus\nRavi,8765432109,\n"
+
+        result = import_leads(
+            self._rows(csv_text), self.clinic, default_department_id=self.department.id
+        )
+
+        self.assertEqual((result["created"], result["failed"]), (1, 1))
+        self.assertEqual(result["errors"][0]["row"], 2)
+        self.assertIn("action_status", result["errors"][0]["errors"])
+
+    @mock.patch("restapi.services.lead_import_service.send_to_zapier")
+    def test_dry_run_writes_nothing(self, zapier):
+        result = import_leads(
+            self._rows(), self.clinic, default_department_id=self.department.id, dry_run=True
+        )
+
+        self.assertEqual((result["valid"], result["created"]), (2, 0))
+        self.assertFalse(Lead.objects.exists())
+        zapier.assert_not_called()
+
+    @mock.patch("restapi.services.lead_import_service.send_to_zapier")
+    def test_import_endpoint(self, zapier):
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        client = APIClient()
+        client.force_authenticate(User.objects.get(id=user.id))
+
+        response = client.post(
+            f"/api/leads/import/?clinic_id={self.clinic.id}",
+            {
+                "file": SimpleUploadedFile("leads.csv", CSV.encode(), content_type="text/csv"),
+                "department_id": self.department.id,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(Lead.objects.filter(clinic=self.clinic).count(), 2)
+
+    @mock.patch("restapi.services.lead_import_service.send_to_zapier", mock.Mock())
+    def _import_duplicates(self, policy, batch_size=2):
+        Clinic.objects.filter(id=self.clinic.id).update(lead_dedupe_policy=policy)
+        self.clinic.refresh_from_db()
+
+        self.original = Lead.objects.create(
+            clinic=self.clinic, department=self.department,
+            full_name="Asha", contact_no="+919876543210", source="Direct",
+        )
+
+        return import_leads(
+            self._rows(DUPLICATES_CSV), self.clinic,
+            default_department_id=self.department.id, batch_size=batch_size,
+        )
+
+    def test_duplicates_attach(self):
+        result = self._import_duplicates(Clinic.LeadDedupePolicy.ATTACH)
+
+        self.assertEqual((result["created"], result["attached"]), (3, 2))
+        ravi = Lead.objects.get(full_name="Ravi")
+        self.assertEqual(Lead.objects.get(full_name="Asha Again").duplicate_of_id, self.original.id)
+        self.assertEqual(Lead.objects.get(full_name="Ravi K").duplicate_of_id, ravi.id)
+
+    def test_duplicates_merge(self):
+        # One batch: row 4 folds into row 3 before either is inserted
+        result = self._import_duplicates(Clinic.LeadDedupePolicy.MERGE, batch_size=10)
+
+        self.assertEqual((result["created"], result["merged"]), (1, 2))
+        self.assertEqual(Lead.objects.count(), 2)
+
+        self.original.refresh_from_db()
+        self.assertEqual(self.original.full_name, "Asha")
+        self.assertEqual(self.original.email, "asha.new@example.com")
+
+    def test_duplicates_reject(self):
+        result = self._import_duplicates(Clinic.LeadDedupePolicy.REJECT)
+
+        self.assertEqual((result["created"], result["failed"]), (1, 2))
+        self.assertEqual([error["row"] for error in result["errors"]], [2, 4])
+        self.assertEqual(
+            result["errors"][0]["errors"]["duplicate"],
+            {"lead_id": str(self.original.id), "matched_on": "phone"},
+        )
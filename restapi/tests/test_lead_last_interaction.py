@@ -0,0 +1,106 @@
+"""
+Lead Last Interaction Tests: the stored column behind Hot / Warm / Cold
+
+- Qualifying calls / SMS / sent emails move it forward, others do not
+- Older interactions never move it backwards
+- Twilio status callbacks count once the call qualifies
+- backfill_last_interaction recomputes it (forward only) from the interaction tables
+"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from restapi.models import Clinic, Department, Lead, LeadEmail, TwilioCall, TwilioMessage
+
+
+class LeadLastInteractionTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        self.lead = Lead.objects.create(
+            clinic=self.clinic, department=department, full_name="Asha", source="Direct",
+        )
+
+        self.long_ago = timezone.now() - timedelta(days=60)
+        Lead.objects.filter(id=self.lead.id).update(
+            created_at=self.long_ago, last_interaction_at=self.long_ago,
+        )
+
+    def _last_interaction(self):
+        return Lead.objects.values_list("last_interaction_at", flat=True).get(id=self.lead.id)
+
+    def _call(self, sid, status):
+        return TwilioCall.objects.create(
+            lead=self.lead, sid=sid, from_number="1", to_number="2", status=status,
+        )
+
+    def test_only_qualifying_statuses_count(self):
+        self._call("CA1", "no-answer")
+        TwilioMessage.objects.create(
+            lead=self.lead, sid="SM1", from_number="1", to_number="2", body="Hi",
+            status="failed", direction="outbound",
+        )
+        self.assertEqual(self._last_interaction(), self.long_ago)
+
+        message = TwilioMessage.objects.create(
+            lead=self.lead, sid="SM2", from_number="1", to_number="2", body="Hi",
+            status="delivered", direction="outbound",
+        )
+        self.assertEqual(self._last_interaction(), message.created_at)
+
+        call = self._call("CA2", "completed")
+        self.assertEqual(self._last_interaction(), call.created_at)
+
+    def test_older_interaction_does_not_move_backwards(self):
+        recent = timezone.now() - timedelta(days=1)
+        Lead.objects.filter(id=self.lead.id).update(last_interaction_at=recent)
+
+        LeadEmail.objects.create(
+            lead=self.lead, subject="Follow up", email_body="...",
+            status="SENT", sent_at=timezone.now() - timedelta(days=5),
+        )
+
+        self.assertEqual(self._last_interaction(), recent)
+
+    @mock.patch("restapi.views.twilio_views.notify_zapier_event", mock.Mock())
+    def test_status_callback_counts_once_call_qualifies(self):
+        call = self._call("CA1", "ringing")
+        self.assertEqual(self._last_interaction(), self.long_ago)
+
+        response = APIClient().post(
+            "/api/twilio/call-status-callback/",
+            {"CallSid": "CA1", "CallStatus": "completed", "CallDuration": "42"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._last_interaction(), call.created_at)
+
+    def test_backfill_recomputes_from_interaction_tables(self):
+        called_at = timezone.now() - timedelta(days=3)
+        call = self._call("CA1", "completed")
+        TwilioCall.objects.filter(id=call.id).update(created_at=called_at)
+
+        # A newer call that never connected is ignored
+        self._call("CA2", "busy")
+
+        Lead.objects.update(last_interaction_at=None)
+        call_command("backfill_last_interaction", "--only-missing", stdout=StringIO())
+        self.assertEqual(self._last_interaction(), called_at)
+
+        # Never moves backwards, even when the call no longer qualifies
+        TwilioCall.objects.filter(id=call.id).update(status="failed")
+        call_command("backfill_last_interaction", stdout=StringIO())
+        self.assertEqual(self._last_interaction(), called_at)
+
+        # No value and no qualifying interaction: the creation time
+        Lead.objects.update(last_interaction_at=None)
+        call_command("backfill_last_interaction", stdout=StringIO())
+        self.assertEqual(self._last_interaction(), self.long_ago)
@@ -0,0 +1,89 @@
+"""
+Lead List Query Tests: listing N leads costs a constant number of queries
+
+Every lead carries custom field values (one on an inactive field) and
+treatment interests, so any per-lead relation access shows up as extra
+queries when the lead count grows.
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Interest,
+    Lead,
+    LeadCustomFieldValue,
+    LeadFormField,
+    Role,
+    UserProfile,
+)
+
+
+class LeadListQueryCountTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+        self.interest = Interest.objects.create(clinic=self.clinic, name="IVF")
+
+        self.active_field = LeadFormField.objects.create(
+            field_key="preferred_doctor", field_label="Preferred Doctor", sort_order=2
+        )
+        self.second_field = LeadFormField.objects.create(
+            field_key="cycle_day", field_label="Cycle Day", sort_order=1
+        )
+        self.inactive_field = LeadFormField.objects.create(
+            field_key="legacy_note", field_label="Legacy Note", is_active=False
+        )
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _create_leads(self, count):
+        for index in range(count):
+            lead = Lead.objects.create(
+                clinic=self.clinic,
+                department=self.department,
+                full_name=f"Lead {index}",
+                source="Direct",
+            )
+            lead.treatment_interest.add(self.interest)
+
+            for field in (self.active_field, self.second_field, self.inactive_field):
+                LeadCustomFieldValue.objects.create(lead=lead, field=field, value="x")
+
+    def _list(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/leads/list/", {"clinic_id": self.clinic.id})
+
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def test_query_count_is_constant_in_lead_count(self):
+        self._create_leads(2)
+        self._list()  # warm the authenticated user's profile/role cache
+        _, few = self._list()
+
+        self._create_leads(10)
+        payload, many = self._list()
+
+        self.assertEqual(len(payload), 12)
+        self.assertEqual(few, many)
+
+    def test_custom_field_values_are_active_and_ordered(self):
+        self._create_leads(1)
+        payload, _ = self._list()
+
+        keys = [item["field_key"] for item in payload[0]["custom_field_values"]]
+        self.assertEqual(keys, ["cycle_day", "preferred_doctor"])
@@ -0,0 +1,88 @@
+"""
+Lead Phone E.164 Tests: normalized lookup columns and caller resolution
+"""
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.exceptions import ValidationError
+
+from restapi.models import Clinic, Department, Lead
+from restapi.services.lead_service import find_lead_by_phone
+from restapi.utils.phone import to_e164, validate_phone
+
+
+class ToE164TestCase(SimpleTestCase):
+
+    def test_normalizes_indian_and_international_formats(self):
+        cases = {
+            "9876543210": "+919876543210",
+            "09876543210": "+919876543210",
+            "919876543210": "+919876543210",
+            "+91 98765-43210": "+919876543210",
+            "whatsapp:+919876543210": "+919876543210",
+            "+1 (415) 555-0100": "+14155550100",
+        }
+
+        for raw, expected in cases.items():
+            self.assertEqual(to_e164(raw), expected, raw)
+
+    def test_rejects_ambiguous_or_placeholder_numbers(self):
+        for raw in (None, "", "12345", "1234567890", "9999999999", "+12", "abc"):
+            self.assertIsNone(to_e164(raw), raw)
+
+    def test_agrees_with_contact_no_validation(self):
+        # Empty / all-zero values are stored as None, placeholders rejected
+        for raw in ("0000000000", "000"):
+            self.assertIsNone(validate_phone(raw), raw)
+            self.assertIsNone(to_e164(raw), raw)
+
+        for raw in ("0123456789", "5555555555", "+91abc"):
+            with self.assertRaises(ValidationError):
+                validate_phone(raw)
+            self.assertIsNone(to_e164(raw), raw)
+
+        # A validated contact_no always has an E.164 form
+        self.assertEqual(to_e164(validate_phone("91 98765 43210")), "+919876543210")
+
+
+class FindLeadByPhoneTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.other_clinic = Clinic.objects.create(name="Clinic Beta")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+
+    def _lead(self, clinic=None, **fields):
+        return Lead.objects.create(
+            clinic=clinic or self.clinic,
+            department=self.department,
+            full_name="Lead",
+            source="Direct",
+            **fields,
+        )
+
+    def test_save_keeps_normalized_columns_in_sync(self):
+        lead = self._lead(contact_no="9876543210")
+        self.assertEqual(lead.contact_no_e164, "+919876543210")
+
+        lead.contact_no = "+14155550100"
+        lead.save(update_fields=["contact_no"])
+
+        lead.refresh_from_db()
+        self.assertEqual(lead.contact_no_e164, "+14155550100")
+
+    def test_resolves_caller_from_twilio_number(self):
+        lead = self._lead(contact_no="09876543210")
+        backup = self._lead(contact_phone="8765432109")
+
+        self.assertEqual(find_lead_by_phone("+919876543210"), lead)
+        self.assertEqual(find_lead_by_phone("whatsapp:+918765432109"), backup)
+        self.assertIsNone(find_lead_by_phone("+917654321098"))
+
+    def test_clinic_scope(self):
+        self._lead(contact_no="9876543210")
+
+        self.assertIsNone(
+            find_lead_by_phone("+919876543210", clinic_id=self.other_clinic.id)
+        )
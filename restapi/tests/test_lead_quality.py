@@ -0,0 +1,79 @@
+"""
+Lead Quality Tests: SQL buckets must agree with LeadReadSerializer
+
+- Hot  : last interaction within 7 days
+- Warm : within 30 days
+- Cold : older
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from restapi.models import Clinic, Department, Lead
+from restapi.services.lead_service import (
+    count_leads_by_quality,
+    lead_quality_case,
+    lead_quality_for,
+    lead_quality_q,
+)
+
+
+class LeadQualityTestCase(TestCase):
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(
+            name="IVF", clinic=self.clinic, is_active=True
+        )
+
+        # Boundary ages around the 7 / 30 day thresholds
+        self.ages = [0, 7, 7.9, 8, 30, 30.9, 31, 90]
+        self.leads = {}
+
+        for age in self.ages:
+            lead = Lead.objects.create(
+                clinic=self.clinic,
+                department=self.department,
+                full_name=f"Lead {age}",
+                source="Direct",
+            )
+            Lead.objects.filter(id=lead.id).update(
+                last_interaction_at=self.now - timedelta(days=age)
+            )
+            self.leads[lead.id] = age
+
+        self.queryset = Lead.objects.filter(clinic=self.clinic)
+
+    def _expected(self, age):
+        return lead_quality_for(self.now - timedelta(days=age), now=self.now)
+
+    def test_filters_match_python_classification(self):
+        for quality in ("Hot", "Warm", "Cold"):
+            matched = set(
+                self.queryset.filter(lead_quality_q(quality, self.now))
+                .values_list("id", flat=True)
+            )
+            expected = {
+                lead_id for lead_id, age in self.leads.items()
+                if self._expected(age) == quality
+            }
+            self.assertEqual(matched, expected, quality)
+
+    def test_case_annotation_matches_python_classification(self):
+        rows = self.queryset.annotate(
+            quality_db=lead_quality_case(self.now)
+        ).values_list("id", "quality_db")
+
+        for lead_id, quality in rows:
+            self.assertEqual(quality, self._expected(self.leads[lead_id]))
+
+    def test_counts_cover_every_lead(self):
+        counts = count_leads_by_quality(self.queryset, self.now)
+
+        self.assertEqual(counts, {"Hot": 3, "Warm": 3, "Cold": 2})
+
+    def test_unknown_quality_returns_none(self):
+        self.assertIsNone(lead_quality_q("lukewarm", self.now))
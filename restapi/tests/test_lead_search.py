@@ -0,0 +1,102 @@
+"""
+Lead Search Tests: name prefix, phone digits, email, visibility, pagination
+"""
+
+import unittest
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from restapi.models import Clinic, Department, Employee, Lead, Role, RolePermission, UserProfile
+from restapi.services.lead_service import _prefix_search_query
+
+
+class LeadSearchTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        # Restricted "user" role: sees only leads created by / assigned to them
+        role = Role.objects.create(name="user")
+        RolePermission.objects.create(
+            role=role, module_key="leads hub", category_key="leads", can_view=True,
+        )
+
+        user = User.objects.create_user(username="counsellor", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+        self.employee = Employee.objects.create(
+            user=user, dep=department, clinic=self.clinic,
+            emp_type="Counsellor", emp_name="counsellor",
+        )
+
+        def lead(full_name, email, contact_no, assigned_to_id=None):
+            return Lead.objects.create(
+                clinic=self.clinic, department=department, source="Direct",
+                full_name=full_name, email=email, contact_no=contact_no,
+                assigned_to_id=assigned_to_id,
+            )
+
+        self.asha = lead("Asha Rao", "asha.rao@example.com", "+919876543210", self.employee.id)
+        self.john = lead("John Doe", "john.doe@example.com", "+919876500001", self.employee.id)
+        self.hidden = lead("Asha Hidden", "asha.hidden@example.com", "+919876500002")
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _search(self, q, **params):
+        response = self.client.get(
+            "/api/leads/search/", {"clinic_id": self.clinic.id, "q": q, **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def _ids(self, data):
+        return [str(row["id"]) for row in data["results"]]
+
+    def test_phone_digits_match_partial_numbers(self):
+        self.assertEqual(self._ids(self._search("98765 43")), [str(self.asha.id)])
+
+    def test_phone_matches_formatted_stored_number(self):
+        formatted = Lead.objects.create(
+            clinic=self.clinic, department=self.asha.department, source="Direct",
+            full_name="Meera", contact_no="+91 91234-56789",
+            assigned_to_id=self.employee.id,
+        )
+
+        for q in ("9123456789", "091234 56789", "+91 91234 56789", "12345"):
+            self.assertEqual(self._ids(self._search(q)), [str(formatted.id)], q)
+
+    def test_email_full_address_and_domain(self):
+        self.assertEqual(self._ids(self._search("John.Doe@example.com")), [str(self.john.id)])
+        self.assertEqual(self._ids(self._search("asha.rao@")), [str(self.asha.id)])
+        self.assertCountEqual(
+            self._ids(self._search("@example.com")), [str(self.asha.id), str(self.john.id)]
+        )
+
+    def test_visibility_scope_applies(self):
+        self.assertNotIn(str(self.hidden.id), self._ids(self._search("98765")))
+        self.assertNotIn(str(self.hidden.id), self._ids(self._search("asha.hidden@example.com")))
+
+    def test_pagination(self):
+        first = self._search("98765", page_size=1)
+        second = self._search("98765", page=2, page_size=1)
+
+        self.assertTrue(first["has_more"])
+        self.assertFalse(second["has_more"])
+        self.assertCountEqual(
+            self._ids(first) + self._ids(second), [str(self.asha.id), str(self.john.id)]
+        )
+
+    def test_prefix_query_quotes_whitespace_tokens(self):
+        self.assertEqual(
+            _prefix_search_query("o'brien  john.doe").get_source_expressions()[-1].value,
+            "'o''brien':* & 'john.doe':*",
+        )
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "Full-text search needs PostgreSQL")
+    def test_name_prefix(self):
+        self.assertEqual(self._ids(self._search("ash ra")), [str(self.asha.id)])
+        self.assertEqual(self._ids(self._search("jo")), [str(self.john.id)])
@@ -0,0 +1,89 @@
+"""
+Lead Timeline Tests: one UNION ALL feed across channels, keyset-paginated
+"""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Lead,
+    LeadEmail,
+    LeadNote,
+    Role,
+    TwilioCall,
+    TwilioMessage,
+    UserProfile,
+)
+
+
+class LeadTimelineTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        self.lead = Lead.objects.create(
+            clinic=self.clinic, department=department, full_name="Lead A", source="Direct"
+        )
+        other = Lead.objects.create(
+            clinic=self.clinic, department=department, full_name="Lead B", source="Direct"
+        )
+
+        for index in range(3):
+            TwilioMessage.objects.create(
+                lead=self.lead, sid=f"SM{index}", from_number="+911", to_number="+912",
+                body=f"Hello {index}", direction="outbound", status="sent",
+            )
+        TwilioMessage.objects.create(
+            lead=other, sid="SM-other", from_number="+911", to_number="+912",
+            body="Not mine", direction="outbound",
+        )
+        TwilioCall.objects.create(
+            lead=self.lead, sid="CA1", from_number="+911", to_number="+912", status="completed",
+        )
+        LeadEmail.objects.create(lead=self.lead, subject="Welcome", email_body="Hi")
+        LeadNote.objects.create(lead=self.lead, title="Called", note="Interested")
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _page(self, **params):
+        response = self.client.get(
+            f"/api/leads/{self.lead.id}/timeline/", {"clinic_id": self.clinic.id, **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_pages_cover_every_channel_once(self):
+        items = []
+        cursor = None
+
+        while True:
+            page = self._page(page_size=2, **({"cursor": cursor} if cursor else {}))
+            self.assertLessEqual(len(page["results"]), 2)
+            items.extend(page["results"])
+            cursor = page["next"]
+            if not cursor:
+                break
+
+        self.assertEqual(len(items), 6)
+        self.assertEqual(len({(item["kind"], item["id"]) for item in items}), 6)
+        self.assertEqual(
+            sorted({item["kind"] for item in items}), ["call", "email", "note", "sms"]
+        )
+
+        keys = [(item["occurred_at"], item["kind"], item["id"]) for item in items]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            f"/api/leads/{self.lead.id}/timeline/", {"clinic_id": self.clinic.id, "cursor": "nope"}
+        )
+        self.assertEqual(response.status_code, 400)
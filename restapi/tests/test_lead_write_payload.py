@@ -0,0 +1,66 @@
+"""
+Lead Write Payload Tests: multipart create / update without copying uploads
+"""
+
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from restapi.models import Clinic, Department, Lead, LeadDocument, Role, UserProfile
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp(), FILE_UPLOAD_MAX_MEMORY_SIZE=1024)
+@mock.patch("restapi.views.lead_views.send_to_zapier", mock.Mock())
+class LeadWritePayloadTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _document(self, name):
+        # Larger than FILE_UPLOAD_MAX_MEMORY_SIZE, so it is spooled to disk
+        return SimpleUploadedFile(name, b"%PDF-1.4\n" + b"0" * 4096, content_type="application/pdf")
+
+    def test_multipart_create_and_update_never_deep_copy(self):
+        deepcopy = mock.patch.object(UploadedFile, "__deepcopy__", create=True)
+
+        with deepcopy as file_deepcopy:
+            response = self.client.post(
+                f"/api/leads/?clinic_id={self.clinic.id}",
+                {
+                    "department_id": self.department.id,
+                    "full_name": "Asha Rao",
+                    "source": "Direct",
+                    "documents": [self._document("a.pdf"), self._document("b.pdf")],
+                },
+                format="multipart",
+            )
+            self.assertEqual(response.status_code, 201)
+
+            lead_id = response.data["id"]
+            response = self.client.put(
+                f"/api/leads/{lead_id}/update/?clinic_id={self.clinic.id}",
+                {
+                    "full_name": "Asha Rao",
+                    "source": "Direct",
+                    "lead_status": " Contacted ",
+                    "documents": [self._document("c.pdf")],
+                },
+                format="multipart",
+            )
+            self.assertEqual(response.status_code, 200)
+
+        file_deepcopy.assert_not_called()
+        self.assertEqual(LeadDocument.objects.filter(lead_id=lead_id).count(), 3)
+        self.assertEqual(Lead.objects.get(id=lead_id).lead_status, "contacted")
@@ -0,0 +1,81 @@
+"""
+Permission Matrix Tests: compiled once, cached, invalidated on change
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from restapi.models import Role, RolePermission, UserPermission, UserProfile
+from restapi.utils.permissions import (
+    has_action_permission_for_labels,
+    has_permission,
+)
+
+
+class PermissionMatrixTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+        self.role = Role.objects.create(name="Counsellor")
+        self.lead_perm = RolePermission.objects.create(
+            role=self.role, module_key="leads hub", category_key="leads", can_view=True,
+        )
+
+        user = User.objects.create_user(username="counsellor", password="pass123")
+        profile = UserProfile.objects.get(user=user)
+        profile.role = self.role
+        profile.save()
+
+        self.user_id = user.id
+
+    def _user(self):
+        # A fresh object per "request", like the authentication layer gives
+        return User.objects.select_related("profile__role").get(id=self.user_id)
+
+    def test_checks_after_first_run_no_queries(self):
+        user = self._user()
+        self.assertTrue(has_action_permission_for_labels(user, "view", ["leads hub"]))
+
+        with self.assertNumQueries(0):
+            self.assertFalse(has_action_permission_for_labels(user, "edit", ["leads hub"]))
+            self.assertTrue(has_permission(user, "leads hub", "leads", "view"))
+
+        # Next request: served from the shared cache
+        user = self._user()
+        with self.assertNumQueries(0):
+            self.assertTrue(has_permission(user, "leads hub", "leads", "view"))
+
+    def test_label_index_matches_singular_and_plural(self):
+        RolePermission.objects.create(
+            role=self.role, module_key="_", category_key="_", subcategory_key="campaigns",
+            can_add=True,
+        )
+        user = self._user()
+
+        self.assertTrue(has_action_permission_for_labels(user, "view", ["Leads Hub", "lead"]))
+        self.assertTrue(has_action_permission_for_labels(user, "add", ["campaign"]))
+        self.assertTrue(has_action_permission_for_labels(user, "add", ["campaigns"]))
+        self.assertFalse(has_action_permission_for_labels(user, "add", ["leads hub", "_"]))
+
+    def test_changes_invalidate_cached_matrix(self):
+        self.assertFalse(has_permission(self._user(), "leads hub", "leads", "edit"))
+
+        self.lead_perm.can_edit = True
+        self.lead_perm.save()
+        self.assertTrue(has_permission(self._user(), "leads hub", "leads", "edit"))
+
+        # Individual permissions replace the role's
+        UserPermission.objects.create(
+            user_id=self.user_id, module_key="leads hub", category_key="leads", can_view=True,
+        )
+        self.assertFalse(has_permission(self._user(), "leads hub", "leads", "edit"))
+
+        UserPermission.objects.filter(user_id=self.user_id).delete()
+        self.assertTrue(has_permission(self._user(), "leads hub", "leads", "edit"))
+
+        profile = UserProfile.objects.get(user_id=self.user_id)
+        profile.role = Role.objects.create(name="Viewer")
+        profile.save(update_fields=["role"])
+        self.assertFalse(has_permission(self._user(), "leads hub", "leads", "edit"))
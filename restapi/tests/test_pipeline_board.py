@@ -0,0 +1,84 @@
+"""
+Pipeline Board Tests: per-stage totals, top-N cards and per-stage "load more"
+"""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Lead,
+    Pipeline,
+    PipelineStage,
+    Role,
+    UserProfile,
+)
+
+
+class PipelineBoardTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        self.pipeline = Pipeline.objects.create(
+            clinic=self.clinic, pipeline_name="IVF", industry_type="ivf"
+        )
+        self.new_stage = self._stage("New", 1)
+        self.won_stage = self._stage("Won", 2)
+
+        for index in range(5):
+            Lead.objects.create(
+                clinic=self.clinic,
+                department=department,
+                stage=self.new_stage,
+                full_name=f"Lead {index}",
+                source="Direct",
+            )
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _stage(self, name, order):
+        return PipelineStage.objects.create(
+            pipeline=self.pipeline, stage_name=name, stage_type="lead",
+            entry_rule="manual", stage_order=order,
+        )
+
+    def _board(self, **params):
+        response = self.client.get(
+            f"/api/pipelines/{self.pipeline.id}/board/",
+            {"clinic_id": self.clinic.id, **params},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_board_columns(self):
+        data = self._board(per_stage=2)
+
+        new_column, won_column = data["stages"]
+        self.assertEqual(new_column["total"], 5)
+        self.assertEqual(len(new_column["leads"]), 2)
+        self.assertIsNotNone(new_column["next_cursor"])
+        self.assertEqual(won_column["total"], 0)
+        self.assertEqual(won_column["leads"], [])
+        self.assertIsNone(won_column["next_cursor"])
+
+    def test_load_more_walks_the_stage(self):
+        first = self._board(per_stage=2)["stages"][0]
+        seen = [lead["id"] for lead in first["leads"]]
+        cursor = first["next_cursor"]
+
+        while cursor:
+            page = self._board(per_stage=2, stage_id=str(self.new_stage.id), cursor=cursor)
+            seen.extend(lead["id"] for lead in page["leads"])
+            cursor = page["next_cursor"]
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
@@ -0,0 +1,79 @@
+"""
+Pipeline Stage RBAC Tests: one access decision per response, not per stage
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Pipeline,
+    PipelineStage,
+    Role,
+    RolePermission,
+    StageRule,
+    UserProfile,
+)
+
+
+class PipelineStageRBACTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.pipeline = Pipeline.objects.create(
+            clinic=self.clinic, pipeline_name="IVF", industry_type="ivf"
+        )
+        self._add_stages(2)
+
+        self.role = Role.objects.create(name="Counsellor")
+        user = User.objects.create_user(username="counsellor", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=self.role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _add_stages(self, count):
+        start = PipelineStage.objects.filter(pipeline=self.pipeline).count()
+
+        for order in range(start + 1, start + count + 1):
+            stage = PipelineStage.objects.create(
+                pipeline=self.pipeline, stage_name=f"Stage {order}", stage_type="lead",
+                entry_rule="manual", stage_order=order,
+            )
+            StageRule.objects.create(stage=stage, action_type="call")
+
+    def _list(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/pipelines/", {"clinic_id": self.clinic.id})
+
+        self.assertEqual(response.status_code, 200)
+        return response.data[0]["stages"], len(queries)
+
+    def test_stage_count_does_not_add_permission_queries(self):
+        RolePermission.objects.create(
+            role=self.role, module_key="pipeline", category_key="stages", can_view=True,
+        )
+
+        self._list()  # warm the permission matrix
+
+        stages, few_queries = self._list()
+        self.assertNotIn("rules", stages[0])
+
+        self._add_stages(6)
+
+        stages, many_queries = self._list()
+        self.assertEqual(len(stages), 8)
+        self.assertEqual(many_queries, few_queries)
+
+    def test_without_permission_rules_and_fields_are_empty(self):
+        stages, _ = self._list()
+
+        self.assertEqual(stages[0]["stage_name"], "Stage 1")
+        self.assertEqual(stages[0]["rules"], [])
+        self.assertEqual(stages[0]["fields"], [])
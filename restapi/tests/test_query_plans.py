@@ -0,0 +1,33 @@
+"""
+Query Plan Tests: the lead hot paths stay on indexes
+"""
+
+import unittest
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from restapi.management.commands.check_query_plans import _seq_scans
+
+
+class QueryPlanTestCase(TestCase):
+
+    def test_seq_scans_walks_nested_plans(self):
+        plan = {
+            "Node Type": "Limit",
+            "Plans": [
+                {"Node Type": "Index Scan", "Relation Name": "restapi_lead"},
+                {
+                    "Node Type": "Hash",
+                    "Plans": [{"Node Type": "Seq Scan", "Relation Name": "restapi_clinic"}],
+                },
+            ],
+        }
+
+        self.assertEqual(_seq_scans(plan), ["restapi_clinic"])
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "EXPLAIN checks need PostgreSQL")
+    def test_hot_queries_use_indexes(self):
+        call_command("check_query_plans", seed=500, stdout=StringIO())
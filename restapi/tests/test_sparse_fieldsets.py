@@ -0,0 +1,88 @@
+"""
+Sparse Fieldset Tests: ?fields= / ?expand= on lead and campaign reads
+"""
+
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from restapi.models import Campaign, Clinic, Department, Lead, Role, UserProfile
+
+
+class SparseFieldsetTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        for index in range(3):
+            Lead.objects.create(
+                clinic=self.clinic,
+                department=department,
+                full_name=f"Lead {index}",
+                source="Direct",
+            )
+
+        Campaign.objects.create(
+            clinic=self.clinic,
+            campaign_name="Spring",
+            campaign_objective="awareness",
+            target_audience="all",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 2, 1),
+            campaign_mode=1,
+        )
+
+        role = Role.objects.create(name="Super Admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _list_leads(self, **params):
+        response = self.client.get("/api/leads/list/", {"clinic_id": self.clinic.id, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_lead_fields_trim_response_and_queries(self):
+        with CaptureQueriesContext(connection) as full:
+            self._list_leads()
+
+        with CaptureQueriesContext(connection) as sparse:
+            rows = self._list_leads(fields="id,full_name", expand="department_name")
+
+        self.assertEqual(set(rows[0]), {"id", "full_name", "department_name"})
+        self.assertLess(len(sparse.captured_queries), len(full.captured_queries))
+
+    def test_expand_alone_keeps_default_fields(self):
+        default = self._list_leads()
+        expanded = self._list_leads(expand="department_name")
+
+        self.assertEqual(set(expanded[0]), set(default[0]))
+        self.assertIn("department_name", expanded[0])
+
+        response = self.client.get(
+            "/api/leads/list/", {"clinic_id": self.clinic.id, "expand": "nope"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_field(self):
+        response = self.client.get(
+            "/api/leads/list/", {"clinic_id": self.clinic.id, "fields": "id,nope"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_campaign_fields(self):
+        response = self.client.get(
+            "/api/campaigns/list/",
+            {"clinic_id": self.clinic.id, "fields": "id,campaign_name,lead_generated"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data[0]), {"id", "campaign_name", "lead_generated"})
+        self.assertEqual(response.data[0]["lead_generated"], 0)
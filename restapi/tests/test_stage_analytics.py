@@ -0,0 +1,122 @@
+"""
+Stage Analytics Tests: transition history, daily rollups and the report
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from restapi.models import (
+    Clinic,
+    Department,
+    Lead,
+    LeadStageTransition,
+    Pipeline,
+    PipelineStage,
+    Role,
+    UserProfile,
+)
+from restapi.services.lead_service import bulk_update_leads
+from restapi.services.stage_analytics_service import (
+    histogram_percentile,
+    rollup_stage_transitions,
+    STAGE_DURATION_BUCKETS,
+)
+
+
+class StageAnalyticsTestCase(TestCase):
+
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name="Clinic Alpha")
+        self.department = Department.objects.create(name="IVF", clinic=self.clinic, is_active=True)
+
+        self.pipeline = Pipeline.objects.create(
+            clinic=self.clinic, pipeline_name="IVF", industry_type="ivf"
+        )
+        self.new_stage = self._stage("New", 1)
+        self.won_stage = self._stage("Won", 2)
+
+        role = Role.objects.create(name="super_admin")
+        user = User.objects.create_user(username="sa", password="pass123")
+        UserProfile.objects.filter(user=user).update(role=role, clinic=self.clinic)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(id=user.id))
+
+    def _stage(self, name, order):
+        return PipelineStage.objects.create(
+            pipeline=self.pipeline, stage_name=name, stage_type="lead",
+            entry_rule="manual", stage_order=order,
+        )
+
+    def _lead(self, name):
+        return Lead.objects.create(
+            clinic=self.clinic,
+            department=self.department,
+            stage=self.new_stage,
+            full_name=name,
+            source="Direct",
+        )
+
+    def test_save_and_bulk_moves_are_recorded(self):
+        first = self._lead("Lead A")
+        second = self._lead("Lead B")
+
+        first.stage = self.won_stage
+        first.save()
+        first.save()  # no move, no row
+
+        with mock.patch("restapi.services.lead_service.send_to_zapier"):
+            bulk_update_leads(
+                Lead.objects.filter(id=second.id), self.clinic,
+                "move_stage", {"stage_id": str(self.won_stage.id)},
+            )
+
+        moves = list(
+            LeadStageTransition.objects.order_by("lead__full_name", "at")
+            .values_list("lead__full_name", "from_stage_id", "to_stage_id")
+        )
+        self.assertEqual(moves, [
+            ("Lead A", None, self.new_stage.id),
+            ("Lead A", self.new_stage.id, self.won_stage.id),
+            ("Lead B", None, self.new_stage.id),
+            ("Lead B", self.new_stage.id, self.won_stage.id),
+        ])
+
+    def test_rollup_feeds_report(self):
+        lead = self._lead("Lead A")
+        lead.stage = self.won_stage
+        lead.save()
+
+        # Spent two days in "New"
+        today = timezone.localdate()
+        created, moved = LeadStageTransition.objects.order_by("at")
+        LeadStageTransition.objects.filter(id=created.id).update(at=moved.at - timedelta(days=2))
+
+        self.assertEqual(rollup_stage_transitions(today), 1)
+        rollup_stage_transitions(today - timedelta(days=2))
+
+        response = self.client.get(
+            f"/api/pipelines/{self.pipeline.id}/stage-analytics/",
+            {"clinic_id": self.clinic.id},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        new_stats, won_stats = response.data["stages"]
+        self.assertEqual(new_stats["entered"], 1)
+        self.assertEqual(new_stats["advanced"], 1)
+        self.assertEqual(new_stats["conversion_rate"], 100)
+        self.assertEqual(new_stats["avg_seconds"], 2 * 86400)
+        self.assertTrue(2 * 86400 <= new_stats["median_seconds"] <= 3 * 86400)
+        self.assertEqual(won_stats["entered"], 1)
+
+    def test_histogram_percentile(self):
+        histogram = [0] * len(STAGE_DURATION_BUCKETS)
+        histogram[0] = 10
+
+        self.assertEqual(histogram_percentile(histogram, 0.5), 1800)
+        self.assertIsNone(histogram_percentile([0] * len(STAGE_DURATION_BUCKETS), 0.5))
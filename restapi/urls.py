@@ -106,7 +106,13 @@ urlpatterns = [
     path("lead-form-fields/<str:field_key>/", LeadFormFieldDetailAPIView.as_view(), name="lead-form-field-detail"),
     path("leads/<uuid:lead_id>/update/", LeadUpdateAPIView.as_view(), name="lead-update"),
     path("leads/list/", LeadListAPIView.as_view(), name="lead-list"),
+    path("leads/search/", LeadSearchAPIView.as_view(), name="lead-search"),
+    path("leads/import/", LeadImportAPIView.as_view(), name="lead-import"),
+    path("leads/bulk/", LeadBulkActionAPIView.as_view(), name="lead-bulk-action"),
+    path("leads/export/", LeadExportAPIView.as_view(), name="lead-export"),
+    path("leads/changes/", LeadChangesAPIView.as_view(), name="lead-changes"),
     path("leads/<uuid:lead_id>/", LeadGetAPIView.as_view(), name="lead-get"),
+    path("leads/<uuid:lead_id>/timeline/", LeadTimelineAPIView.as_view(), name="lead-timeline"),
     path("leads/<uuid:lead_id>/activate/", LeadActivateAPIView.as_view(), name="lead-activate"),
     path("leads/<uuid:lead_id>/inactivate/", LeadInactivateAPIView.as_view(), name="lead-inactivate"),
     path("leads/<uuid:lead_id>/delete/", LeadSoftDeleteAPIView.as_view(), name="lead-soft-delete"),
@@ -183,6 +189,8 @@ urlpatterns = [
     path("pipelines/create/", PipelineCreateAPIView.as_view(), name="pipeline-create"),
     path("pipelines/", PipelineListAPIView.as_view(), name="pipeline-list"),
     path("pipelines/<uuid:pipeline_id>/stages/", PipelineStagesListAPIView.as_view(), name="pipeline-stages-list"),
+    path("pipelines/<uuid:pipeline_id>/board/", PipelineBoardAPIView.as_view(), name="pipeline-board"),
+    path("pipelines/<uuid:pipeline_id>/stage-analytics/", PipelineStageAnalyticsAPIView.as_view(), name="pipeline-stage-analytics"),
     path("pipelines/<uuid:pipeline_id>/", PipelineDetailAPIView.as_view(), name="pipeline-detail"),
     path("pipelines/<uuid:pipeline_id>/set-default/", PipelineSetDefaultAPIView.as_view(), name="pipeline-set-default"),
     path("pipelines/<uuid:pipeline_id>/duplicate/", PipelineDuplicateAPIView.as_view(), name="pipeline-duplicate"),
@@ -1,3 +1,8 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from django.conf import settings
@@ -5,6 +10,113 @@ from django.contrib.auth.models import User
 import jwt
 
 
+# =====================================================
+# AUTHENTICATED USER CACHE
+# ✅ OPTIMIZATION: the user is loaded with everything request code
+#    reaches for (profile, role, clinic, employee) in one query and
+#    kept in a small per-process LRU for a few seconds.
+#    restapi.signals evicts on User / UserProfile / Employee saves;
+#    other workers converge within the TTL.
+# =====================================================
+AUTH_USER_SELECT_RELATED = ("profile__role", "profile__clinic", "employee")
+
+
+class _AuthenticatedUserCache:
+
+    def __init__(self, max_size, ttl_seconds):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+
+            if entry is None:
+                return None
+
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+
+            self._entries.move_to_end(user_id)
+            return user
+
+    def set(self, user_id, user):
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(user_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_user_cache = _AuthenticatedUserCache(
+    max_size=int(getattr(settings, "JWT_USER_CACHE_SIZE", 1024)),
+    ttl_seconds=float(getattr(settings, "JWT_USER_CACHE_TTL_SECONDS", 30)),
+)
+
+
+def _profile_version(user):
+    try:
+        return user.profile.permissions_version
+    except Exception:
+        return None
+
+
+def get_authenticated_user(user_id, profile_version=None):
+    """
+    User with AUTH_USER_SELECT_RELATED preloaded, or None. A cached
+    entry older than `profile_version` (when one is given) is reloaded;
+    tokens carrying an older version are served the newer cached user.
+
+    Each call returns its own copy, so per-request state set on the
+    user never leaks into other requests.
+    """
+    key = str(user_id)
+    user = _user_cache.get(key)
+
+    if user is not None and profile_version is not None:
+        cached_version = _profile_version(user)
+        if cached_version is not None and profile_version > cached_version:
+            user = None
+
+    if user is None:
+        user = (
+            User.objects.select_related(*AUTH_USER_SELECT_RELATED)
+            .filter(id=user_id)
+            .first()
+        )
+
+        if user is None:
+            return None
+
+        _user_cache.set(key, user)
+
+    return copy.deepcopy(user)
+
+
+def evict_authenticated_user(user_id):
+    _user_cache.evict(str(user_id))
+
+
+def clear_authenticated_users():
+    _user_cache.clear()
+
+
 class JWTAuthentication(BaseAuthentication):
 
     def authenticate(self, request):
@@ -34,9 +146,26 @@ class JWTAuthentication(BaseAuthentication):
         if not user_id:
             raise AuthenticationFailed("Invalid token payload")
 
-        user = User.objects.filter(id=user_id).first()
+        # restapi.utils.permissions imports this module
+        from restapi.utils.permissions import (
+            attach_permission_claims,
+            current_permissions_version,
+        )
+
+        use_claims = getattr(settings, "JWT_PERMISSION_CLAIMS", False) and "pv" in payload
+
+        try:
+            # Claims are checked against the version every worker sees; a
+            # newer one than the locally cached user forces a reload
+            current_version = current_permissions_version(user_id) if use_claims else None
+            user = get_authenticated_user(user_id, profile_version=current_version)
+        except (TypeError, ValueError):
+            raise AuthenticationFailed("Invalid token payload")
 
         if not user:
             raise AuthenticationFailed("User not found")
 
-        return (user, None)
\ No newline at end of file
+        if use_claims:
+            attach_permission_claims(user, payload, current_version)
+
+        return (user, None)
@@ -1,4 +1,20 @@
-from restapi.models import RolePermission
+import zlib
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import F
+
+from restapi.models import RolePermission, UserProfile
+from restapi.utils.jwt_authentication import clear_authenticated_users
+
+PERMISSION_ACTIONS = ("view", "add", "edit", "print")
+
+# Compiled matrices are keyed by (user, role, permissions_version), so a
+# stale entry is never read again; the timeout only bounds memory.
+PERMISSION_MATRIX_CACHE_TIMEOUT = 60 * 60
 
 
 def _build_permission_result(permissions):
@@ -111,23 +127,296 @@ def is_super_admin_role(role):
 
 
 # =========================
-# GET USER PERMISSIONS (FINAL)
+# COMPILED PERMISSION MATRIX
+# ✅ OPTIMIZATION: permissions are read and compiled once per
+#    (user, role, version), cached across requests and memoized on
+#    the user object, so checks after the first run no queries.
+#    restapi.signals bumps UserProfile.permissions_version whenever
+#    a RolePermission / UserPermission / profile role changes.
 # =========================
-def get_user_permissions(user):
+def _permission_keys(perm):
+    keys = {
+        normalize_role_name(perm.module_key),
+        normalize_role_name(perm.category_key),
+        normalize_role_name(perm.subcategory_key),
+    }
+    keys.discard("")
+    keys.discard("_")
+    return keys
+
+
+def _label_variants(key):
+    """
+    Every normalized label that matches `key` under the singular/plural
+    rule of has_action_permission_for_labels (label, label minus a
+    trailing "s" if it has one, otherwise label plus "s").
+    """
+    variants = {key, f"{key}s"}
+
+    if len(key) > 1 and key.endswith("s") and not key[:-1].endswith("s"):
+        variants.add(key[:-1])
+
+    return variants
+
+
+def _compile_permission_matrix(permissions):
+    permissions = list(permissions)
+    labels = {action: set() for action in PERMISSION_ACTIONS}
+
+    for perm in permissions:
+        variants = set()
+        for key in _permission_keys(perm):
+            variants |= _label_variants(key)
+
+        for action in PERMISSION_ACTIONS:
+            if getattr(perm, f"can_{action}", False):
+                labels[action] |= variants
+
+    return {
+        "tree": _build_permission_result(permissions),
+        # action -> every label spelling granted (label checks are lookups)
+        "labels": {action: frozenset(variants) for action, variants in labels.items()},
+    }
+
+
+def _load_permission_matrix(user, role):
     from restapi.models.user_permission import UserPermission
 
-    # Check for individual user-level permission overrides first
-    individual_perms = UserPermission.objects.filter(user=user)
-    if individual_perms.exists():
-        return _build_permission_result(individual_perms)
+    # Individual user-level permissions replace the role's entirely
+    individual_perms = list(UserPermission.objects.filter(user=user))
+    if individual_perms:
+        return _compile_permission_matrix(individual_perms)
 
-    # Fall back to role-based permissions
-    role = get_user_role(user)
     if not role:
+        return _compile_permission_matrix([])
+
+    return _compile_permission_matrix(RolePermission.objects.filter(role=role))
+
+
+def get_permission_matrix(user):
+    if not user or not getattr(user, "pk", None):
+        return _compile_permission_matrix([])
+
+    role = get_user_role(user)
+
+    try:
+        version = user.profile.permissions_version
+    except Exception:
+        version = 0
+
+    key = f"perm_matrix:{user.pk}:{getattr(role, 'pk', None)}:{version}"
+
+    memo = getattr(user, "_permission_matrix", None)
+    if memo and memo[0] == key:
+        return memo[1]
+
+    matrix = cache.get(key)
+    if matrix is None:
+        matrix = _load_permission_matrix(user, role)
+        cache.set(key, matrix, PERMISSION_MATRIX_CACHE_TIMEOUT)
+
+    user._permission_matrix = (key, matrix)
+    return matrix
+
+
+def _permissions_version_key(user_id):
+    return f"perm_version:{user_id}"
+
+
+def _cache_is_shared():
+    # A per-process cache cannot tell this worker about another one's bump
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def current_permissions_version(user_id):
+    """
+    The permissions_version every worker agrees on: read through the
+    cache when CACHES is a shared backend, otherwise from the database.
+    None when the user has no profile.
+    """
+    shared = _cache_is_shared()
+    key = _permissions_version_key(user_id)
+
+    if shared:
+        version = cache.get(key)
+        if version is not None:
+            return version
+
+    version = (
+        UserProfile.objects.filter(user_id=user_id)
+        .values_list("permissions_version", flat=True)
+        .first()
+    )
+
+    # add(): never overwrite a newer version published by a bump
+    if shared and version is not None:
+        cache.add(key, version, PERMISSION_MATRIX_CACHE_TIMEOUT)
+
+    return version
+
+
+def _publish_permissions_versions(user_ids):
+    versions = UserProfile.objects.filter(user_id__in=user_ids).values_list(
+        "user_id", "permissions_version"
+    )
+    cache.set_many(
+        {_permissions_version_key(user_id): version for user_id, version in versions},
+        PERMISSION_MATRIX_CACHE_TIMEOUT,
+    )
+
+
+def bump_permissions_version(**profile_filters):
+    """Invalidate the cached matrices of every matching UserProfile."""
+    profiles = UserProfile.objects.filter(**profile_filters)
+    user_ids = list(profiles.values_list("user_id", flat=True)) if _cache_is_shared() else []
+
+    updated = profiles.update(permissions_version=F("permissions_version") + 1)
+
+    if updated:
+        # Cached request users still carry the old version
+        clear_authenticated_users()
+
+        if user_ids:
+            transaction.on_commit(lambda: _publish_permissions_versions(user_ids))
+
+    return updated
+
+
+# =========================
+# ACCESS TOKEN PERMISSION CLAIMS
+# ✅ OPTIMIZATION: the hot checks below travel in the access token
+#    as a bitmap (len(PERMISSION_ACTIONS) bits per slot). While the
+#    token's role / clinic / permissions_version still match the
+#    profile and the shared version, those checks never build the
+#    matrix. Append-only: changing the slots changes
+#    PERMISSION_CLAIM_SCHEMA, and tokens with another schema fall
+#    back to the database. Off unless JWT_PERMISSION_CLAIMS is set.
+# =========================
+PERMISSION_CLAIM_SLOTS = (
+    # has_action_permission_for_labels (one normalized label per slot)
+    ("label", "leads hub"),
+    ("label", "users"),
+    ("label", "user"),
+    ("label", "user management"),
+    ("label", "user rights"),
+    ("label", "tickets"),
+    ("label", "ticket"),
+    ("label", "ticket management"),
+    ("label", "template"),
+    ("label", "templates"),
+
+    # has_permission (module, category)
+    ("perm", "pipeline", "stages"),
+    ("perm", "campaign", "campaigns"),
+    ("perm", "employee", "employees"),
+    ("perm", "lab", "labs"),
+)
+
+PERMISSION_CLAIM_SCHEMA = format(zlib.crc32(repr(PERMISSION_CLAIM_SLOTS).encode()), "08x")
+
+_PERMISSION_CLAIM_INDEX = {slot: index for index, slot in enumerate(PERMISSION_CLAIM_SLOTS)}
+
+
+def _slot_granted(matrix, slot, action):
+    if slot[0] == "label":
+        return slot[1] in matrix["labels"][action]
+
+    _, module, category = slot
+    try:
+        return bool(matrix["tree"][module][category].get(f"can_{action}", False))
+    except (KeyError, AttributeError):
+        return False
+
+
+def build_permission_claims(user):
+    """
+    Compact claims for an access token: role id, clinic id, the
+    profile permissions_version and the hot-check bitmap.
+    Empty when JWT_PERMISSION_CLAIMS is off or the user has no profile.
+    """
+    if not getattr(settings, "JWT_PERMISSION_CLAIMS", False):
+        return {}
+
+    try:
+        profile = UserProfile.objects.get(user_id=user.pk)
+    except UserProfile.DoesNotExist:
         return {}
 
-    permissions = RolePermission.objects.filter(role=role)
-    return _build_permission_result(permissions)
+    # Login may have just changed the profile; compile from the row
+    user.profile = profile
+    matrix = get_permission_matrix(user)
+
+    bitmap = 0
+    for index, slot in enumerate(PERMISSION_CLAIM_SLOTS):
+        for offset, action in enumerate(PERMISSION_ACTIONS):
+            if _slot_granted(matrix, slot, action):
+                bitmap |= 1 << (index * len(PERMISSION_ACTIONS) + offset)
+
+    return {
+        "rid": profile.role_id,
+        "cid": profile.clinic_id,
+        "pv": profile.permissions_version,
+        "pbs": PERMISSION_CLAIM_SCHEMA,
+        "pbm": format(bitmap, "x"),
+    }
+
+
+def attach_permission_claims(user, payload, current_version):
+    """
+    Trust the token's bitmap for this request only while it was built
+    from the profile state the user was just loaded with, and at the
+    shared `current_version` (see current_permissions_version).
+    """
+    user._permission_claims = None
+
+    if payload.get("pbs") != PERMISSION_CLAIM_SCHEMA or "pbm" not in payload:
+        return
+
+    if current_version is None or payload.get("pv") != current_version:
+        return
+
+    try:
+        profile = user.profile
+        bitmap = int(payload["pbm"], 16)
+    except Exception:
+        return
+
+    if (
+        payload.get("pv") != profile.permissions_version
+        or payload.get("rid") != profile.role_id
+        or payload.get("cid") != profile.clinic_id
+    ):
+        return
+
+    user._permission_claims = bitmap
+
+
+def _claimed_permission(user, slots, action):
+    """
+    True / False from the token bitmap (any slot granted), or None when
+    there are no trusted claims or a slot is not encoded.
+    """
+    bitmap = getattr(user, "_permission_claims", None)
+    if bitmap is None:
+        return None
+
+    granted = False
+    for slot in slots:
+        index = _PERMISSION_CLAIM_INDEX.get(slot)
+        if index is None:
+            return None
+
+        offset = index * len(PERMISSION_ACTIONS) + PERMISSION_ACTIONS.index(action)
+        granted = granted or bool(bitmap >> offset & 1)
+
+    return granted
+
+
+# =========================
+# GET USER PERMISSIONS (FINAL)
+# =========================
+def get_user_permissions(user):
+    return get_permission_matrix(user)["tree"]
 
 
 # =========================
@@ -139,12 +428,16 @@ def has_permission(user, module, category, action):
     if is_super_admin_role(role):
         return True
 
-    if action not in {"view", "add", "edit", "print"}:
+    if action not in PERMISSION_ACTIONS:
         return False
 
     module = normalize_role_name(module)
     category = normalize_role_name(category)
 
+    claimed = _claimed_permission(user, [("perm", module, category)], action)
+    if claimed is not None:
+        return claimed
+
     permissions = get_user_permissions(user)
 
     try:
@@ -162,7 +455,7 @@ def has_subcategory_permission(user, module, category, subcategory, action):
     if is_super_admin_role(role):
         return True
 
-    if action not in {"view", "add", "edit", "print"}:
+    if action not in PERMISSION_ACTIONS:
         return False
 
     module = normalize_role_name(module)
@@ -181,9 +474,7 @@ def has_subcategory_permission(user, module, category, subcategory, action):
 # LABEL BASED PERMISSION (REQUIRED)
 # =========================
 def has_action_permission_for_labels(user, action, labels):
-    from restapi.models.user_permission import UserPermission
-
-    if action not in {"view", "add", "edit", "print"}:
+    if action not in PERMISSION_ACTIONS:
         return False
 
     role = get_user_role(user)
@@ -195,61 +486,20 @@ def has_action_permission_for_labels(user, action, labels):
     if not role:
         return False
 
-    normalized_labels = set()
+    normalized_labels = {normalize_role_name(label) for label in labels or []}
+    normalized_labels -= {"", "_"}
 
-    for label in labels or []:
-        normalized = normalize_role_name(label)
-        if not normalized or normalized == "_":
-            continue
-
-        normalized_labels.add(normalized)
-
-        # handle singular/plural
-        if normalized.endswith("s"):
-            normalized_labels.add(normalized[:-1])
-        else:
-            normalized_labels.add(f"{normalized}s")
-
-    # Check individual user-level permissions first (overrides role)
-    individual_perms = UserPermission.objects.filter(user=user)
-    if individual_perms.exists():
-        for perm in individual_perms:
-            if not getattr(perm, f"can_{action}", False):
-                continue
-
-            keys = {
-                normalize_role_name(perm.module_key),
-                normalize_role_name(perm.category_key),
-                normalize_role_name(perm.subcategory_key),
-            }
-            keys.discard("")
-            keys.discard("_")
-
-            if keys & normalized_labels:
-                return True
-
-        return False  # individual perms exist but none matched → deny
-
-    # Fall back to role-based permissions
-    role_perms = RolePermission.objects.filter(role=role)
-
-    for perm in role_perms:
-        if not getattr(perm, f"can_{action}", False):
-            continue
-
-        keys = {
-            normalize_role_name(perm.module_key),
-            normalize_role_name(perm.category_key),
-            normalize_role_name(perm.subcategory_key),
-        }
-
-        keys.discard("")
-        keys.discard("_")
+    claimed = _claimed_permission(
+        user, [("label", label) for label in normalized_labels], action
+    )
+    if claimed is not None:
+        return claimed
 
-        if keys & normalized_labels:
-            return True
+    # Individual permissions (when present) already replaced the role's;
+    # singular/plural spellings are precomputed in the label index
+    granted = get_permission_matrix(user)["labels"][action]
 
-    return False
+    return bool(granted & normalized_labels)
 
 
 # =========================
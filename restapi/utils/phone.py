@@ -0,0 +1,113 @@
+from typing import Optional
+
+from rest_framework.exceptions import ValidationError
+
+DEFAULT_COUNTRY_CODE = "+91"
+
+_EMPTY_NUMBERS = {"0", "00", "000", "0000000000"}
+
+_PLACEHOLDER_NUMBERS = {
+    "1111111111", "2222222222", "3333333333", "4444444444",
+    "5555555555", "6666666666", "7777777777", "8888888888",
+    "9999999999", "1234567890", "0123456789",
+}
+
+
+# =====================================================
+# VALIDATION (shared by lead writes and E.164 lookups)
+# =====================================================
+def validate_phone(value):
+    """
+    Validate a lead phone number and return its stored form.
+
+    ``+`` numbers are kept as-is, ``91XXXXXXXXXX`` loses its country
+    prefix and empty / all-zero values become None. Raises
+    ``ValidationError`` for anything else that is not a phone number.
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip()
+
+    if value == "" or value.lower() in ["null", "none"]:
+        return None
+
+    if value in _EMPTY_NUMBERS:
+        return None
+
+    value = value.replace(" ", "")
+
+    # INTERNATIONAL
+    if value.startswith("+"):
+        digits = value[1:]
+
+        if not digits.isdigit():
+            raise ValidationError({"contact_no": "Invalid international phone number"})
+
+        if len(digits) < 7 or len(digits) > 15:
+            raise ValidationError({"contact_no": "Invalid international phone number"})
+
+        return value
+
+    # INDIA
+    if value.startswith("91") and len(value) == 12:
+        value = value[2:]
+
+    if not value.isdigit():
+        raise ValidationError({"contact_no": "Phone must contain digits only"})
+
+    if not (7 <= len(value) <= 15):
+        raise ValidationError({"contact_no": "Phone number must be between 7 and 15 digits"})
+
+    if value in _PLACEHOLDER_NUMBERS:
+        raise ValidationError({"contact_no": "Invalid phone number"})
+
+    return value
+
+
+# =====================================================
+# E.164
+# =====================================================
+def to_e164(value, default_country_code: str = DEFAULT_COUNTRY_CODE) -> Optional[str]:
+    """
+    Normalize a stored or incoming phone number to E.164 (``+919876543210``).
+
+    Applies ``validate_phone`` after dropping formatting characters, so
+    a number is normalized only if it would be accepted as a contact_no:
+      - ``+`` numbers are international and kept as-is
+      - ``0XXXXXXXXXX`` loses its trunk prefix
+      - 10 digit numbers get ``default_country_code``
+
+    Returns None for anything that cannot be normalized unambiguously,
+    so the value is safe to use as an exact-match lookup key.
+    """
+    if value is None:
+        return None
+
+    raw = str(value).strip()
+
+    # Twilio WhatsApp senders arrive as "whatsapp:+91..."
+    if raw.lower().startswith("whatsapp:"):
+        raw = raw[len("whatsapp:"):]
+
+    for ch in ("-", "(", ")", "."):
+        raw = raw.replace(ch, "")
+
+    try:
+        number = validate_phone(raw)
+    except ValidationError:
+        return None
+
+    if not number:
+        return None
+
+    if number.startswith("+"):
+        return number
+
+    if number.startswith("0") and len(number) == 11:
+        number = number[1:]
+
+    if len(number) != 10:
+        return None
+
+    return f"{default_country_code}{number}"
@@ -12,6 +12,7 @@ from rest_framework.exceptions import AuthenticationFailed
 
 from restapi.serializers.user_serializer import UserSerializer
 from restapi.utils.jwt_authentication import JWTAuthentication
+from restapi.utils.permissions import build_permission_claims
 from restapi.models.role import Role
 from restapi.services.permission_service import get_user_permissions
 from restapi.models.clinic import Clinic
@@ -36,6 +37,9 @@ class LoginProxyAPIView(APIView):
             "iat": datetime.now(timezone.utc),
         }
 
+        # Role / clinic / permission bitmap, trusted while the version matches
+        payload.update(build_permission_claims(user))
+
         token = jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
         return token, expires_at
 
@@ -13,6 +13,7 @@ from drf_yasg.utils import swagger_auto_schema
 
 from restapi.services import get_user_permissions
 from restapi.utils.media import build_media_api_url
+from restapi.utils.permissions import build_permission_claims
 from django.contrib.auth.models import User
 from rest_framework.permissions import AllowAny
 
@@ -48,6 +49,8 @@ class LoginAPIView(APIView):
             "exp": expires_at,
             "iat": datetime.now(timezone.utc),
         }
+        # Role / clinic / permission bitmap, trusted while the version matches
+        payload.update(build_permission_claims(user))
         token = jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
         return token, expires_at
 
@@ -259,6 +262,7 @@ class TokenRefreshAPIView(APIView):
             "exp": expires_at,
             "iat": datetime.now(timezone.utc),
         }
+        access_payload.update(build_permission_claims(user))
         access_token = jwt.encode(access_payload, settings.SECRET_KEY, algorithm="HS256")
 
         return Response(
@@ -16,6 +16,7 @@ from rest_framework import status
 from rest_framework.exceptions import NotFound, ValidationError
 
 from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
 from restapi.services.campaign_social_post_service import get_facebook_post_insights
 from restapi.models import Campaign, CampaignEmailConfig
 from restapi.serializers.campaign_serializer import (
@@ -240,10 +241,35 @@ class CampaignUpdateAPIView(APIView):
 # -------------------------------------------------------------------
 # Campaign List API View (GET)
 # -------------------------------------------------------------------
+# Keys the list view adds on top of CampaignReadSerializer
+CAMPAIGN_INSIGHT_FIELDS = frozenset({
+    "impressions",
+    "clicks",
+    "emails_sent",
+    "bounces",
+    "unsubscribes",
+    "conversions",
+    "cost",
+    "ctr",
+})
+CAMPAIGN_LIST_EXTRA_FIELDS = CAMPAIGN_INSIGHT_FIELDS | {"lead_generated"}
+
+
 class CampaignListAPIView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get all campaigns for a clinic with lead count",
+        manual_parameters=[
+            openapi.Parameter("clinic_id", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=True),
+            openapi.Parameter(
+                "fields", openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                description="Comma-separated fields to return, e.g. id,campaign_name,status"
+            ),
+            openapi.Parameter(
+                "expand", openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                description="Comma-separated fields added on top of ?fields=, e.g. social_posts"
+            ),
+        ],
         responses={200: CampaignReadSerializer(many=True)},
         tags=["Campaigns"]
     )
@@ -263,31 +289,49 @@ class CampaignListAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # =====================================================
+        # ✅ OPTIMIZATION: ?fields= / ?expand= trim the response
+        #    AND the work behind it — lead_count, the config
+        #    prefetches and the Mailchimp report are only
+        #    loaded when a requested field needs them
+        # =====================================================
+        fields = CampaignReadSerializer.sparse_fields_from_request(
+            request, extra_fields=CAMPAIGN_LIST_EXTRA_FIELDS
+        )
+        wants_lead_count = fields is None or "lead_generated" in fields
+        wants_insights = fields is None or bool(fields & CAMPAIGN_INSIGHT_FIELDS)
+
+        # Insights read email_configs / social_configs even when the
+        # nested "email" / "social_media" fields are not rendered
+        relation_fields = fields
+        if fields is not None and wants_insights:
+            relation_fields = fields | {"email", "social_media"}
+
         # =====================================================
         # ✅ OPTIMIZATION: Use prefetch_related() and Prefetch
         #    to eliminate N+1 queries for related objects
         # =====================================================
-        email_configs_prefetch = Prefetch(
-            'email_configs',
-            CampaignEmailConfig.objects.filter(is_active=True)
-        )
+        campaigns = Campaign.objects.filter(clinic_id=clinic_id, is_deleted=False)
 
-        campaigns = (
-            Campaign.objects
-            .filter(clinic_id=clinic_id, is_deleted=False)
-            .annotate(lead_count=Count('leads'))
-            .prefetch_related(
-                email_configs_prefetch,
-                'social_configs',
-                'social_posts'
-            )
-            .order_by("-created_at")
-        )
+        if wants_lead_count:
+            campaigns = campaigns.annotate(lead_count=Count('leads'))
+
+        campaigns = CampaignReadSerializer.prepare_queryset(
+            campaigns, relation_fields
+        ).order_by("-created_at")
 
         data = []
         for campaign in campaigns:
-            campaign_data = CampaignReadSerializer(campaign, context={"request": request}).data
-            campaign_data["lead_generated"] = campaign.lead_count
+            campaign_data = CampaignReadSerializer(
+                campaign, fields=fields, context={"request": request}
+            ).data
+
+            if wants_lead_count:
+                campaign_data["lead_generated"] = campaign.lead_count
+
+            if not wants_insights:
+                data.append(campaign_data)
+                continue
 
             # =====================================================
             # ✅ FIX: Get Mailchimp ID from CampaignEmailConfig
@@ -364,6 +408,10 @@ class CampaignListAPIView(APIView):
                 campaign_data["bounces"]      = 0
                 campaign_data["unsubscribes"] = 0
 
+            if fields is not None:
+                for key in CAMPAIGN_INSIGHT_FIELDS - fields:
+                    campaign_data.pop(key, None)
+
             data.append(campaign_data)
 
         return Response(data, status=status.HTTP_200_OK)
@@ -18,6 +18,10 @@ from restapi.serializers.lead_email_serializer import (
     LeadMailListSerializer
 )
 from restapi.services.lead_email_service import send_lead_email
+from restapi.services.lead_service import (
+    clinic_ids_for_inbound_address,
+    find_lead_by_email,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -154,11 +158,17 @@ class LeadEmailInboundWebhookAPIView(APIView):
                 )
 
             # ── Find lead by email ────────────────────────────────────────
-            from restapi.models.lead import Lead
+            # ✅ OPTIMIZATION: scoped to the clinic(s) owning the recipient
+            # mailbox and matched on lower(email), an indexed point query
+            clinic_ids = clinic_ids_for_inbound_address(to_email)
+
+            if to_email and not clinic_ids:
+                logger.warning(
+                    "LeadEmailInbound: no clinic mailbox matches to=%s, "
+                    "matching across all clinics", to_email
+                )
 
-            lead = Lead.objects.filter(
-                email__iexact=from_email.strip()
-            ).first()
+            lead = find_lead_by_email(from_email, clinic_ids=clinic_ids)
 
             if not lead:
                 logger.warning(
@@ -1,36 +1,102 @@
 # =====================================================
 # Imports (ONLY REQUIRED)
 # =====================================================
+import csv
+import json
 import logging
 import traceback
+import uuid
+from datetime import timedelta
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.negotiation import DefaultContentNegotiation
 from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
 
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, QueryDict, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.db.models import Q, Prefetch
 
-from restapi.models import Lead, Clinic, PipelineStage, Department
-from restapi.serializers.lead_serializer import LeadSerializer, LeadReadSerializer
+from restapi.models import Lead, Clinic, Pipeline, PipelineStage, Department
+from restapi.serializers.lead_serializer import (
+    LeadSerializer,
+    LeadReadSerializer,
+    LeadSearchResultSerializer,
+)
+from restapi.pagination import KeysetCursorPagination
 from restapi.services.zapier_service import send_to_zapier
+from restapi.services.lead_import_service import import_leads, iter_import_rows
+from restapi.services.lead_timeline_service import (
+    get_lead_timeline,
+    TIMELINE_DEFAULT_PAGE_SIZE,
+    TIMELINE_MAX_PAGE_SIZE,
+)
+from restapi.services.lead_service import (
+    bulk_update_leads,
+    count_leads_by_quality,
+    custom_field_filters_from_params,
+    iter_lead_export_rows,
+    lead_board_columns,
+    lead_quality_case,
+    lead_quality_q,
+    search_leads,
+    validate_lead_bulk_filter,
+    LEAD_BOARD_DEFAULT_PER_STAGE,
+    LEAD_BOARD_MAX_PER_STAGE,
+    LEAD_BOARD_ORDERING,
+    LEAD_BULK_ACTIONS,
+    LEAD_BULK_FILTER_KEYS,
+    LEAD_EXPORT_COLUMNS,
+    LEAD_SEARCH_MIN_LENGTH,
+)
 from restapi.utils.permissions import (
     has_action_permission_for_labels,
     normalize_role_name,
 )
-from restapi.models.twilio import TwilioCall, TwilioMessage
-from restapi.models.lead_mail import LeadEmail
-from django.db.models import OuterRef, Subquery
-from django.db.models import DateTimeField
-from django.db.models.functions import Greatest, Coalesce
 from restapi.services.patient_sync_service import sync_patient_to_external_system
 
 LEAD_LABELS = ["leads hub"]
 
+# ?ordering= value -> keyset ordering (always ends on a unique column)
+LEAD_LIST_ORDERINGS = {
+    "created_at": ("created_at", "id"),
+    "-created_at": ("-created_at", "-id"),
+    "last_interaction": ("last_interaction_at", "id"),
+    "-last_interaction": ("-last_interaction_at", "-id"),
+    # quality is monotonic in last_interaction_at: Hot first / Cold first
+    "quality": ("-last_interaction_at", "-id"),
+    "-quality": ("last_interaction_at", "id"),
+}
+
+# Card fields a pipeline board renders when ?fields= is not given
+LEAD_BOARD_CARD_FIELDS = (
+    "id",
+    "full_name",
+    "contact_no",
+    "email",
+    "lead_status",
+    "stage_id",
+    "assigned_to_name",
+    "quality",
+    "last_interaction_at",
+    "created_at",
+)
+
+# Delta sync: keyset on (modified_at, id). Rows younger than the settle
+# window are held back for the next poll so a transaction that commits
+# late with an earlier modified_at is never skipped by a token.
+LEAD_CHANGES_ORDERING = ("modified_at", "id")
+LEAD_CHANGES_PAGE_SIZE = 200
+LEAD_CHANGES_MAX_PAGE_SIZE = 1000
+LEAD_CHANGES_SETTLE_SECONDS = 2
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,30 +155,129 @@ def apply_lead_visibility_scope(queryset, request):
     )
 
 
-def get_scoped_lead_or_404(request, clinic, lead_id):
+def apply_lead_list_filters(queryset, params):
+    """
+    ?lead_status=, ?assigned_to= and ?cf.<field_key>= filters shared by
+    the list, export and bulk endpoints. `params` may be query params
+    or a plain dict.
+    """
+    lead_status = params.get("lead_status")
+    assigned_to = params.get("assigned_to")
+
+    if lead_status:
+        queryset = queryset.filter(lead_status=lead_status)
+
+    if assigned_to:
+        queryset = queryset.filter(assigned_to_id=assigned_to)
+
     # =====================================================
-    # ✅ OPTIMIZATION: Use select_related() for all FK relations
-    #    and prefetch_related() for M2M relations to eliminate N+1 queries
+    # CUSTOM FIELDS: ?cf.<field_key>=value (GIN containment)
     # =====================================================
-    queryset = Lead.objects.select_related(
-        "clinic",
-        "department",
-        "campaign",
-        "referral_department",
-        "referral_source",
-        "stage",
-        "converted_at_stage",
-    ).prefetch_related(
-        "documents",
-        "treatment_interest",
-        "custom_field_values__field",
-    ).filter(
-        id=lead_id,
-        clinic=clinic,
+    custom_field_filters = custom_field_filters_from_params(params)
+
+    if custom_field_filters:
+        queryset = queryset.filter(custom_fields__contains=custom_field_filters)
+
+    return queryset
+
+
+def apply_lead_quality_filter(queryset, params, now):
+    quality = params.get("quality")
+
+    if not quality:
+        return queryset
+
+    quality_filter = lead_quality_q(quality, now)
+
+    if quality_filter is None:
+        raise ValidationError({"quality": "Must be one of: hot, warm, cold"})
+
+    return queryset.filter(quality_filter)
+
+
+def is_truthy_param(value):
+    return str(value or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def wants_cursor_pagination(request):
+    params = request.query_params
+    return (
+        params.get("pagination") == "cursor"
+        or bool(params.get(KeysetCursorPagination.cursor_query_param))
+    )
+
+
+def get_scoped_lead_or_404(request, clinic, lead_id, fields=None):
+    # =====================================================
+    # ✅ OPTIMIZATION: select_related() / prefetch_related() only for the
+    #    relations LeadReadSerializer will render (all of them by default)
+    # =====================================================
+    queryset = LeadReadSerializer.prepare_queryset(
+        Lead.objects.filter(
+            id=lead_id,
+            clinic=clinic,
+        ),
+        fields,
     )
     return get_object_or_404(apply_lead_visibility_scope(queryset, request))
 
 
+# =====================================================
+# LEAD WRITE PAYLOAD
+# ✅ OPTIMIZATION: QueryDict.copy() deep-copies every
+#    UploadedFile in a multipart body (and the old status
+#    fix copied it twice). The lists are rebuilt instead,
+#    so file objects are shared and never duplicated.
+# =====================================================
+def _mutable_request_data(request):
+    data = request.data
+
+    if not isinstance(data, QueryDict):
+        return dict(data)
+
+    # Stays a QueryDict so JSON fields keep their form-input parsing
+    mutable = QueryDict(mutable=True)
+    for key, values in data.lists():
+        mutable.setlist(key, list(values))
+
+    return mutable
+
+
+def build_lead_write_data(request, normalize_status=False):
+    """
+    Serializer input for lead create / update with documents,
+    treatment_interest and (optionally) lead_status normalized.
+    """
+    data = _mutable_request_data(request)
+
+    # 🔥 DOCUMENT FIX
+    files = request.FILES.getlist("documents") if hasattr(request, "FILES") else []
+    if files:
+        data.setlist("documents", files)
+
+    # 🔥 TREATMENT INTEREST FIX
+    # multipart/form-data already yields a list through getlist()
+    if "treatment_interest" in data and not isinstance(data, QueryDict):
+        treatment_interest = data.get("treatment_interest", [])
+
+        if treatment_interest in [None, "", "null"]:
+            treatment_interest = []
+
+        if not isinstance(treatment_interest, list):
+            treatment_interest = [treatment_interest]
+
+        data["treatment_interest"] = treatment_interest
+
+    # STATUS FIX
+    if normalize_status and "lead_status" in data:
+        data["lead_status"] = str(data.get("lead_status")).strip().lower()
+
+        # Services read request.data; share the normalized payload
+        request._full_data = data
+
+    return data
+
+
 # -------------------------------------------------------------------
 # Lead Create API View (POST)
 # -------------------------------------------------------------------
@@ -162,51 +327,7 @@ class LeadCreateAPIView(APIView):
                         "stage_id": "Stage does not belong to selected pipeline"
                     })
 
-            # =====================================================
-            # DATA COPY
-            # =====================================================
-            data = request.data.copy()
-
-            # =====================================================
-            # 🔥 DOCUMENT FIX
-            # =====================================================
-            if hasattr(request, "FILES"):
-
-                files = request.FILES.getlist("documents")
-
-                if files:
-                    data.setlist("documents", files)
-
-            # =====================================================
-            # 🔥 TREATMENT INTEREST FIX
-            # =====================================================
-            if "treatment_interest" in data:
-
-                # multipart/form-data
-                if hasattr(data, "getlist"):
-
-                    treatment_interest = data.getlist("treatment_interest")
-
-                    if not treatment_interest:
-                        single_interest = data.get("treatment_interest")
-
-                        if single_interest:
-                            treatment_interest = [single_interest]
-
-                    data.setlist("treatment_interest", treatment_interest)
-
-                # application/json
-                else:
-
-                    treatment_interest = data.get("treatment_interest", [])
-
-                    if treatment_interest in [None, "", "null"]:
-                        treatment_interest = []
-
-                    if not isinstance(treatment_interest, list):
-                        treatment_interest = [treatment_interest]
-
-                    data["treatment_interest"] = treatment_interest
+            data = build_lead_write_data(request)
 
             serializer = LeadSerializer(
                 data=data,
@@ -217,6 +338,17 @@ class LeadCreateAPIView(APIView):
 
             lead = serializer.save()
 
+            # =====================================================
+            # DUPLICATE MERGED INTO AN EXISTING LEAD (clinic policy)
+            # =====================================================
+            dedupe_match = getattr(lead, "dedupe_match", None)
+
+            if dedupe_match and dedupe_match["policy"] == Clinic.LeadDedupePolicy.MERGE:
+                return Response(
+                    {**LeadReadSerializer(lead).data, "duplicate": dedupe_match},
+                    status=200
+                )
+
             send_to_zapier({
                 "event": "lead_created",
                 "lead_id": str(lead.id),
@@ -289,67 +421,12 @@ class LeadUpdateAPIView(APIView):
                 lead_id
             )
 
-            data = request.data.copy()
-
-            # =====================================================
-            # 🔥 DOCUMENT FIX
-            # =====================================================
-            if hasattr(request, "FILES"):
-
-                files = request.FILES.getlist("documents")
-
-                if files:
-                    data.setlist("documents", files)
-
-            # =====================================================
-            # 🔥 TREATMENT INTEREST FIX
-            # =====================================================
-            if "treatment_interest" in data:
-
-                # multipart/form-data
-                if hasattr(data, "getlist"):
-
-                    treatment_interest = data.getlist("treatment_interest")
-
-                    if not treatment_interest:
-
-                        single_interest = data.get("treatment_interest")
-
-                        if single_interest:
-                            treatment_interest = [single_interest]
-
-                    data.setlist("treatment_interest", treatment_interest)
+            data = build_lead_write_data(request, normalize_status=True)
 
-                # application/json
-                else:
-
-                    treatment_interest = data.get("treatment_interest", [])
-
-                    if treatment_interest in [None, "", "null"]:
-                        treatment_interest = []
-
-                    if not isinstance(treatment_interest, list):
-                        treatment_interest = [treatment_interest]
-
-                    data["treatment_interest"] = treatment_interest
-
-            # =====================================================
-            # STATUS FIX
-            # =====================================================
             if "lead_status" in data:
-
-                status_val = str(
-                    data.get("lead_status")
-                ).strip().lower()
-
-                data["lead_status"] = status_val
-
-                request._full_data = request.data.copy()
-                request._full_data["lead_status"] = status_val
-
                 logger.info(
                     "Lead Update Requested Status: %s",
-                    status_val
+                    data["lead_status"]
                 )
 
             # =====================================================
@@ -522,7 +599,48 @@ class LeadListAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
-        operation_description="Get all active leads",
+        operation_description=(
+            "Get all active leads. Pass pagination=cursor (or a cursor token) "
+            "to receive keyset-paginated pages ordered by (created_at, id)."
+        ),
+        manual_parameters=[
+            openapi.Parameter("lead_status", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("assigned_to", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter(
+                "cf.<field_key>",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Filter on a custom lead field, e.g. cf.preferred_doctor=Dr%20Rao",
+            ),
+            openapi.Parameter("quality", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="hot / warm / cold"),
+            openapi.Parameter(
+                "ordering",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="-created_at (default), created_at, quality, -quality, last_interaction, -last_interaction",
+            ),
+            openapi.Parameter(
+                "include_counts",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                description="Wrap the response with per-quality counts",
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma-separated fields to return, e.g. id,full_name,stage_name,quality",
+            ),
+            openapi.Parameter(
+                "expand",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Extra fields on top of ?fields=, e.g. documents,custom_field_values",
+            ),
+            openapi.Parameter("pagination", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="cursor"),
+            openapi.Parameter("cursor", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("page_size", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
         responses={200: LeadReadSerializer(many=True)},
         tags=["Leads"]
     )
@@ -533,102 +651,689 @@ class LeadListAPIView(APIView):
 
         try:
             clinic = get_request_clinic(request)
-            latest_call_subquery = (
-                TwilioCall.objects.filter(
-                    lead=OuterRef("pk"),
-                    status__in=["completed", "answered", "in-progress"]
-                )
-                .order_by("-created_at")
-                .values("created_at")[:1]
-            )
-
-            latest_sms_subquery = (
-                TwilioMessage.objects.filter(
-                    lead=OuterRef("pk"),
-                    status__in=[
-                        "queued",
-                        "queued_via_zapier",
-                        "sent",
-                        "delivered",
-                    ]
-                )
-                .order_by("-created_at")
-                .values("created_at")[:1]
-            )
 
-            latest_email_subquery = (
-                LeadEmail.objects.filter(
-                    lead=OuterRef("pk"),
-                    status="SENT",
-                    sent_at__isnull=False
-                )
-                .order_by("-sent_at")
-                .values("sent_at")[:1]
+            # =====================================================
+            # ✅ OPTIMIZATION: select_related() / prefetch_related() only
+            #    for the fields requested via ?fields= / ?expand=
+            #    (every relation when neither is given)
+            # =====================================================
+            fields = LeadReadSerializer.sparse_fields_from_request(request)
+
+            queryset = apply_lead_visibility_scope(
+                LeadReadSerializer.prepare_queryset(
+                    Lead.objects.filter(clinic=clinic, is_deleted=False),
+                    fields,
+                ).order_by("-created_at"),
+                request,
             )
 
+            queryset = apply_lead_list_filters(queryset, request.query_params)
 
             # =====================================================
-            # ✅ OPTIMIZATION: Use select_related() for all FK relations
-            #    and prefetch_related() for M2M relations to eliminate N+1 queries
+            # QUALITY (Hot / Warm / Cold) — computed in SQL
             # =====================================================
+            now = timezone.now()
+
+            ordering_param = request.query_params.get("ordering") or "-created_at"
+            ordering = LEAD_LIST_ORDERINGS.get(ordering_param)
+
+            if ordering is None:
+                raise ValidationError({
+                    "ordering": f"Must be one of: {', '.join(LEAD_LIST_ORDERINGS)}"
+                })
+
+            # Counts are taken before the quality filter so every tab can show its total
+            quality_counts = None
+            if is_truthy_param(request.query_params.get("include_counts")):
+                quality_counts = count_leads_by_quality(queryset, now)
+
+            queryset = apply_lead_quality_filter(queryset, request.query_params, now)
+
+            if fields is None or "quality" in fields:
+                queryset = queryset.annotate(quality_db=lead_quality_case(now))
+
+            extra = {"quality_counts": quality_counts} if quality_counts is not None else {}
+
+            # =====================================================
+            # OPT-IN KEYSET PAGINATION
+            # =====================================================
+            if wants_cursor_pagination(request):
+                paginator = KeysetCursorPagination(ordering=ordering)
+                page = paginator.paginate_queryset(queryset, request, view=self)
+                serializer = LeadReadSerializer(page, many=True, fields=fields, context={"request": request})
+                return paginator.get_paginated_response(serializer.data, **extra)
+
+            queryset = queryset.order_by(*ordering)
+
+            serializer = LeadReadSerializer(queryset, many=True, fields=fields, context={"request": request})
+
+            if extra:
+                return Response({**extra, "results": serializer.data}, status=200)
+
+            return Response(serializer.data, status=200)
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Lead List Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+
+# -------------------------------------------------------------------
+# Lead Search API (GET)
+# -------------------------------------------------------------------
+class LeadSearchAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    default_page_size = 20
+    max_page_size = 50
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Ranked lead search over name, email, phone, location and contact name. "
+            "Digit-only queries match partial phone numbers; queries containing '@' "
+            "match email addresses (full, partial or '@domain')."
+        ),
+        manual_parameters=[
+            openapi.Parameter("q", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter("page", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter("page_size", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: LeadSearchResultSerializer(many=True)},
+        tags=["Leads"]
+    )
+    def get(self, request):
+
+        if not has_action_permission_for_labels(request.user, "view", LEAD_LABELS):
+            return Response({"error": "No permission"}, status=403)
+
+        try:
+            clinic = get_request_clinic(request)
+
+            q = (request.query_params.get("q") or "").strip()
+
+            try:
+                page = max(1, int(request.query_params.get("page", 1)))
+                page_size = int(request.query_params.get("page_size", self.default_page_size))
+            except (TypeError, ValueError):
+                raise ValidationError({"page": "page and page_size must be integers"})
+
+            page_size = max(1, min(page_size, self.max_page_size))
+
+            if len(q) < LEAD_SEARCH_MIN_LENGTH:
+                return Response({
+                    "results": [],
+                    "page": page,
+                    "page_size": page_size,
+                    "has_more": False,
+                }, status=200)
+
             queryset = apply_lead_visibility_scope(
                 Lead.objects.filter(clinic=clinic, is_deleted=False)
-                .select_related(
-                    "clinic",
-                    "department",
-                    "campaign",
-                    "referral_department",
-                    "referral_source",
-                    "stage",
-                    "converted_at_stage",
-                )
-                .prefetch_related(
-                    "documents",
-                    "treatment_interest",
-                    "custom_field_values__field",
+                .select_related("stage")
+                .only(
+                    "id",
+                    "full_name",
+                    "email",
+                    "contact_no",
+                    "contact_full_name",
+                    "contact_phone",
+                    "location",
+                    "lead_status",
+                    "assigned_to_id",
+                    "assigned_to_name",
+                    "created_at",
+                    "stage__stage_name",
+                ),
+                request,
+            )
+
+            start = (page - 1) * page_size
+
+            # Fetch one extra row instead of COUNT(*) to know if there is a next page
+            rows = list(search_leads(queryset, q)[start:start + page_size + 1])
+
+            serializer = LeadSearchResultSerializer(rows[:page_size], many=True)
+
+            return Response({
+                "results": serializer.data,
+                "page": page,
+                "page_size": page_size,
+                "has_more": len(rows) > page_size,
+            }, status=200)
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Lead Search Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+
+# -------------------------------------------------------------------
+# Lead Bulk Import API (POST)
+# -------------------------------------------------------------------
+class LeadImportAPIView(APIView):
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Bulk import leads from a CSV or XLSX file. Rows are validated and "
+            "inserted in batches; invalid rows are reported by row number. The clinic's "
+            "lead dedupe policy applies to every row (attached / merged counts, rejected "
+            "duplicates reported as failed rows)."
+        ),
+        manual_parameters=[
+            openapi.Parameter("clinic_id", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=True),
+            openapi.Parameter("file", openapi.IN_FORM, type=openapi.TYPE_FILE, required=True),
+            openapi.Parameter(
+                "department_id", openapi.IN_FORM, type=openapi.TYPE_INTEGER,
+                description="Department for rows without a department column",
+            ),
+            openapi.Parameter("dry_run", openapi.IN_FORM, type=openapi.TYPE_BOOLEAN),
+        ],
+        responses={200: "Import summary", 400: "Validation Error", 403: "Forbidden"},
+        tags=["Leads"],
+    )
+    def post(self, request):
+
+        if not has_action_permission_for_labels(request.user, "add", LEAD_LABELS):
+            return Response(
+                {"error": "You do not have permission to add leads."},
+                status=403
+            )
+
+        try:
+            clinic = get_request_clinic(request)
+
+            upload = request.FILES.get("file")
+            if not upload:
+                raise ValidationError({"file": "File is required"})
+
+            result = import_leads(
+                iter_import_rows(upload, upload.name),
+                clinic,
+                request=request,
+                default_department_id=request.data.get("department_id") or None,
+                dry_run=is_truthy_param(request.data.get("dry_run")),
+                source_name=upload.name,
+            )
+
+            return Response(result, status=200)
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Lead Import Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+
+# -------------------------------------------------------------------
+# Lead Bulk Actions API (POST)
+# -------------------------------------------------------------------
+class LeadBulkActionAPIView(APIView):
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Apply one action to many leads with set-based updates. Target leads "
+            "either by `lead_ids` or by a `filter` object using the list filters "
+            f"({', '.join(LEAD_BULK_FILTER_KEYS)}, cf.<field_key>); any other key is rejected."
+        ),
+        manual_parameters=[
+            openapi.Parameter("clinic_id", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=True),
+        ],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["action"],
+            properties={
+                "action": openapi.Schema(type=openapi.TYPE_STRING, enum=list(LEAD_BULK_ACTIONS)),
+                "lead_ids": openapi.Schema(
+                    type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING)
+                ),
+                "filter": openapi.Schema(type=openapi.TYPE_OBJECT),
+                "assigned_to_id": openapi.Schema(type=openapi.TYPE_INTEGER, description="assign"),
+                "stage_id": openapi.Schema(type=openapi.TYPE_STRING, description="move_stage"),
+                "lead_status": openapi.Schema(type=openapi.TYPE_STRING, description="change_status"),
+            },
+        ),
+        responses={200: "Bulk action summary", 400: "Validation Error", 403: "Forbidden"},
+        tags=["Leads"],
+    )
+    def post(self, request):
+
+        if not has_action_permission_for_labels(request.user, "edit", LEAD_LABELS):
+            return Response(
+                {"error": "You do not have permission to edit leads."},
+                status=403
+            )
+
+        try:
+            clinic = get_request_clinic(request)
+
+            lead_ids = request.data.get("lead_ids")
+            filters = request.data.get("filter")
+
+            if bool(lead_ids) == bool(filters):
+                raise ValidationError({"lead_ids": "Provide either lead_ids or a non-empty filter"})
+
+            queryset = apply_lead_visibility_scope(
+                Lead.objects.filter(clinic=clinic, is_deleted=False),
+                request,
+            )
+
+            if lead_ids:
+                if not isinstance(lead_ids, list):
+                    raise ValidationError({"lead_ids": "Expected a list of lead IDs"})
+
+                try:
+                    lead_ids = [uuid.UUID(str(lead_id)) for lead_id in lead_ids]
+                except ValueError:
+                    raise ValidationError({"lead_ids": "Invalid lead ID"})
+
+                queryset = queryset.filter(id__in=lead_ids)
+
+            else:
+                validate_lead_bulk_filter(filters)
+
+                queryset = apply_lead_list_filters(queryset, filters)
+                queryset = apply_lead_quality_filter(queryset, filters, timezone.now())
+
+            summary, converted_ids = bulk_update_leads(
+                queryset,
+                clinic,
+                request.data.get("action"),
+                request.data,
+                request=request,
+            )
+
+            # =====================================================
+            # EXTERNAL PATIENT SYNC (newly converted leads only)
+            # =====================================================
+            for lead in Lead.objects.filter(
+                id__in=converted_ids,
+                external_patient_id__isnull=True,
+            ):
+                try:
+                    sync_patient_to_external_system(lead)
+                except Exception:
+                    lead.external_patient_sync_error = traceback.format_exc()
+                    lead.save(update_fields=["external_patient_sync_error"])
+
+                    logger.exception("External patient sync failed for lead %s", lead.id)
+
+            return Response(summary, status=200)
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Lead Bulk Action Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+
+# -------------------------------------------------------------------
+# Lead Export API (GET, streamed)
+# -------------------------------------------------------------------
+class LeadExportContentNegotiation(DefaultContentNegotiation):
+    """`?format=` picks the export format here, not a DRF renderer."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class _Echo:
+    """csv.writer target that hands each encoded line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def _export_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def stream_lead_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(LEAD_EXPORT_COLUMNS)
+
+    for row in rows:
+        yield writer.writerow([_export_cell(row[column]) for column in LEAD_EXPORT_COLUMNS])
+
+
+def stream_lead_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+class LeadExportAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = LeadExportContentNegotiation
+
+    export_formats = {
+        "csv": (stream_lead_csv, "text/csv"),
+        "ndjson": (stream_lead_ndjson, "application/x-ndjson"),
+    }
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Stream every lead matching the list filters as CSV or NDJSON. "
+            "Rows are read through a server-side cursor, so memory stays flat "
+            "regardless of clinic size."
+        ),
+        manual_parameters=[
+            openapi.Parameter("format", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="csv (default) / ndjson"),
+            openapi.Parameter("lead_status", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("assigned_to", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter("quality", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="hot / warm / cold"),
+            openapi.Parameter("cf.<field_key>", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        ],
+        responses={200: "CSV or NDJSON stream"},
+        tags=["Leads"]
+    )
+    def get(self, request):
+
+        if not has_action_permission_for_labels(request.user, "view", LEAD_LABELS):
+            return Response({"error": "No permission"}, status=403)
+
+        try:
+            clinic = get_request_clinic(request)
+
+            export_format = (request.query_params.get("format") or "csv").strip().lower()
+
+            if export_format not in self.export_formats:
+                raise ValidationError({"format": f"Must be one of: {', '.join(self.export_formats)}"})
+
+            now = timezone.now()
+
+            queryset = apply_lead_visibility_scope(
+                Lead.objects.filter(clinic=clinic, is_deleted=False),
+                request,
+            )
+            queryset = apply_lead_list_filters(queryset, request.query_params)
+            queryset = apply_lead_quality_filter(queryset, request.query_params, now)
+
+            stream, content_type = self.export_formats[export_format]
+
+            response = StreamingHttpResponse(
+                stream(iter_lead_export_rows(queryset, now)),
+                content_type=content_type,
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="leads-{clinic.id}-{now:%Y%m%d}.{export_format}"'
+            )
+            # Let nginx pass chunks through instead of buffering the whole export
+            response["X-Accel-Buffering"] = "no"
+
+            return response
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Lead Export Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+
+# -------------------------------------------------------------------
+# Pipeline Board API (GET) — kanban columns
+# -------------------------------------------------------------------
+class PipelineBoardAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Kanban board for a pipeline: every active stage with its total "
+            "lead count and the newest per_stage lead cards, in one query. "
+            "Pass stage_id + cursor (a stage's next_cursor) to load more "
+            "cards for a single stage."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "per_stage",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description=f"Cards per stage (default {LEAD_BOARD_DEFAULT_PER_STAGE}, max {LEAD_BOARD_MAX_PER_STAGE})",
+            ),
+            openapi.Parameter("stage_id", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Load more for one stage"),
+            openapi.Parameter("cursor", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("lead_status", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("assigned_to", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter("quality", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="hot / warm / cold"),
+            openapi.Parameter("cf.<field_key>", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Card fields (default: " + ",".join(LEAD_BOARD_CARD_FIELDS) + ")",
+            ),
+        ],
+        tags=["Pipelines"]
+    )
+    def get(self, request, pipeline_id):
+
+        if not has_action_permission_for_labels(request.user, "view", LEAD_LABELS):
+            return Response({"error": "No permission"}, status=403)
+
+        try:
+            clinic = get_request_clinic(request)
+
+            pipeline = Pipeline.objects.filter(
+                id=pipeline_id, clinic=clinic, is_deleted=False
+            ).first()
+
+            if not pipeline:
+                raise NotFound("Pipeline not found")
+
+            per_stage = self.get_per_stage(request)
+
+            fields = LeadReadSerializer.sparse_fields_from_request(request)
+            if fields is None:
+                fields = set(LEAD_BOARD_CARD_FIELDS)
+
+            stages = list(
+                PipelineStage.objects.filter(
+                    pipeline=pipeline, is_deleted=False, is_active=True
+                ).order_by("stage_order")
+            )
+
+            now = timezone.now()
+
+            queryset = apply_lead_visibility_scope(
+                LeadReadSerializer.prepare_queryset(
+                    Lead.objects.filter(clinic=clinic, is_deleted=False),
+                    fields,
+                ),
+                request,
+            )
+            queryset = apply_lead_list_filters(queryset, request.query_params)
+            queryset = apply_lead_quality_filter(queryset, request.query_params, now)
+
+            if "quality" in fields:
+                queryset = queryset.annotate(quality_db=lead_quality_case(now))
+
+            paginator = KeysetCursorPagination(ordering=LEAD_BOARD_ORDERING, page_size=per_stage)
+            paginator.page_size_query_param = "per_stage"
+            paginator.max_page_size = LEAD_BOARD_MAX_PER_STAGE
+
+            # =====================================================
+            # LOAD MORE: keyset page inside a single stage
+            # =====================================================
+            stage_id = request.query_params.get("stage_id")
+
+            if stage_id:
+                stage = next((s for s in stages if str(s.id) == stage_id), None)
+
+                if not stage:
+                    raise NotFound("Stage not found")
+
+                page = paginator.paginate_queryset(
+                    queryset.filter(stage_id=stage.id), request, view=self
                 )
-                .annotate(
-                    latest_call_at=Subquery(
-                        latest_call_subquery,
-                        output_field=DateTimeField(),
-                    ),
-                    latest_sms_at=Subquery(
-                        latest_sms_subquery,
-                        output_field=DateTimeField(),
+
+                return Response({
+                    "stage_id": stage.id,
+                    "next_cursor": paginator.next_cursor,
+                    "leads": LeadReadSerializer(
+                        page, many=True, fields=fields, context={"request": request}
+                    ).data,
+                }, status=200)
+
+            # =====================================================
+            # ✅ OPTIMIZATION: top-N cards + totals for every stage
+            #    in one window-function query
+            # =====================================================
+            columns = lead_board_columns(queryset, [stage.id for stage in stages], per_stage)
+
+            data = []
+            for stage in stages:
+                column = columns[stage.id]
+                leads = column["leads"]
+
+                data.append({
+                    "stage_id": stage.id,
+                    "stage_name": stage.stage_name,
+                    "stage_type": stage.stage_type,
+                    "color_code": stage.color_code,
+                    "stage_order": stage.stage_order,
+                    "is_conversion_stage": stage.is_conversion_stage,
+                    "total": column["total"],
+                    "next_cursor": (
+                        paginator.encode_cursor(leads[-1]) if column["has_more"] else None
                     ),
-                    latest_email_at=Subquery(
-                        latest_email_subquery,
-                        output_field=DateTimeField(),
+                    "leads": LeadReadSerializer(
+                        leads, many=True, fields=fields, context={"request": request}
+                    ).data,
+                })
+
+            return Response({
+                "pipeline_id": pipeline.id,
+                "per_stage": per_stage,
+                "stages": data,
+            }, status=200)
+
+        except NotFound as nf:
+            return Response({"error": str(nf.detail)}, status=404)
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Pipeline Board Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+    def get_per_stage(self, request):
+        raw = request.query_params.get("per_stage")
+
+        if not raw:
+            return LEAD_BOARD_DEFAULT_PER_STAGE
+
+        try:
+            per_stage = int(raw)
+        except (TypeError, ValueError):
+            raise ValidationError({"per_stage": "Must be an integer"})
+
+        return max(1, min(per_stage, LEAD_BOARD_MAX_PER_STAGE))
+
+
+# -------------------------------------------------------------------
+# Lead Changes API (GET) — delta sync
+# -------------------------------------------------------------------
+class LeadChangesAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Leads created, modified or soft-deleted after ?since=<token>, "
+            "oldest change first. Soft-deleted leads come back as tombstones "
+            "in `deleted`. Store `next_token` and pass it as ?since= on the "
+            "next poll; keep polling while `has_more` is true. Without "
+            "?since= every lead is returned (initial sync)."
+        ),
+        manual_parameters=[
+            openapi.Parameter("since", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter(
+                "page_size",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description=f"Default {LEAD_CHANGES_PAGE_SIZE}, max {LEAD_CHANGES_MAX_PAGE_SIZE}",
+            ),
+            openapi.Parameter("fields", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("expand", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        ],
+        tags=["Leads"]
+    )
+    def get(self, request):
+
+        if not has_action_permission_for_labels(request.user, "view", LEAD_LABELS):
+            return Response({"error": "No permission"}, status=403)
+
+        try:
+            clinic = get_request_clinic(request)
+
+            fields = LeadReadSerializer.sparse_fields_from_request(request)
+            now = timezone.now()
+
+            # =====================================================
+            # ✅ OPTIMIZATION: (clinic, modified_at, id) index range
+            #    scan; deleted rows are kept so they can be tombstoned
+            # =====================================================
+            queryset = apply_lead_visibility_scope(
+                LeadReadSerializer.prepare_queryset(
+                    Lead.objects.filter(
+                        clinic=clinic,
+                        modified_at__lte=now - timedelta(seconds=LEAD_CHANGES_SETTLE_SECONDS),
                     ),
-                )
-                .annotate(
-                    last_interaction_at_db=Greatest(
-                        Coalesce("latest_call_at", "created_at"),
-                        Coalesce("latest_sms_at", "created_at"),
-                        Coalesce("latest_email_at", "created_at"),
-                    )
-                )
-                .order_by("-created_at"),
+                    fields,
+                ),
                 request,
             )
 
-            lead_status = request.query_params.get("lead_status")
-            assigned_to = request.query_params.get("assigned_to")
+            if fields is None or "quality" in fields:
+                queryset = queryset.annotate(quality_db=lead_quality_case(now))
 
-            if lead_status:
-                queryset = queryset.filter(lead_status=lead_status)
-
-            if assigned_to:
-                queryset = queryset.filter(assigned_to_id=assigned_to)
-
-            serializer = LeadReadSerializer(queryset, many=True, context={"request": request})
-            return Response(serializer.data, status=200)
+            paginator = KeysetCursorPagination(
+                ordering=LEAD_CHANGES_ORDERING, page_size=LEAD_CHANGES_PAGE_SIZE
+            )
+            paginator.cursor_query_param = "since"
+            paginator.max_page_size = LEAD_CHANGES_MAX_PAGE_SIZE
+
+            since = request.query_params.get("since")
+            rows = paginator.paginate_queryset(queryset, request, view=self)
+
+            changed = [lead for lead in rows if not lead.is_deleted]
+            deleted = [
+                {"id": lead.id, "deleted_at": lead.modified_at}
+                for lead in rows
+                if lead.is_deleted
+            ]
+
+            return Response({
+                # Nothing new: the caller's token is still the right one
+                "next_token": paginator.encode_cursor(rows[-1]) if rows else since,
+                "has_more": paginator.next_cursor is not None,
+                "leads": LeadReadSerializer(
+                    changed, many=True, fields=fields, context={"request": request}
+                ).data,
+                "deleted": deleted,
+            }, status=200)
 
         except ValidationError as ve:
             return Response({"error": ve.detail}, status=400)
 
         except Exception:
-            logger.error("Lead List Error:\n" + traceback.format_exc())
+            logger.error("Lead Changes Error:\n" + traceback.format_exc())
             return Response({"error": "Internal Server Error"}, status=500)
 
 
@@ -640,6 +1345,10 @@ class LeadGetAPIView(APIView):
 
     @swagger_auto_schema(
         operation_description="Get lead by ID",
+        manual_parameters=[
+            openapi.Parameter("fields", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Comma-separated fields to return"),
+            openapi.Parameter("expand", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Extra fields on top of ?fields="),
+        ],
         responses={200: LeadReadSerializer},
         tags=["Leads"]
     )
@@ -651,9 +1360,11 @@ class LeadGetAPIView(APIView):
         try:
             clinic = get_request_clinic(request)
 
-            lead = get_scoped_lead_or_404(request, clinic, lead_id)
+            fields = LeadReadSerializer.sparse_fields_from_request(request)
 
-            return Response(LeadReadSerializer(lead).data, status=200)
+            lead = get_scoped_lead_or_404(request, clinic, lead_id, fields=fields)
+
+            return Response(LeadReadSerializer(lead, fields=fields).data, status=200)
 
         except ValidationError as ve:
             return Response({"error": ve.detail}, status=400)
@@ -663,6 +1374,82 @@ class LeadGetAPIView(APIView):
             return Response({"error": "Internal Server Error"}, status=500)
 
 
+# -------------------------------------------------------------------
+# Lead Timeline API (GET) — calls, SMS, WhatsApp, emails, notes, stages
+# -------------------------------------------------------------------
+class LeadTimelineAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "A lead's activity across calls, SMS, WhatsApp, emails, notes "
+            "and stage moves, newest first, in one keyset-paginated query. "
+            "Pass the returned next cursor to load older items."
+        ),
+        manual_parameters=[
+            openapi.Parameter("cursor", openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter(
+                "page_size",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description=f"Default {TIMELINE_DEFAULT_PAGE_SIZE}, max {TIMELINE_MAX_PAGE_SIZE}",
+            ),
+        ],
+        tags=["Leads"]
+    )
+    def get(self, request, lead_id):
+
+        if not has_action_permission_for_labels(request.user, "view", LEAD_LABELS):
+            return Response({"error": "No permission"}, status=403)
+
+        try:
+            clinic = get_request_clinic(request)
+
+            # Only the id is needed: skip every serializer relation
+            lead = get_scoped_lead_or_404(request, clinic, lead_id, fields=set())
+
+            page_size = TIMELINE_DEFAULT_PAGE_SIZE
+            raw_page_size = request.query_params.get("page_size")
+
+            if raw_page_size:
+                try:
+                    page_size = max(1, min(int(raw_page_size), TIMELINE_MAX_PAGE_SIZE))
+                except (TypeError, ValueError):
+                    raise ValidationError({"page_size": "Must be an integer"})
+
+            rows, next_cursor = get_lead_timeline(
+                lead,
+                cursor=request.query_params.get("cursor"),
+                page_size=page_size,
+            )
+
+            return Response({
+                "next": next_cursor,
+                "page_size": page_size,
+                "results": [
+                    {
+                        "kind": row["kind"],
+                        "id": row["item_id"],
+                        "occurred_at": row["occurred_at"],
+                        "status": row["item_status"],
+                        "summary": row["summary"],
+                        "detail": row["detail"],
+                    }
+                    for row in rows
+                ],
+            }, status=200)
+
+        except Http404:
+            return Response({"error": "Lead not found"}, status=404)
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=400)
+
+        except Exception:
+            logger.error("Lead Timeline Error:\n" + traceback.format_exc())
+            return Response({"error": "Internal Server Error"}, status=500)
+
+
 # -------------------------------------------------------------------
 # Lead Activate API
 # -------------------------------------------------------------------
@@ -3,6 +3,9 @@
 # =====================================================
 import logging
 import traceback
+from datetime import date, timedelta
+
+from django.utils import timezone
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -29,6 +32,7 @@ from restapi.services.pipeline_service import (
     duplicate_stage,
     set_default_pipeline,
 )
+from restapi.services.stage_analytics_service import get_stage_analytics
 from restapi.utils.clinic_scope import resolve_request_clinic
 
 logger = logging.getLogger(__name__)
@@ -842,4 +846,69 @@ class PipelineStagesListAPIView(APIView):
             return Response(
                 {"error": "Internal Server Error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+# -------------------------------------------------------------------
+# STAGE ANALYTICS (GET) — time in stage + stage-to-stage conversion
+# -------------------------------------------------------------------
+STAGE_ANALYTICS_DEFAULT_DAYS = 30
+
+
+def _parse_date_param(request, name, default):
+    raw = request.query_params.get(name)
+
+    if not raw:
+        return default
+
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise ValidationError({name: "Use YYYY-MM-DD"})
+
+
+class PipelineStageAnalyticsAPIView(APIView):
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Median / p90 time in stage and stage-to-stage conversion for a "
+            "pipeline, read from daily rollups (rollup_stage_transitions)."
+        ),
+        manual_parameters=[
+            openapi.Parameter("from_date", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="YYYY-MM-DD (default: 30 days ago)"),
+            openapi.Parameter("to_date", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="YYYY-MM-DD (default: today)"),
+        ],
+        tags=["Pipelines"],
+    )
+    def get(self, request, pipeline_id):
+        try:
+            pipeline = _get_scoped_pipeline(request, pipeline_id)
+
+            to_date = _parse_date_param(request, "to_date", timezone.localdate())
+            from_date = _parse_date_param(
+                request, "from_date", to_date - timedelta(days=STAGE_ANALYTICS_DEFAULT_DAYS)
+            )
+
+            if from_date > to_date:
+                raise ValidationError({"from_date": "Must be on or before to_date"})
+
+            return Response(
+                get_stage_analytics(pipeline, from_date, to_date),
+                status=status.HTTP_200_OK,
+            )
+
+        except Pipeline.DoesNotExist:
+            return Response(
+                {"error": "Pipeline not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response({"error": ve.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception:
+            logger.error("Stage Analytics Error:\n" + traceback.format_exc())
+            return Response(
+                {"error": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -35,6 +35,10 @@ from restapi.services.twilio_service import (
     browser_call_twiml,
     log_browser_call,
 )
+from restapi.services.lead_service import (
+    find_lead_by_phone,
+    recompute_lead_last_interaction,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -584,21 +588,9 @@ class TwilioInboundCallAPIView(APIView):
                 sid, from_number, to_number, call_status,
             )
 
-            from restapi.models.lead import Lead
-
-            # Strip country code to match stored contact_no (e.g. +919876543210 → 9876543210)
-            clean_number = from_number.strip()
-            if clean_number.startswith("+91"):
-                clean_number = clean_number[3:]
-            elif clean_number.startswith("+"):
-                clean_number = clean_number[1:]
-
-            # Match lead by contact_no
-            lead = (
-                Lead.objects.filter(contact_no=clean_number).first()
-                or Lead.objects.filter(contact_no=from_number).first()
-                or Lead.objects.filter(contact_no__endswith=clean_number[-10:]).first()
-            )
+            # ✅ OPTIMIZATION: indexed exact match on the normalized
+            # E.164 columns instead of an `endswith` scan over every lead
+            lead = find_lead_by_phone(from_number)
 
             from_twilio_number = getattr(settings, "TWILIO_FROM_NUMBER", to_number)
 
@@ -722,6 +714,11 @@ class TwilioLinkInboundCallAPIView(APIView):
             updated_count = unlinked.count()
             unlinked.update(lead=lead)
 
+            # queryset.update() skips post_save, so refresh the denormalized
+            # interaction timestamp explicitly.
+            if updated_count:
+                recompute_lead_last_interaction([lead.id])
+
             logger.info(
                 "TwilioLinkInboundCall: lead=%s from=%s linked=%d",
                 lead_uuid, from_number, updated_count,
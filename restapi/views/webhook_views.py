@@ -26,6 +26,7 @@ from restapi.serializers.mailchimp_serializer import (
 )
 
 from restapi.services.zapier_service import send_to_zapier
+from restapi.services.lead_service import find_duplicate_lead, merge_into_lead
 from restapi.services.mailchimp_service import create_mailchimp_event
 
 logger = logging.getLogger(__name__)
@@ -406,6 +407,44 @@ class GoHighLevelLeadWebhookAPIView(APIView):
                     status=400,
                 )
 
+            # =====================================================
+            # DUPLICATE DETECTION (per-clinic policy)
+            # Answer 200 on reject / merge so GHL does not retry.
+            # =====================================================
+            policy = clinic.lead_dedupe_policy
+            existing, matched_on = None, None
+
+            if policy != Clinic.LeadDedupePolicy.OFF:
+                existing, matched_on = find_duplicate_lead(
+                    clinic, contact_no=phone, email=email, full_name=full_name
+                )
+
+            if existing and policy == Clinic.LeadDedupePolicy.REJECT:
+                logger.info(f"GHL lead rejected as duplicate of {existing.id} ({matched_on})")
+                return Response(
+                    {
+                        "status": "duplicate_rejected",
+                        "lead_id": str(existing.id),
+                        "matched_on": matched_on,
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
+            if existing and policy == Clinic.LeadDedupePolicy.MERGE:
+                merge_into_lead(
+                    existing,
+                    {"email": email, "contact_no": phone, "location": location},
+                    updated_by_name="GoHighLevel",
+                )
+                return Response(
+                    {
+                        "status": "lead_merged",
+                        "lead_id": str(existing.id),
+                        "matched_on": matched_on,
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
             lead = Lead.objects.create(
                 clinic=clinic,
                 department=department,
@@ -416,6 +455,7 @@ class GoHighLevelLeadWebhookAPIView(APIView):
                 source="facebook",
                 location=location,
                 is_active=True,
+                duplicate_of=existing,
             )
 
             send_to_zapier(